@@ -0,0 +1,371 @@
+"""Java legacy Spring rule blocks and adapter profile, imported by rule_generator on first use."""
+from ._rule_profile import RuleProfile, _flagged_rules, _first_flagged_rules, intern_rule_blocks
+
+# Rule blocks appended to the Java legacy Spring template. Each block starts with the blank line that
+# separates it from the previous one; tables are (detected_tech flags, rules) pairs.
+# *_TEMPLATE blocks are %-templates with a single %s, filled in by the adapters
+JAVA_LEGACY_HEADER_TEMPLATE = """
+
+# =============================================================================
+# DETECCIÓN AUTOMÁTICA: Spring Framework %s
+# ============================================================================="""
+JAVA_LEGACY_MAJOR_HEADERS = {major: JAVA_LEGACY_HEADER_TEMPLATE % (f"{major}.x",) for major in (1, 2, 3, 4, 5)}
+
+# (detected_tech flag, label) pairs for the technologies summary; JSP files are appended with their count
+JAVA_LEGACY_FEATURE_LABELS = (
+    ("uses_spring_security", "Spring Security"),
+    ("uses_spring_webmvc", "Spring WebMVC"),
+    ("uses_spring_orm", "Spring ORM"),
+    ("uses_hibernate", "Hibernate ORM"),
+    ("uses_struts", "⚠️ Apache Struts"),
+    ("uses_log4j", "⚠️ Log4j"),
+    ("database_mysql", "MySQL"),
+    ("database_oracle", "Oracle DB"),
+    ("database_sqlserver", "SQL Server"),
+)
+JAVA_LEGACY_FEATURES_TEMPLATE = """
+
+# 📦 TECNOLOGÍAS DETECTADAS: %s
+# Las reglas han sido adaptadas automáticamente para estas tecnologías
+"""
+JAVA_LEGACY_PRIORITY_TEMPLATE = """
+
+# 🛡️ PRIORIDAD DE SEGURIDAD: %s
+"""
+# security_priority -> text of the security priority banner
+JAVA_LEGACY_PRIORITY_TEXT = {
+    "critical": "🔴 CRÍTICA - Requiere acción inmediata de seguridad",
+    "high": "🟠 ALTA - Planificar revisión de seguridad urgente",
+    "medium": "🟡 MEDIA - Aplicar mejores prácticas de seguridad",
+    "low": "🟢 BAJA - Mantener prácticas de seguridad actuales",
+}
+
+# Databases named in the database rules heading
+JAVA_LEGACY_DATABASE_LABELS = (
+    ("database_mysql", "MySQL"),
+    ("database_oracle", "Oracle"),
+    ("database_sqlserver", "SQL Server"),
+)
+
+JAVA_LEGACY_VERY_LEGACY_NOTICE = """
+
+# 🔴 ALERTA CRÍTICA: Versión MUY LEGACY detectada
+# Esta versión tiene vulnerabilidades CRÍTICAS conocidas
+# ACTUALIZACIÓN URGENTE requerida - Alto riesgo de seguridad"""
+
+JAVA_LEGACY_LEGACY_NOTICE = """
+
+# ⚠️ ADVERTENCIA ALTA: Versión LEGACY detectada
+# Esta versión tiene vulnerabilidades conocidas documentadas
+# Se recomienda planificar actualización prioritaria"""
+
+JAVA_LEGACY_OLD_NOTICE = """
+
+# ⚠️ Versión ANTIGUA detectada
+# Considerar actualización por mejoras de seguridad
+# Aplicar parches de seguridad disponibles"""
+
+JAVA_LEGACY_CURRENT_NOTICE = """
+
+# ✅ Versión relativamente moderna de Spring Framework
+# Mantener actualizado con parches de seguridad"""
+
+JAVA_LEGACY_SERVLET_VERY_LEGACY_NOTICE = """
+
+# ⚠️ Servlet API MUY LEGACY - Revisar configuraciones de seguridad web"""
+
+JAVA_LEGACY_SERVLET_LEGACY_NOTICE = """
+
+# ⚠️ Servlet API LEGACY - Verificar configuraciones modernas disponibles"""
+
+JAVA_LEGACY_SPRING_1_RULES = """
+
+# Reglas CRÍTICAS específicas para Spring Framework 1.x
+find:
+  - label: "**/*-servlet.xml"
+    description: "CRÍTICO 1.x: Configuración servlet legacy. Verificar configuraciones de seguridad obsoletas."
+  - label: "web.xml"
+    description: "CRÍTICO 1.x: Descriptor web muy legacy. Verificar filtros de seguridad y configuraciones."
+
+symbols:
+  - label: "SimpleFormController"
+    description: "LEGACY 1.x: Controlador obsoleto. Alto riesgo de vulnerabilidades de validación."
+  - label: "MultiActionController"
+    description: "LEGACY 1.x: Controlador multi-acción. Verificar validación de entrada."
+  - label: "AbstractCommandController"
+    description: "LEGACY 1.x: Controlador de comando abstracto. Verificar binding seguro."
+  - label: "BeanNameViewResolver"
+    description: "LEGACY 1.x: Resolver de vistas. Verificar no exposición de beans sensibles."
+"""
+
+JAVA_LEGACY_SPRING_2_RULES = """
+
+# Reglas específicas para Spring Framework 2.x
+find:
+  - label: "applicationContext.xml"
+    description: "LEGACY 2.x: Configuración XML. Verificar beans de seguridad y datasources."
+
+symbols:
+  - label: "@Controller"
+    description: "LEGACY 2.x: Controlador basado en anotaciones. Verificar validación de entrada."
+  - label: "@RequestMapping"
+    description: "LEGACY 2.x: Mapeo de requests. Verificar métodos HTTP permitidos."
+  - label: "FormBackingObject"
+    description: "LEGACY 2.x: Objeto de respaldo de formulario. Verificar binding seguro."
+  - label: "ModelAndView"
+    description: "LEGACY 2.x: Modelo y vista. Verificar no exposición de datos sensibles."
+"""
+
+JAVA_LEGACY_SPRING_3_RULES = """
+
+# Reglas específicas para Spring Framework 3.x
+symbols:
+  - label: "@RequestMapping"
+    description: "3.x: Mapeo de requests mejorado. Verificar configuración de métodos y paths."
+  - label: "@PathVariable"
+    description: "3.x: Variables de path. Verificar validación de parámetros de URL."
+  - label: "@RequestParam"
+    description: "3.x: Parámetros de request. Verificar validación y sanitización."
+  - label: "@ModelAttribute"
+    description: "3.x: Atributos de modelo. Verificar binding seguro de datos."
+"""
+
+JAVA_LEGACY_SECURITY_RULES = """
+
+# Reglas específicas para Spring Security Legacy
+find:
+  - label: "security-context.xml"
+    description: "SEGURIDAD LEGACY: Configuración XML de Spring Security. Verificar configuraciones obsoletas."
+  - label: "spring-security.xml"
+    description: "SEGURIDAD LEGACY: Archivo principal de seguridad. Verificar autenticación y autorización."
+
+symbols:
+  - label: "<security:http>"
+    description: "SEGURIDAD XML: Configuración HTTP legacy. Verificar CSRF, session management."
+  - label: "<security:authentication-manager>"
+    description: "AUTENTICACIÓN XML: Manager legacy. Verificar configuración de providers."
+  - label: "<security:user-service>"
+    description: "USUARIOS XML: Servicio de usuarios en XML. Buscar credenciales hardcodeadas."
+  - label: "<security:password-encoder>"
+    description: "CIFRADO XML: Codificador de passwords. Verificar algoritmos seguros."
+"""
+
+JAVA_LEGACY_SERVLET_TEMPLATE = """
+
+# 📋 SERVLET API: Versión %s detectada"""
+
+JAVA_LEGACY_STRUTS_RULES_TEMPLATE = """
+
+# Reglas CRÍTICAS para Apache Struts %s
+find:
+  - label: "struts-config.xml"
+    description: "CRÍTICO STRUTS: Configuración Struts. ALTO RIESGO de vulnerabilidades S2-XXX."
+  - label: "struts.xml"
+    description: "CRÍTICO STRUTS: Configuración Struts 2. Verificar versión contra CVEs conocidos."
+
+symbols:
+  - label: "ActionSupport"
+    description: "STRUTS: Clase base de acciones. Verificar validación de entrada."
+  - label: "ActionForm"
+    description: "STRUTS: Formularios de acción. Verificar validación y binding seguro."
+  - label: "ognl:"
+    description: "CRÍTICO STRUTS: Expresiones OGNL. ALTO RIESGO de ejecución de código remoto."
+  - label: "%%{"
+    description: "CRÍTICO STRUTS: Sintaxis OGNL. Puede permitir ejecución de código malicioso."
+"""
+
+JAVA_LEGACY_HIBERNATE_RULES_TEMPLATE = """
+
+# Reglas específicas para Hibernate %s
+find:
+  - label: "hibernate.cfg.xml"
+    description: "HIBERNATE: Configuración principal. Verificar credenciales y configuraciones de conexión."
+  - label: "**/*.hbm.xml"
+    description: "HIBERNATE: Archivos de mapeo. Verificar configuraciones de entidades."
+
+symbols:
+  - label: "createQuery("
+    description: "CRÍTICO HIBERNATE: Queries dinámicas. Verificar contra HQL Injection."
+  - label: "createSQLQuery("
+    description: "CRÍTICO HIBERNATE: Queries SQL nativas. ALTO RIESGO de SQL Injection."
+  - label: "Session.get("
+    description: "HIBERNATE: Obtención de entidades. Verificar autorización de acceso."
+  - label: "SessionFactory"
+    description: "HIBERNATE: Factory de sesiones. Verificar configuración segura."
+"""
+
+JAVA_LEGACY_LOG4J_RULES_TEMPLATE = """
+
+# Reglas CRÍTICAS para Log4j %s (VULNERABILIDAD CONOCIDA)
+find:
+  - label: "log4j.properties"
+    description: "CRÍTICO LOG4J: Configuración Log4j 1.x. VERIFICAR contra vulnerabilidades conocidas."
+  - label: "log4j.xml"
+    description: "CRÍTICO LOG4J: Configuración XML. Riesgo de Log4Shell y otras vulnerabilidades."
+
+symbols:
+  - label: "Logger.getLogger"
+    description: "LOG4J 1.x: Logger legacy. Verificar no logging de datos sensibles."
+  - label: "log.debug"
+    description: "LOGGING: Debug logs. Verificar no exposición de información sensible."
+  - label: "log.info"
+    description: "LOGGING: Info logs. Verificar contenido seguro para logs."
+"""
+
+JAVA_LEGACY_JSP_RULES_TEMPLATE = """
+
+# Reglas específicas para JSP (%s archivos detectados)
+find:
+  - label: "**/*.jsp"
+    description: "CRÍTICO JSP: Páginas JSP. Buscar XSS, expresiones sin escapar y lógica de negocio."
+  - label: "**/*.jspf"
+    description: "CRÍTICO JSP: Fragmentos JSP. Verificar includes seguros y validaciones."
+
+symbols:
+  - label: "<%%="
+    description: "CRÍTICO JSP: Expresiones de salida. ALTO RIESGO de XSS si no se escapa."
+  - label: "<jsp:include"
+    description: "JSP: Inclusión de páginas. Verificar paths seguros y validación."
+  - label: "<jsp:forward"
+    description: "JSP: Forward de páginas. Verificar destinos válidos y autorizados."
+  - label: "request.getParameter"
+    description: "CRÍTICO JSP: Parámetros HTTP. Verificar validación antes de usar."
+  - label: "pageContext.setAttribute"
+    description: "JSP: Atributos de contexto. Verificar no exposición de datos sensibles."
+"""
+
+JAVA_LEGACY_DATABASE_RULES_TEMPLATE = """
+
+# Reglas específicas para bases de datos: %s
+symbols:
+  - label: "DriverManager.getConnection"
+    description: "CRÍTICO DB: Conexión directa. Verificar credenciales no hardcodeadas."
+  - label: "Statement.executeQuery"
+    description: "CRÍTICO DB: Query directo. ALTO RIESGO de SQL Injection."
+  - label: "Statement.execute"
+    description: "CRÍTICO DB: Ejecución SQL. Verificar uso de PreparedStatement."
+  - label: "PreparedStatement.setString"
+    description: "DB: Parámetros preparados. Método seguro para evitar SQL Injection."
+"""
+
+JAVA_LEGACY_MAVEN_RULES = """
+
+# Reglas específicas para Maven
+find:
+  - label: "pom.xml"
+    description: "MAVEN: Configuración del proyecto. Verificar dependencias sin vulnerabilidades."
+  - label: "settings.xml"
+    description: "MAVEN: Configuración de usuario. Verificar no exposición de credenciales."
+"""
+
+JAVA_LEGACY_GRADLE_RULES = """
+
+# Reglas específicas para Gradle  
+find:
+  - label: "build.gradle"
+    description: "GRADLE: Script de construcción. Verificar dependencias y configuraciones seguras."
+  - label: "gradle.properties"
+    description: "GRADLE: Propiedades. Verificar no exposición de credenciales."
+"""
+
+JAVA_LEGACY_CRITICAL_PRIORITY_RULES = """
+
+# Reglas adicionales para PRIORIDAD CRÍTICA
+symbols:
+  - label: "FIXME"
+    description: "CRÍTICO: Código marcado para reparación. Puede indicar vulnerabilidades conocidas."
+  - label: "TODO"
+    description: "PENDIENTE: Trabajo incompleto. Verificar impacto en seguridad."
+  - label: "XXX"
+    description: "ADVERTENCIA: Marcador de problemas. Revisar por posibles vulnerabilidades."
+  - label: "HACK"
+    description: "CRÍTICO: Solución temporal. Alto riesgo de vulnerabilidades."
+"""
+
+# Spring version notice: the first matching entry wins, JAVA_LEGACY_CURRENT_NOTICE otherwise
+JAVA_LEGACY_VERSION_NOTICES = (
+    (("is_very_legacy",), JAVA_LEGACY_VERY_LEGACY_NOTICE),
+    (("is_legacy",), JAVA_LEGACY_LEGACY_NOTICE),
+    (("is_old",), JAVA_LEGACY_OLD_NOTICE),
+)
+# Servlet API notice: only the first matching entry is added
+JAVA_LEGACY_SERVLET_NOTICES = (
+    (("servlet_very_legacy",), JAVA_LEGACY_SERVLET_VERY_LEGACY_NOTICE),
+    (("servlet_legacy",), JAVA_LEGACY_SERVLET_LEGACY_NOTICE),
+)
+# Spring Framework major version -> version-specific rules
+JAVA_LEGACY_VERSION_RULES = {
+    1: JAVA_LEGACY_SPRING_1_RULES,
+    2: JAVA_LEGACY_SPRING_2_RULES,
+    3: JAVA_LEGACY_SPRING_3_RULES,
+}
+JAVA_LEGACY_BUILD_ADAPTATIONS = (
+    (("is_maven",), JAVA_LEGACY_MAVEN_RULES),
+    (("is_gradle",), JAVA_LEGACY_GRADLE_RULES),
+)
+# security_priority -> extra rule block appended after all the others
+JAVA_LEGACY_EXTRA_RULES_BY_PRIORITY = {
+    "critical": JAVA_LEGACY_CRITICAL_PRIORITY_RULES,
+}
+
+intern_rule_blocks(globals())
+
+def _java_legacy_header(tech):
+    """Spring Framework detection banner, followed by the version notice when the full version is known."""
+    spring_version = tech.get("spring_framework_version")
+    major_version = tech.get("spring_major_version")
+    if spring_version:
+        return [
+            JAVA_LEGACY_HEADER_TEMPLATE % (spring_version,),
+            _first_flagged_rules(tech, JAVA_LEGACY_VERSION_NOTICES, JAVA_LEGACY_CURRENT_NOTICE),
+        ]
+    if major_version:
+        header = JAVA_LEGACY_MAJOR_HEADERS.get(major_version)
+        return [header or JAVA_LEGACY_HEADER_TEMPLATE % (f"{major_version}.x",)]
+    return []
+
+def _java_legacy_rules(tech):
+    fragments = []
+    # Servlet version analysis
+    servlet_version = tech.get("servlet_version")
+    if servlet_version:
+        fragments.append(JAVA_LEGACY_SERVLET_TEMPLATE % (servlet_version,))
+        servlet_notice = _first_flagged_rules(tech, JAVA_LEGACY_SERVLET_NOTICES)
+        if servlet_notice:
+            fragments.append(servlet_notice)
+    
+    # Version-specific adaptations
+    version_rules = JAVA_LEGACY_VERSION_RULES.get(tech.get("spring_major_version"))
+    if version_rules:
+        fragments.append(version_rules)
+    
+    # Technology-specific adaptations
+    if tech.get("uses_spring_security"):
+        fragments.append(JAVA_LEGACY_SECURITY_RULES)
+    if tech.get("uses_struts"):
+        fragments.append(JAVA_LEGACY_STRUTS_RULES_TEMPLATE % (tech.get("struts_version", ""),))
+    if tech.get("uses_hibernate"):
+        fragments.append(JAVA_LEGACY_HIBERNATE_RULES_TEMPLATE % (tech.get("hibernate_version", ""),))
+    if tech.get("uses_log4j") and tech.get("log4j_security_risk"):
+        fragments.append(JAVA_LEGACY_LOG4J_RULES_TEMPLATE % (tech.get("log4j_version", ""),))
+    jsp_count = tech.get("jsp_files_count", 0)
+    if jsp_count > 0:
+        fragments.append(JAVA_LEGACY_JSP_RULES_TEMPLATE % (jsp_count,))
+    databases = [label for flag, label in JAVA_LEGACY_DATABASE_LABELS if tech.get(flag)]
+    if databases:
+        fragments.append(JAVA_LEGACY_DATABASE_RULES_TEMPLATE % (', '.join(databases),))
+    
+    # Build system adaptations
+    fragments.extend(_flagged_rules(tech, JAVA_LEGACY_BUILD_ADAPTATIONS))
+    return fragments
+
+PROFILE = RuleProfile(
+    header=_java_legacy_header,
+    rules=_java_legacy_rules,
+    feature_labels=JAVA_LEGACY_FEATURE_LABELS,
+    count_labels=(("jsp_files_count", "JSP files (%s)"),),
+    features_template=JAVA_LEGACY_FEATURES_TEMPLATE,
+    priority_text=JAVA_LEGACY_PRIORITY_TEXT,
+    priority_template=JAVA_LEGACY_PRIORITY_TEMPLATE,
+    extra_rules_by_priority=JAVA_LEGACY_EXTRA_RULES_BY_PRIORITY,
+)
@@ -0,0 +1,355 @@
+"""Python rule blocks and adapter profile, imported by rule_generator on first use."""
+from ._rule_profile import RuleProfile, _flagged_rules, _first_flagged_rules, intern_rule_blocks
+
+# Rule blocks appended to the Python template. Each block starts with the blank line that
+# separates it from the previous one; tables are (detected_tech flags, rules) pairs.
+PYTHON_HEADER = """
+
+# =============================================================================
+# DETECCIÓN AUTOMÁTICA: Proyecto Python
+# ============================================================================="""
+
+PYTHON_PRIORITY_TEMPLATE = """
+
+# 🛡️ PRIORIDAD DE SEGURIDAD: %s"""
+# security_priority -> text of the security priority banner
+PYTHON_PRIORITY_TEXT = {
+    "high": "🔴 ALTA - Configuraciones inseguras detectadas",
+    "medium": "🟡 MEDIA - Revisar dependencias y configuraciones",
+    "low": "🟢 BAJA - Configuración estándar detectada",
+}
+
+# Human-readable python_source values for the version banner
+PYTHON_SOURCE_LABELS = {
+    "venv": "entorno virtual",
+    "pyenv": "archivo .python-version (pyenv)",
+    "pyproject": "pyproject.toml",
+    "pipfile": "Pipfile",
+    "setup.py": "setup.py",
+    "system": "intérprete del sistema"
+}
+# Version banner lines, each starting with the newline that separates it from the previous one
+PYTHON_VERSION_TEMPLATE = "\n# 🐍 PYTHON: Versión %s"
+PYTHON_PATH_TEMPLATE = "\n# 📍 RUTA: %s"
+PYTHON_SOURCE_TEMPLATE = "\n# 🔧 FUENTE: %s"
+PYTHON_VENV_TEMPLATE = "\n# 📁 VENV: %s"
+# Support notes of the version banner, by interpreter version
+PYTHON_2_WARNING = "\n# ⚠️ ADVERTENCIA: Python 2.x está OBSOLETO. Migrar a Python 3.x urgentemente."
+PYTHON_LIMITED_SUPPORT_TEMPLATE = "\n# ⚠️ ADVERTENCIA: Python 3.%s tiene soporte limitado. Considerar actualizar."
+PYTHON_MODERN_VERSION_TEMPLATE = "\n# ✅ Python 3.%s es una versión moderna con mejoras de rendimiento."
+# Put in a framework's rules when its version was not detected
+PYTHON_UNKNOWN_VERSION = "versión no detectada"
+
+PYTHON_FRAMEWORKS_TEMPLATE = """
+
+# 📦 FRAMEWORKS DETECTADOS: %s
+# Las reglas han sido adaptadas automáticamente para estos frameworks"""
+PYTHON_INDICATORS_TEMPLATE = """
+
+# 🔍 INDICADORES ENCONTRADOS: %s"""
+
+# Framework and risky package blocks, %-templates filled in with the detected version or names
+PYTHON_DJANGO_RULES_TEMPLATE = """
+
+# Reglas específicas para Django %s
+find:
+  - label: "settings/**/*.py"
+    description: "CRÍTICO DJANGO: Configuraciones por entorno. Verificar no exposición de secrets."
+  - label: "**/migrations/*.py"
+    description: "DJANGO: Migraciones de BD. Verificar no datos sensibles en migraciones."
+  - label: "**/templatetags/*.py"
+    description: "DJANGO: Template tags. Verificar no exposición de datos sensibles en templates."
+
+symbols:
+  - label: "django.db.models.Model"
+    description: "DJANGO: Modelos de datos. Verificar validaciones y campos sensibles."
+  - label: "django.contrib.admin"
+    description: "CRÍTICO DJANGO: Admin interface. Verificar permisos y campos expuestos."
+  - label: "django.shortcuts.render"
+    description: "DJANGO: Renderizado de templates. Verificar contexto y datos expuestos."
+  - label: "HttpResponse"
+    description: "DJANGO: Respuestas HTTP. Verificar headers de seguridad."
+  - label: "JsonResponse"
+    description: "DJANGO: Respuestas JSON. Verificar no exposición de información sensible."
+"""
+
+PYTHON_DJANGO_DEBUG_RULES = """
+
+# ADVERTENCIA: DEBUG=True detectado
+symbols:
+  - label: "DEBUG = True"
+    description: "CRÍTICO DJANGO: Debug habilitado. NUNCA usar en producción."
+"""
+
+PYTHON_DJANGO_SECRET_KEY_RULES = """
+
+# CRÍTICO: SECRET_KEY hardcodeada detectada
+symbols:
+  - label: "SECRET_KEY = "
+    description: "CRÍTICO DJANGO: Clave secreta hardcodeada. Usar variables de entorno."
+"""
+
+PYTHON_DJANGO_SQLITE_RULES = """
+
+# Base de datos SQLite detectada
+find:
+  - label: "db.sqlite3"
+    description: "DJANGO SQLite: Base de datos SQLite. Verificar no versionado en producción."
+"""
+
+PYTHON_DJANGO_POSTGRESQL_RULES = """
+
+# Base de datos PostgreSQL detectada
+symbols:
+  - label: "psycopg2"
+    description: "DJANGO PostgreSQL: Driver PostgreSQL. Verificar conexiones seguras."
+"""
+
+PYTHON_DJANGO_MYSQL_RULES = """
+
+# Base de datos MySQL detectada
+symbols:
+  - label: "MySQLdb"
+    description: "DJANGO MySQL: Driver MySQL. Verificar conexiones y configuraciones seguras."
+"""
+
+PYTHON_FLASK_RULES_TEMPLATE = """
+
+# Reglas específicas para Flask %s
+symbols:
+  - label: "Flask(__name__)"
+    description: "FLASK: Aplicación Flask. Verificar configuración segura."
+  - label: "@app.route"
+    description: "FLASK: Rutas de aplicación. Verificar autenticación y validación."
+  - label: "request.form"
+    description: "CRÍTICO FLASK: Datos de formulario. Verificar validación y sanitización."
+  - label: "request.args"
+    description: "CRÍTICO FLASK: Parámetros URL. Verificar validación contra inyecciones."
+  - label: "request.json"
+    description: "FLASK: Datos JSON. Verificar validación de estructura y contenido."
+  - label: "session["
+    description: "FLASK: Sesiones. Verificar configuración segura de cookies."
+  - label: "render_template"
+    description: "FLASK: Renderizado templates. Verificar escapado automático habilitado."
+  - label: "make_response"
+    description: "FLASK: Respuestas HTTP. Verificar headers de seguridad."
+"""
+
+PYTHON_FLASK_DEBUG_RULES = """
+
+# ADVERTENCIA: Debug mode detectado en Flask
+symbols:
+  - label: "debug=True"
+    description: "CRÍTICO FLASK: Debug habilitado. NUNCA usar en producción."
+  - label: "app.debug = True"
+    description: "CRÍTICO FLASK: Debug configurado. Verificar que no vaya a producción."
+"""
+
+PYTHON_FASTAPI_RULES_TEMPLATE = """
+
+# Reglas específicas para FastAPI %s
+symbols:
+  - label: "FastAPI()"
+    description: "FASTAPI: Aplicación FastAPI. Verificar configuración de CORS y middleware."
+  - label: "@app.get"
+    description: "FASTAPI: Endpoints GET. Verificar validación de parámetros."
+  - label: "@app.post"
+    description: "CRÍTICO FASTAPI: Endpoints POST. Verificar validación de body y autenticación."
+  - label: "@app.put"
+    description: "FASTAPI: Endpoints PUT. Verificar autorización y validación."
+  - label: "@app.delete"
+    description: "CRÍTICO FASTAPI: Endpoints DELETE. Verificar autorización estricta."
+  - label: "Depends("
+    description: "FASTAPI: Inyección de dependencias. Verificar validación de dependencias."
+  - label: "HTTPException"
+    description: "FASTAPI: Excepciones HTTP. Verificar no exposición de información interna."
+  - label: "Request"
+    description: "FASTAPI: Objeto request. Verificar validación de datos de entrada."
+"""
+
+PYTHON_POETRY_RULES = """
+
+# Proyecto Poetry detectado
+find:
+  - label: "pyproject.toml"
+    description: "POETRY: Configuración Poetry. Verificar dependencias y versiones."
+"""
+
+PYTHON_PIPENV_RULES = """
+
+# Proyecto Pipenv detectado
+find:
+  - label: "Pipfile"
+    description: "PIPENV: Configuración Pipenv. Verificar dependencias y configuraciones."
+  - label: "Pipfile.lock"
+    description: "PIPENV: Lock file. Verificar integridad de dependencias."
+"""
+
+PYTHON_RISKY_PACKAGES_RULES_TEMPLATE = """
+
+# ADVERTENCIA: Paquetes de riesgo detectados
+# Paquetes problemáticos: %s
+symbols:
+  - label: "import pickle"
+    description: "CRÍTICO: Paquete pickle detectado. Verificar uso seguro."
+  - label: "import md5"
+    description: "VULNERABLE: MD5 detectado. Usar algoritmos más seguros."
+"""
+
+PYTHON_WSGI_RULES = """
+
+# Configuración WSGI detectada
+find:
+  - label: "wsgi.py"
+    description: "WSGI: Configuración servidor WSGI. Verificar configuración de producción."
+"""
+
+PYTHON_ASGI_RULES = """
+
+# Configuración ASGI detectada
+find:
+  - label: "asgi.py"
+    description: "ASGI: Configuración servidor ASGI. Verificar configuración async segura."
+"""
+
+PYTHON_PYTEST_RULES = """
+
+# Framework de testing Pytest detectado
+find:
+  - label: "pytest.ini"
+    description: "TESTING: Configuración pytest. Verificar no exposición de credenciales de test."
+  - label: "conftest.py"
+    description: "TESTING: Configuración fixtures. Verificar fixtures seguros."
+"""
+
+PYTHON_TOX_RULES = """
+
+# Tox detectado para testing
+find:
+  - label: "tox.ini"
+    description: "TESTING: Configuración tox. Verificar comandos de test seguros."
+"""
+
+PYTHON_DOCKER_RULES = """
+
+# Docker detectado
+find:
+  - label: "Dockerfile"
+    description: "DOCKER: Configuración Docker. Verificar usuario no-root y secrets seguros."
+  - label: "docker-compose.yml"
+    description: "DOCKER: Orquestación. Verificar configuración de redes y volúmenes."
+"""
+
+PYTHON_DJANGO_ADAPTATIONS = (
+    (("debug_enabled",), PYTHON_DJANGO_DEBUG_RULES),
+    (("hardcoded_secret_key",), PYTHON_DJANGO_SECRET_KEY_RULES),
+)
+# Django database: only the first matching entry is added
+PYTHON_DJANGO_DATABASE_ADAPTATIONS = (
+    (("database_sqlite",), PYTHON_DJANGO_SQLITE_RULES),
+    (("database_postgresql",), PYTHON_DJANGO_POSTGRESQL_RULES),
+    (("database_mysql",), PYTHON_DJANGO_MYSQL_RULES),
+)
+PYTHON_FLASK_ADAPTATIONS = (
+    (("debug_enabled",), PYTHON_FLASK_DEBUG_RULES),
+)
+# Web frameworks: (flag, rules template, version key, adaptations, first-match adaptations).
+# A detected framework adds its template filled with the version, then its adaptations.
+PYTHON_FRAMEWORK_ADAPTATIONS = (
+    ("is_django", PYTHON_DJANGO_RULES_TEMPLATE, "django_version",
+     PYTHON_DJANGO_ADAPTATIONS, PYTHON_DJANGO_DATABASE_ADAPTATIONS),
+    ("is_flask", PYTHON_FLASK_RULES_TEMPLATE, "flask_version", PYTHON_FLASK_ADAPTATIONS, ()),
+    ("is_fastapi", PYTHON_FASTAPI_RULES_TEMPLATE, "fastapi_version", (), ()),
+)
+PYTHON_PACKAGING_ADAPTATIONS = (
+    (("is_poetry",), PYTHON_POETRY_RULES),
+    (("is_pipenv",), PYTHON_PIPENV_RULES),
+)
+# Server, testing and container tooling
+PYTHON_TOOLING_ADAPTATIONS = (
+    (("has_wsgi",), PYTHON_WSGI_RULES),
+    (("has_asgi",), PYTHON_ASGI_RULES),
+    (("has_pytest",), PYTHON_PYTEST_RULES),
+    (("has_tox",), PYTHON_TOX_RULES),
+    (("has_docker",), PYTHON_DOCKER_RULES),
+)
+
+intern_rule_blocks(globals())
+
+def _python_header(tech):
+    """Python detection banner: interpreter version and origin, frameworks and indicator files."""
+    get = tech.get
+    frameworks = get("frameworks_detected", [])
+    indicators = get("python_indicators", [])
+    python_version = get("python_version")
+    if not (frameworks or indicators or python_version):
+        return []
+    fragments = [PYTHON_HEADER]
+    
+    # Añadir información de versión de Python
+    if python_version:
+        python_path = get("python_path")
+        python_major = get("python_major_version", "")
+        python_minor = get("python_minor_version", "")
+        
+        # Banner lines go straight into fragments: the adapter's final join is the only one
+        fragments.append(PYTHON_VERSION_TEMPLATE % (python_version,))
+        if python_path:
+            fragments.append(PYTHON_PATH_TEMPLATE % (python_path,))
+        
+        # Indicar fuente de detección
+        python_source = get("python_source")
+        source_label = PYTHON_SOURCE_LABELS.get(python_source, python_source)
+        fragments.append(PYTHON_SOURCE_TEMPLATE % (source_label,))
+        
+        venv_path = get("venv_path")
+        if get("is_venv", False) and venv_path:
+            fragments.append(PYTHON_VENV_TEMPLATE % (venv_path,))
+        
+        # Advertencias según versión
+        if python_major == 2:
+            fragments.append(PYTHON_2_WARNING)
+        elif python_major == 3 and python_minor and python_minor < 8:
+            fragments.append(PYTHON_LIMITED_SUPPORT_TEMPLATE % (python_minor,))
+        elif python_major == 3 and python_minor and python_minor >= 11:
+            fragments.append(PYTHON_MODERN_VERSION_TEMPLATE % (python_minor,))
+    
+    if frameworks:
+        fragments.append(PYTHON_FRAMEWORKS_TEMPLATE % (', '.join(frameworks),))
+    
+    if indicators:
+        fragments.append(PYTHON_INDICATORS_TEMPLATE % (', '.join(indicators),))
+    return fragments
+
+def _python_rules(tech):
+    get = tech.get
+    fragments = []
+    # Django, Flask and FastAPI adaptations
+    for flag, rules_template, version_key, adaptations, first_match_adaptations in PYTHON_FRAMEWORK_ADAPTATIONS:
+        if not get(flag):
+            continue
+        fragments.append(rules_template % (get(version_key, PYTHON_UNKNOWN_VERSION),))
+        fragments.extend(_flagged_rules(tech, adaptations))
+        first_match_rules = _first_flagged_rules(tech, first_match_adaptations)
+        if first_match_rules:
+            fragments.append(first_match_rules)
+    
+    # Package management adaptations
+    fragments.extend(_flagged_rules(tech, PYTHON_PACKAGING_ADAPTATIONS))
+    
+    # Requirements analysis
+    if get("requirements", []):
+        risky_packages = get("risky_packages", [])
+        if risky_packages:
+            fragments.append(PYTHON_RISKY_PACKAGES_RULES_TEMPLATE % (', '.join(risky_packages),))
+    
+    # WSGI/ASGI, testing framework and Docker adaptations
+    fragments.extend(_flagged_rules(tech, PYTHON_TOOLING_ADAPTATIONS))
+    return fragments
+
+PROFILE = RuleProfile(
+    header=_python_header,
+    rules=_python_rules,
+    priority_text=PYTHON_PRIORITY_TEXT,
+    priority_template=PYTHON_PRIORITY_TEMPLATE,
+)
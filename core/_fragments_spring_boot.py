@@ -0,0 +1,263 @@
+"""Spring Boot rule blocks and adapter profile, imported by rule_generator on first use."""
+from ._rule_profile import RuleProfile, _flagged_rules, _first_flagged_rules, intern_rule_blocks
+
+# Rule blocks appended to the Spring Boot template. Each block starts with the blank line that
+# separates it from the previous one; tables are (detected_tech flags, rules) pairs.
+# Detection banner, filled with the full version ("2.7.0") or the major series ("2.x")
+SPRING_BOOT_HEADER_TEMPLATE = """
+
+# =============================================================================
+# DETECCIÓN AUTOMÁTICA: Spring Boot %s
+# ============================================================================="""
+# Banners for the usual major series, formatted once at import time
+SPRING_BOOT_MAJOR_HEADERS = {major: SPRING_BOOT_HEADER_TEMPLATE % (f"{major}.x",) for major in (1, 2, 3)}
+
+# (detected_tech flag, label) pairs listed, in order, in the detected features summary
+SPRING_BOOT_FEATURE_LABELS = (
+    ("uses_spring_security", "Spring Security"),
+    ("uses_spring_data_jpa", "Spring Data JPA"),
+    ("uses_actuator", "Spring Boot Actuator"),
+    ("uses_webflux", "Spring WebFlux"),
+    ("uses_spring_cloud", "Spring Cloud"),
+    ("database_h2", "H2 Database"),
+    ("database_mysql", "MySQL"),
+    ("database_postgresql", "PostgreSQL"),
+)
+SPRING_BOOT_FEATURES_TEMPLATE = """
+
+# 📦 CARACTERÍSTICAS DETECTADAS: %s
+# Las reglas han sido adaptadas automáticamente para estas tecnologías
+"""
+
+SPRING_BOOT_PRIORITY_TEMPLATE = """
+
+# 🛡️  PRIORIDAD DE SEGURIDAD: %s
+"""
+# security_priority -> text of the security priority banner
+SPRING_BOOT_PRIORITY_TEXT = {
+    "high": "🔴 ALTA - Requiere revisión inmediata de seguridad",
+    "medium": "🟡 MEDIA - Aplicar mejores prácticas de seguridad",
+    "low": "🟢 BAJA - Versión moderna con buenas prácticas por defecto",
+}
+
+SPRING_BOOT_1_NOTICE = """
+
+# ⚠️  ADVERTENCIA: Versión LEGACY detectada
+# Esta versión tiene vulnerabilidades conocidas y soporte limitado
+# Se recomienda encarecidamente actualizar a una versión moderna"""
+
+SPRING_BOOT_2_NOTICE = """
+
+# ✅ Versión ESTABLE detectada
+# Spring Boot 2.x es una versión madura con soporte de seguridad activo"""
+
+SPRING_BOOT_3_NOTICE = """
+
+# 🚀 Versión MODERNA detectada  
+# Spring Boot 3.x incluye las últimas características de seguridad
+# Requiere Java 17+ y Spring Framework 6+"""
+
+SPRING_BOOT_LEGACY_RULES = """
+
+# Reglas CRÍTICAS para Spring Boot 1.x (LEGACY)
+find:
+  - label: "application.properties"
+    description: "CRÍTICO LEGACY: Buscar configuraciones obsoletas de seguridad y credenciales hardcodeadas."
+  - label: "SecurityConfiguration.java"
+    description: "CRÍTICO LEGACY: Configuración de seguridad legacy. Verificar configuraciones obsoletas."
+
+symbols:
+  - label: "HttpSecurity"
+    description: "CRÍTICO LEGACY: Configuración HTTP Security v4. Verificar configuraciones obsoletas."
+  - label: "@EnableGlobalMethodSecurity"
+    description: "LEGACY: Anotación obsoleta en Spring Boot 1.x. Migrar a configuración moderna."
+  - label: "WebSecurityConfigurerAdapter"
+    description: "CRÍTICO LEGACY: Adapter obsoleto. Alto riesgo de configuraciones inseguras."
+  - label: "authorizeRequests()"
+    description: "LEGACY: Método obsoleto para autorización. Verificar configuración segura."
+"""
+
+SPRING_BOOT_MODERN_RULES = """
+
+# Reglas para Spring Boot 2.x (MODERNO)
+symbols:
+  - label: "@EnableWebSecurity"
+    description: "SEGURIDAD: Configuración moderna de Spring Security 5+. Verificar configuración completa."
+  - label: "SecurityFilterChain"
+    description: "MODERNO: Bean de cadena de filtros de seguridad. Verificar configuración apropiada."
+  - label: "authorizeHttpRequests()"
+    description: "MODERNO: Método moderno para autorización HTTP. Verificar reglas de acceso."
+"""
+
+SPRING_BOOT_LATEST_RULES = """
+
+# Reglas para Spring Boot 3.x (ÚLTIMO)
+find:
+  - label: "SecurityConfig.java"
+    description: "MODERNO: Configuración de seguridad Spring Boot 3+. Verificar uso de nuevas características."
+
+symbols:
+  - label: "requestMatchers()"
+    description: "MODERNO: Nuevo método para matching de requests en Spring Security 6+."
+  - label: "@EnableMethodSecurity"
+    description: "MODERNO: Nueva anotación para seguridad de métodos en Spring Boot 3+."
+  - label: "Observation"
+    description: "NUEVO: API de observabilidad de Spring Boot 3+. Verificar no exposición de datos sensibles."
+"""
+
+SPRING_BOOT_SECURITY_RULES = """
+
+# Reglas específicas para Spring Security
+find:
+  - label: "UserDetailsService.java"
+    description: "SEGURIDAD: Servicio de detalles de usuario. Verificar implementación segura."
+  - label: "PasswordEncoder.java"
+    description: "CRÍTICO: Codificador de passwords. Verificar uso de algoritmos seguros (BCrypt)."
+
+symbols:
+  - label: "@PreAuthorize"
+    description: "AUTORIZACIÓN: Control de acceso granular. Verificar expresiones SpEL seguras."
+  - label: "BCryptPasswordEncoder"
+    description: "SEGURIDAD: Codificador seguro de passwords. Verificar configuración apropiada."
+  - label: "NoOpPasswordEncoder"
+    description: "CRÍTICO: Codificador SIN CIFRADO. NUNCA usar en producción."
+"""
+
+SPRING_BOOT_ACTUATOR_RULES = """
+
+# Reglas CRÍTICAS para Spring Boot Actuator
+find:
+  - label: "application.properties"
+    description: "CRÍTICO ACTUATOR: Verificar que endpoints estén protegidos en producción."
+
+symbols:
+  - label: "management.endpoints.web.exposure.include"
+    description: "CRÍTICO: Endpoints expuestos. Verificar que no sean '*' en producción."
+  - label: "/actuator/health"
+    description: "ENDPOINT: Health check. Verificar que no exponga información sensible."
+  - label: "/actuator/env"
+    description: "CRÍTICO: Endpoint de environment. ALTO RIESGO de exposición de secrets."
+  - label: "/actuator/configprops"
+    description: "CRÍTICO: Properties de configuración. Puede exponer credenciales."
+"""
+
+SPRING_BOOT_DATA_JPA_RULES = """
+
+# Reglas específicas para Spring Data JPA
+symbols:
+  - label: "@Query"
+    description: "CRÍTICO: Queries personalizadas. Verificar contra SQL Injection en queries nativas."
+  - label: "nativeQuery = true"
+    description: "CRÍTICO: Query nativa SQL. ALTO RIESGO de SQL Injection si no usa parámetros."
+  - label: "EntityManager.createQuery"
+    description: "CRÍTICO: Query dinámico. Verificar uso de parámetros preparados."
+"""
+
+SPRING_BOOT_H2_CONSOLE_RULES = """
+
+# Reglas CRÍTICAS para H2 Database
+find:
+  - label: "application.properties"
+    description: "CRÍTICO H2: Verificar que h2.console.enabled=false en producción."
+
+symbols:
+  - label: "spring.h2.console.enabled"
+    description: "CRÍTICO: Consola H2. NUNCA habilitar en producción (acceso directo a BD)."
+  - label: "/h2-console"
+    description: "CRÍTICO: Endpoint de consola H2. Verificar que esté deshabilitado en producción."
+"""
+
+SPRING_BOOT_WEBFLUX_RULES = """
+
+# Reglas específicas para Spring WebFlux (Reactive)
+symbols:
+  - label: "ServerRequest"
+    description: "REACTIVE: Request reactivo. Verificar validación de datos de entrada."
+  - label: "ServerResponse"
+    description: "REACTIVE: Response reactivo. Verificar headers de seguridad."
+  - label: "@EnableWebFluxSecurity"
+    description: "SEGURIDAD: Configuración de seguridad reactiva. Verificar configuración completa."
+"""
+
+SPRING_BOOT_CLOUD_RULES = """
+
+# Reglas específicas para Spring Cloud
+find:
+  - label: "bootstrap.yml"
+    description: "CONFIGURACIÓN CLOUD: Configuración de bootstrap. Verificar secrets y endpoints seguros."
+
+symbols:
+  - label: "@EnableConfigServer"
+    description: "CONFIG SERVER: Servidor de configuración. Verificar autenticación y cifrado."
+  - label: "spring.cloud.config.uri"
+    description: "CONFIGURACIÓN: URI del config server. Verificar conexión segura (HTTPS)."
+"""
+
+SPRING_BOOT_HIGH_PRIORITY_RULES = """
+
+# Reglas adicionales para ALTA PRIORIDAD de seguridad
+symbols:
+  - label: "LEGACY_CONFIG"
+    description: "CRÍTICO: Configuraciones legacy que pueden tener vulnerabilidades conocidas."
+  - label: "deprecated"
+    description: "OBSOLETO: Código marcado como deprecated. Verificar actualización urgente."
+"""
+
+# Version-specific security rules: only the first matching entry is added
+SPRING_BOOT_VERSION_ADAPTATIONS = (
+    (("is_legacy",), SPRING_BOOT_LEGACY_RULES),
+    (("is_modern",), SPRING_BOOT_MODERN_RULES),
+    (("is_latest",), SPRING_BOOT_LATEST_RULES),
+)
+SPRING_BOOT_FEATURE_ADAPTATIONS = (
+    (("uses_spring_security",), SPRING_BOOT_SECURITY_RULES),
+    (("uses_actuator",), SPRING_BOOT_ACTUATOR_RULES),
+    (("uses_spring_data_jpa",), SPRING_BOOT_DATA_JPA_RULES),
+    (("database_h2", "h2_console_risk"), SPRING_BOOT_H2_CONSOLE_RULES),
+    (("uses_webflux",), SPRING_BOOT_WEBFLUX_RULES),
+    (("uses_spring_cloud",), SPRING_BOOT_CLOUD_RULES),
+)
+# security_priority -> extra rule block appended after all the others
+SPRING_BOOT_EXTRA_RULES_BY_PRIORITY = {
+    "high": SPRING_BOOT_HIGH_PRIORITY_RULES,
+}
+
+intern_rule_blocks(globals())
+
+def _spring_boot_header(tech):
+    """Spring Boot detection banner, followed by the support notice when the full version is known."""
+    major_version = tech.get("spring_boot_major_version")
+    full_version = tech.get("spring_boot_version")
+    if full_version:
+        fragments = [SPRING_BOOT_HEADER_TEMPLATE % (full_version,)]
+        if major_version == 1:
+            fragments.append(SPRING_BOOT_1_NOTICE)
+        elif major_version == 2:
+            fragments.append(SPRING_BOOT_2_NOTICE)
+        elif major_version >= 3:
+            fragments.append(SPRING_BOOT_3_NOTICE)
+        return fragments
+    if major_version:
+        header = SPRING_BOOT_MAJOR_HEADERS.get(major_version)
+        return [header or SPRING_BOOT_HEADER_TEMPLATE % (f"{major_version}.x",)]
+    return []
+
+def _spring_boot_rules(tech):
+    fragments = []
+    if tech.get("spring_boot_major_version"):
+        # Version-specific security adaptations
+        version_rules = _first_flagged_rules(tech, SPRING_BOOT_VERSION_ADAPTATIONS)
+        if version_rules:
+            fragments.append(version_rules)
+    fragments.extend(_flagged_rules(tech, SPRING_BOOT_FEATURE_ADAPTATIONS))
+    return fragments
+
+PROFILE = RuleProfile(
+    header=_spring_boot_header,
+    rules=_spring_boot_rules,
+    feature_labels=SPRING_BOOT_FEATURE_LABELS,
+    features_template=SPRING_BOOT_FEATURES_TEMPLATE,
+    priority_text=SPRING_BOOT_PRIORITY_TEXT,
+    priority_template=SPRING_BOOT_PRIORITY_TEMPLATE,
+    extra_rules_by_priority=SPRING_BOOT_EXTRA_RULES_BY_PRIORITY,
+)
@@ -0,0 +1,50 @@
+"""RuleProfile and the helpers the adapter fragment modules share."""
+import sys
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+# Every adapter appends, in order: the header fragments, the detected features summary,
+# the security priority banner, the project type's rule blocks and, last, the extra rules
+# for its security priority. A RuleProfile holds what differs between project types.
+
+@dataclass(frozen=True)
+class RuleProfile:
+    """What an adapter appends for one project type (see RuleSet._apply_profile).
+
+    header and rules take detected_tech and return rule fragments. feature_labels are
+    (flag, label) pairs and count_labels (key, %-template) pairs for counts above zero,
+    listed in features_template. priority_text maps security_priority to the text put in
+    priority_template, and extra_rules_by_priority to the rule block appended last.
+    """
+    header: Callable
+    rules: Callable
+    feature_labels: tuple = ()
+    count_labels: tuple = ()
+    features_template: Optional[str] = None
+    priority_text: Optional[dict] = None
+    priority_template: Optional[str] = None
+    extra_rules_by_priority: Optional[dict] = None
+
+def _flagged_rules(tech, table):
+    """Returns the rule blocks of an adaptation table whose detected_tech flags are all set."""
+    get = tech.get
+    return [rules for flags, rules in table if all(get(flag) for flag in flags)]
+
+def _first_flagged_rules(tech, table, default=None):
+    """Returns the rule block of the first table entry whose flags are all set, else default."""
+    get = tech.get
+    for flags, rules in table:
+        if all(get(flag) for flag in flags):
+            return rules
+    return default
+
+def intern_rule_blocks(namespace):
+    """Interns the rule block strings of a fragment module's globals() in place.
+
+    Registers them in the interpreter's string table, so equal text loaded elsewhere
+    (e.g. a custom rules file) resolves to this single copy. sys.intern hands back the
+    very object the module's tables already hold, so they need no rebuilding.
+    """
+    for name, value in list(namespace.items()):
+        if name.endswith(("_RULES", "_NOTICE", "_TEMPLATE", "_HEADER")) and isinstance(value, str):
+            namespace[name] = sys.intern(value)
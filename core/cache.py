@@ -0,0 +1,88 @@
+import hashlib
+import os
+import pickle
+
+# Bump when the pickled value layout changes so stale entries are ignored
+CACHE_FORMAT_VERSION = 2
+
+# Analyzer sources whose content is part of every key: an upgrade that changes the detection logic
+# starts from fresh entries instead of serving the previous version's verdicts
+STAMPED_SOURCES = ("project_analyzer.py", "utils.py", "cache.py")
+
+def _code_stamp():
+    """Digest of the STAMPED_SOURCES next to this module (a missing file counts as empty)."""
+    digest = hashlib.blake2b(digest_size=8)
+    for name in STAMPED_SOURCES:
+        digest.update(name.encode("utf-8"))
+        try:
+            with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+CODE_STAMP = _code_stamp()
+
+# Entries kept on disk; when a new project pushes the count past it, the least recently
+# written entries are removed
+MAX_ENTRIES = 128
+
+def cache_dir():
+    """Returns the directory holding persisted analysis results ($XDG_CACHE_HOME or ~/.cache)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "mcp-ruleforge")
+
+def make_key(project_path):
+    """Builds the cache key of a project from its absolute path and the analyzer code: one entry per project."""
+    raw = f"{CACHE_FORMAT_VERSION}|{CODE_STAMP}|{os.path.abspath(project_path)}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=20).hexdigest()
+
+def _entry_path(key):
+    return os.path.join(cache_dir(), f"{key}.pkl")
+
+def load(key, fingerprint):
+    """Returns the value saved under key with this fingerprint, or None if there is none or it cannot be read."""
+    try:
+        with open(_entry_path(key), "rb") as f:
+            saved_fingerprint, value = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError,
+            TypeError, ValueError):
+        return None
+    return value if saved_fingerprint == fingerprint else None
+
+def save(key, fingerprint, value):
+    """Persists value under key, replacing the previous entry. Returns False when the cache directory is not writable."""
+    path = _entry_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        is_new = not os.path.exists(path)
+        with open(tmp_path, "wb") as f:
+            pickle.dump((fingerprint, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Atomic rename: concurrent servers never see a half-written entry
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    if is_new:
+        _prune(MAX_ENTRIES)
+    return True
+
+def _prune(max_entries):
+    """Removes the least recently written entries beyond max_entries, including those of older formats."""
+    try:
+        with os.scandir(cache_dir()) as it:
+            entries = [(entry.stat().st_mtime_ns, entry.path) for entry in it if entry.name.endswith(".pkl")]
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,17 +1,475 @@
 import os
 import sys
+import mmap
+import functools
+import contextlib
+import contextvars
 import subprocess
-import xml.etree.ElementTree as ET # For pom.xml parsing
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import re # For version parsing
 import json # For Python package detection
 from .utils import load_json_file # For package.json, angular.json etc.
+from . import cache # Persistent analysis results across processes
+
+# XML parsing (pom.xml, web.xml): prefer lxml's parser when installed, otherwise the
+# stdlib ElementTree (C-accelerated in CPython). Both expose the same iterparse API; tags are
+# compared by local name, so no namespace map or prefixed find() paths are needed.
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+# TOML parsing (pyproject.toml, Pipfile): stdlib tomllib on 3.11+, the tomli backport on older
+# interpreters. Without either, the regex scans further down are used instead.
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Version patterns, compiled once at import time
+_RE_MAJOR_MINOR = re.compile(r'(\d+)\.(\d+)')
+_RE_MAJOR = re.compile(r'(\d+)')
+# build.gradle: Spring Boot plugin/group reference, or a "springframework': 'X.Y.Z'" version
+# (bytes pattern: it runs directly over the memory-mapped file)
+_RE_GRADLE = re.compile(
+    rb'(?P<boot>org\.springframework\.boot|spring-boot-gradle-plugin)'
+    rb'|springframework[\'"]:\s*[\'"](?P<version>[0-9.]+)'
+)
+# Ejecutado en el intérprete detectado: versión y ruta real del ejecutable, una por línea
+_INTERPRETER_QUERY = "import sys; print(sys.version.split()[0]); print(sys.executable)"
+# Versión "X.Y" o "X.Y.Z": los grupos dan major, minor y patch (None si falta) sin volver a partir la cadena
+_RE_SEMVER = re.compile(r'(\d+)\.(\d+)(?:\.(\d+))?')
+_RE_PYVENV_VERSION = re.compile(r'^\s*version(?:_info)?\s*=\s*(\d+\.\d+(?:\.\d+)?)', re.MULTILINE)
+# Python version sources read by detect_python_version
+_RE_REQUIRES_PYTHON = re.compile(r'requires-python\s*=\s*["\']([^"\']+)["\']')
+_RE_POETRY_PYTHON = re.compile(r'\[tool\.poetry\.dependencies\][^\[]*python\s*=\s*["\']([^"\']+)["\']', re.DOTALL)
+# pyproject.toml Python specifiers, in fallback order (PEP 621 first, then Poetry)
+_PYPROJECT_PYTHON_PATTERNS = (_RE_REQUIRES_PYTHON, _RE_POETRY_PYTHON)
+_RE_PIPFILE_PYTHON = re.compile(r'\[requires\][^\[]*python_version\s*=\s*["\']([^"\']+)["\']', re.DOTALL)
+_RE_SETUP_PY_REQUIRES = re.compile(r'python_requires\s*=\s*["\']([^"\']+)["\']')
+# check_python: settings.py, requirements.txt and pyproject.toml scans
+# Django settings.py markers, found in a single pass over the raw bytes (the group name is the marker kind)
+_RE_DJANGO_SETTINGS = re.compile(
+    rb"(?P<debug>DEBUG = True)"
+    rb"|(?P<secret_key>SECRET_KEY\s*=\s*['\"][\w\-]+['\"])"
+    rb"|(?P<sqlite>sqlite3)"
+    rb"|(?P<postgresql>postgresql|psycopg)"
+    rb"|(?P<mysql>mysql)"
+)
+# Flask app.py markers (bytes): the flask import and debug mode
+_RE_FLASK_APP = re.compile(rb"(?P<flask>from flask import|import flask)|(?P<debug>debug=True|app\.debug = True)")
+# requirements.txt line (lowercased): pinned framework (group 1) and version (group 2, may be empty)
+_RE_FRAMEWORK_PIN = re.compile(r'(django|flask|fastapi)==([0-9.]*)')
+_RE_RISKY_PACKAGE = re.compile(r'pycrypto|md5|pickle')
+_RE_POETRY_DJANGO = re.compile(r'django\s*=\s*"([^"]+)"', re.IGNORECASE)
+
+def _iterparse_xml(xml_path, events):
+    """Streams (event, element) pairs from an XML file, hardening lxml against entity expansion."""
+    if HAS_LXML:
+        return ET.iterparse(xml_path, events=events, resolve_entities=False, no_network=True)
+    return ET.iterparse(xml_path, events=events)
+
+def _local_name(tag):
+    """Strips the '{namespace}' prefix from an element tag."""
+    return tag.rpartition('}')[2]
+
+def _xml_root_attributes(xml_path):
+    """Returns the document element's attributes without parsing past its start tag."""
+    for _, elem in _iterparse_xml(xml_path, ("start",)):
+        return dict(elem.attrib)
+    return {}
+
+# Top-level pom.xml sections read by _parse_pom_cached; everything else is discarded while parsing
+POM_COLLECTED_SECTIONS = frozenset({"parent", "properties", "dependencies"})
+# Set by analyze_project(use_cache=False): the memoized parses and detector results are not read
+# (fresh results still replace them). A context variable, so other threads' analyses are unaffected
+_BYPASS_CACHES = contextvars.ContextVar("bypass_analysis_caches", default=False)
+
+# Parsed build files: path -> (mtime, summary); at most FILE_PARSE_CACHE_SIZE entries per cache
+FILE_PARSE_CACHE_SIZE = 256
+_POM_CACHE = {}
+_GRADLE_CACHE = {}
+_JSON_CACHE = {}
+_TEXT_CACHE = {}
+
+def _bounded_store(cache, key, value, max_entries):
+    """Stores value under key, first evicting the oldest entry (dicts keep insertion order) if cache is full."""
+    if len(cache) >= max_entries and key not in cache:
+        # pop: the checkers run in worker threads and another one may have evicted it already
+        cache.pop(next(iter(cache)), None)
+    cache[key] = value
+
+def _cached_file_parse(cache, file_path, parse):
+    """Returns parse(file_path), memoized in cache on the file's modification time."""
+    mtime = os.path.getmtime(file_path)
+    cached = cache.get(file_path)
+    if cached and cached[0] == mtime and not _BYPASS_CACHES.get():
+        return cached[1]
+    result = parse(file_path)
+    _bounded_store(cache, file_path, (mtime, result), FILE_PARSE_CACHE_SIZE)
+    return result
+
+def _read_text(text_path):
+    """Reads a config file as UTF-8 text."""
+    with open(text_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _read_text_cached(text_path):
+    """Memoized _read_text, shared by every Python check that reads the same file."""
+    return _cached_file_parse(_TEXT_CACHE, text_path, _read_text)
+
+def _parse_pom_cached(pom_path):
+    """Memoized _parse_pom: the POM is only re-read when its mtime changes."""
+    return _cached_file_parse(_POM_CACHE, pom_path, _parse_pom)
+
+def _parse_gradle_cached(gradle_path):
+    """Memoized _parse_gradle: build.gradle is only re-read when its mtime changes."""
+    return _cached_file_parse(_GRADLE_CACHE, gradle_path, _parse_gradle)
+
+def _load_json_cached(json_path):
+    """Memoized load_json_file, so check_angular and check_vue share one parse of package.json.
+
+    Returns None if the file is missing or invalid. Callers must not mutate the result.
+    """
+    try:
+        return _cached_file_parse(_JSON_CACHE, json_path, load_json_file)
+    except OSError:
+        return None
+
+# Below this size a plain read() is cheaper than setting up a mapping
+MMAP_MIN_SIZE = 4096
+
+@contextlib.contextmanager
+def _mapped_file(file_path):
+    """Memory-maps file_path read-only, so byte searches and bytes regexes scan it without a copy.
+
+    Files smaller than MMAP_MIN_SIZE (including empty ones, which cannot be mapped)
+    are read into a bytes object instead. Either way nothing is decoded.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+def _parse_gradle(gradle_path):
+    """Scans build.gradle once for both Java detectors.
+
+    Returns {"spring_boot": bool, "spring_framework_version": str or None}, where
+    spring_boot tells whether the Spring Boot plugin/group is referenced and the
+    version is the first "springframework': 'X.Y.Z'" declaration found.
+    """
+    result = {"spring_boot": False, "spring_framework_version": None}
+    with _mapped_file(gradle_path) as content:
+        for match in _RE_GRADLE.finditer(content):
+            if match.group("boot"):
+                result["spring_boot"] = True
+            elif result["spring_framework_version"] is None:
+                result["spring_framework_version"] = match.group("version").decode("ascii")
+            if result["spring_boot"] and result["spring_framework_version"]:
+                break
+    return result
+
+def _parse_pom(pom_path):
+    """Parses pom.xml in a single streaming pass shared by all Java detectors.
+
+    Returns a dict with the project's own ``parent`` (child tag -> text),
+    ``properties`` (name -> text) and ``dependencies`` (list of
+    (groupId, artifactId, version) tuples, or None when the POM has no
+    <dependencies> section). Sections nested elsewhere (dependencyManagement,
+    profiles, plugins) are ignored. Raises ET.ParseError on malformed XML.
+    """
+    summary = {"parent": {}, "properties": {}, "dependencies": None}
+    path = []  # Local tag names from the root to the current element
+    current_dep = {}
+    root = None
+    for event, elem in _iterparse_xml(pom_path, ("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            path.append(_local_name(elem.tag))
+            if len(path) == 2 and path[1] == "dependencies":
+                summary["dependencies"] = []
+            continue
+
+        depth = len(path)
+        tag = path.pop()
+        section = path[1] if depth > 2 else None
+        if depth == 3 and section == "parent":
+            summary["parent"][tag] = (elem.text or "").strip()
+        elif depth == 3 and section == "properties":
+            summary["properties"].setdefault(tag, (elem.text or "").strip())
+        elif depth == 3 and section == "dependencies" and tag == "dependency":
+            group_id = current_dep.get("groupId")
+            artifact_id = current_dep.get("artifactId")
+            if group_id is not None and artifact_id is not None:
+                summary["dependencies"].append((group_id, artifact_id, current_dep.get("version")))
+            current_dep = {}
+        elif depth == 4 and section == "dependencies" and path[2] == "dependency":
+            current_dep[tag] = (elem.text or "").strip()
+            continue
+
+        # Everything needed from this element has been read: drop its subtree so peak
+        # memory stays bounded by one element (large <build>/<profiles> sections included)
+        if depth == 2 or section not in POM_COLLECTED_SECTIONS or tag == "dependency":
+            elem.clear()
+
+    if root is not None:
+        root.clear()
+    return summary
+
+# Directories never descended into when walking a Java project tree
+JAVA_SCAN_EXCLUDES = frozenset({"target", "build", ".git", "node_modules", ".venv"})
+# File name suffixes identifying JSP views and Spring XML application contexts
+JSP_SUFFIXES = (".jsp", ".jspf", ".jspx")
+SPRING_XML_SUFFIXES = ("applicationContext.xml", "spring-servlet.xml", "-context.xml")
+# Common Spring Framework version property names in pom.xml, in lookup priority order
+SPRING_VERSION_PROPERTIES = (
+    "spring.version", "spring-framework.version", "springframework.version",
+    "spring.framework.version", "org.springframework.version",
+)
+# Spring Boot configuration files looked up in src/main/resources
+SPRING_BOOT_CONFIG_FILES = frozenset({"application.properties", "application.yml", "application.yaml"})
+# Vue CLI, Vite (Vue 3) and Nuxt.js configuration files
+VUE_CONFIG_FILES = frozenset({"vue.config.js", "vite.config.js", "nuxt.config.js"})
+# Directories skipped when looking for .vue single-file components
+VUE_SCAN_EXCLUDES = frozenset({"node_modules", ".git"})
+
+def _scan_project(project_path, excludes=JAVA_SCAN_EXCLUDES):
+    """Yields (dirpath, filename) for every file under project_path.
+
+    Uses an explicit stack of os.scandir iterators so directory entries are
+    classified from the cached DirEntry type (no extra stat() per entry) and
+    excluded directories are pruned before descending into them. Every directory
+    listed is recorded as a dependency of the running checker (see _record_dependency):
+    a file added to or removed from it changes its mtime.
+    """
+    stack = [project_path]
+    while stack:
+        dirpath = stack.pop()
+        _record_dependency(dirpath)
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excludes:
+                            stack.append(entry.path)
+                    else:
+                        yield dirpath, entry.name
+        except OSError:
+            continue
+
+def _dir_names(dir_path):
+    """Returns the entry names of dir_path as a frozenset (empty if it cannot be listed).
+
+    A single directory read replaces one stat() per candidate file name.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+def _root_names(project_path, root_entries):
+    """Returns the project root listing: the caller's shared snapshot, or a fresh _dir_names read."""
+    return root_entries if root_entries is not None else _dir_names(project_path)
+
+def _file_contains(file_path, needle):
+    """Tells whether the raw bytes of file_path contain needle.
+
+    Returns True when the file cannot be read, so the caller's full parse reports the error.
+    """
+    try:
+        with _mapped_file(file_path) as content:
+            return content.find(needle) != -1
+    except OSError:
+        return True
+
+def _file_markers(file_path, pattern):
+    """Returns the names of the groups of pattern (a bytes regex) that match in file_path."""
+    with _mapped_file(file_path) as content:
+        return frozenset(match.lastgroup for match in pattern.finditer(content))
+
+def _find_first_file(project_path, suffixes, excludes):
+    """Returns the path of the first file whose name ends with one of suffixes, or None."""
+    for root, name in _scan_project(project_path, excludes):
+        if name.endswith(suffixes):
+            return os.path.join(root, name)
+    return None
+
+# Detector results: (checker name, project path) -> (fingerprint, dependencies, (project_type, details));
+# at most DETECTOR_CACHE_SIZE entries, about 64 projects' worth of checkers
+DETECTOR_CACHE_SIZE = 1024
+_DETECTOR_CACHE = {}
+# Build files whose modification invalidates every cached detector result
+FINGERPRINT_FILES = ("pom.xml", "build.gradle", "package.json", "angular.json")
+
+def _mtime_ns(path):
+    """Returns the modification time of path in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+# Files and directories the checker running in each thread read beyond its fingerprint paths
+# (found by walking the tree), as (path, mtime_ns) pairs; see _recording_dependencies
+_DEPENDENCIES = threading.local()
+
+@contextlib.contextmanager
+def _recording_dependencies():
+    """Collects the dependencies recorded in this thread while the block runs into the yielded list."""
+    outer = getattr(_DEPENDENCIES, "recorded", None)
+    recorded = _DEPENDENCIES.recorded = []
+    try:
+        yield recorded
+    finally:
+        _DEPENDENCIES.recorded = outer
+
+def _record_dependencies(dependencies):
+    """Adds (path, mtime_ns) pairs to the recording running in this thread, if any."""
+    recorded = getattr(_DEPENDENCIES, "recorded", None)
+    if recorded is not None:
+        recorded.extend(dependencies)
+
+def _record_dependency(path):
+    """Marks path as read by the running checker, with its mtime from before the read."""
+    _record_dependencies(((path, _mtime_ns(path)),))
+
+def _dependencies_unchanged(dependencies):
+    """Tells whether none of the recorded (path, mtime_ns) dependencies was modified since."""
+    return all(_mtime_ns(path) == mtime_ns for path, mtime_ns in dependencies)
+
+def _build_fingerprint(project_path, extra_paths=()):
+    """Fingerprints the project root directory, its build files and detector-specific paths."""
+    paths = [project_path]
+    paths.extend(os.path.join(project_path, name) for name in FINGERPRINT_FILES)
+    paths.extend(os.path.join(project_path, *parts) for parts in extra_paths)
+    return tuple(_mtime_ns(path) for path in paths)
+
+def _cached_detector(*extra_paths):
+    """Memoizes a check_* function on the mtimes of the project's build files.
+
+    extra_paths are path component tuples (relative to the project) that the
+    detector also depends on, e.g. the WEB-INF directory for legacy Java. Files the
+    detector finds elsewhere in the tree are recorded with _record_dependency and
+    checked as well. The recorded dependencies are passed on to the caller's recording.
+    The cached details are copied on the way in and out so callers may mutate them.
+    """
+    def decorator(checker):
+        @functools.wraps(checker)
+        def wrapper(project_path, verbose=False, root_entries=None):
+            key = (checker.__name__, os.path.abspath(project_path))
+            fingerprint = _build_fingerprint(project_path, extra_paths)
+            cached = _DETECTOR_CACHE.get(key)
+            if (cached and cached[0] == fingerprint and not _BYPASS_CACHES.get()
+                    and _dependencies_unchanged(cached[1])):
+                if verbose: print(f"{checker.__name__}: build files unchanged, using cached result.")
+                _record_dependencies(cached[1])
+                project_type, details = cached[2]
+                return project_type, dict(details)
+            with _recording_dependencies() as recorded:
+                project_type, details = checker(project_path, verbose, root_entries=root_entries)
+            dependencies = tuple(dict.fromkeys(recorded))
+            _bounded_store(_DETECTOR_CACHE, key, (fingerprint, dependencies, (project_type, dict(details))),
+                           DETECTOR_CACHE_SIZE)
+            _record_dependencies(dependencies)
+            return project_type, details
+        wrapper.fingerprint_paths = extra_paths
+        return wrapper
+    return decorator
+
+# Dependency classifiers for legacy Spring POMs, dispatched on groupId.
+# Each receives (artifact_id, version, details, verbose) and returns True if it recognised the artifact.
+
+# (artifactId fragment, flag) pairs tested in order; the first fragment found sets its flag
+SPRING_ARTIFACT_FLAGS = (
+    ("spring-security", "uses_spring_security"),
+    ("spring-webmvc", "uses_spring_webmvc"),
+    ("spring-orm", "uses_spring_orm"),
+)
+
+def _match_artifact_flag(artifact_text, artifact_flags, details):
+    """Sets the flag of the first fragment contained in artifact_text. Returns True on a match."""
+    for fragment, flag in artifact_flags:
+        if fragment in artifact_text:
+            details[flag] = True
+            return True
+    return False
+
+def _legacy_spring_dependency(artifact_text, version_text, details, verbose):
+    """Specific Spring modules detection."""
+    _match_artifact_flag(artifact_text, SPRING_ARTIFACT_FLAGS, details)
+    return True
+
+def _legacy_hibernate_dependency(artifact_text, version_text, details, verbose):
+    """Hibernate detection (common in legacy projects)."""
+    if "hibernate" not in artifact_text:
+        return False
+    details["uses_hibernate"] = True
+    if version_text:
+        details["hibernate_version"] = version_text
+        if verbose: print(f"Hibernate version detected: {version_text}")
+    return True
+
+def _legacy_struts_dependency(artifact_text, version_text, details, verbose):
+    """Struts detection (high security risk)."""
+    details["uses_struts"] = True
+    if version_text:
+        details["struts_version"] = version_text
+        details["struts_security_risk"] = True
+        if verbose: print(f"Struts version detected: {version_text} - HIGH SECURITY RISK")
+    return True
+
+def _legacy_log4j_dependency(artifact_text, version_text, details, verbose):
+    """Legacy logging frameworks."""
+    if "log4j" not in artifact_text:
+        return False
+    details["uses_log4j"] = True
+    details["log4j_version"] = version_text
+    if version_text and version_text.startswith("1."):
+        details["log4j_security_risk"] = True
+        if verbose: print(f"Log4j 1.x detected: {version_text} - SECURITY RISK")
+    return True
+
+def _legacy_flag_dependency(*artifact_flags):
+    """Builds a classifier that only sets flags from (artifactId fragment, flag) pairs (database drivers)."""
+    def classify(artifact_text, version_text, details, verbose):
+        return _match_artifact_flag(artifact_text, artifact_flags, details)
+    return classify
+
+LEGACY_DEPENDENCY_HANDLERS = {
+    "org.springframework": _legacy_spring_dependency,
+    "org.hibernate": _legacy_hibernate_dependency,
+    "org.apache.struts": _legacy_struts_dependency,
+    "log4j": _legacy_log4j_dependency,
+    "mysql": _legacy_flag_dependency(("mysql-connector", "database_mysql")),
+    "oracle": _legacy_flag_dependency(("ojdbc", "database_oracle")),
+    "com.microsoft.sqlserver": _legacy_flag_dependency(("mssql-jdbc", "database_sqlserver")),
+}
+LEGACY_TECHNOLOGY_FLAGS = (
+    "uses_spring_security", "uses_spring_webmvc", "uses_spring_orm", "uses_hibernate", "uses_struts",
+)
 
 # Heuristics for project type detection
 # Each function returns a tuple: (project_type_string_or_None, detected_details_dict)
 
-def check_java_legacy(project_path, verbose=False):
+@_cached_detector(
+    ("src", "main", "webapp", "WEB-INF"), ("src", "main", "webapp", "WEB-INF", "web.xml"),
+    ("WebContent", "WEB-INF"), ("WebContent", "WEB-INF", "web.xml"),
+)
+def check_java_legacy(project_path, verbose=False, root_entries=None):
     """Checks for indicators of a legacy Java Spring + JSP project."""
     # Indicators: WEB-INF directory, web.xml, Spring XML configs, JSP files.
+    top_names = _root_names(project_path, root_entries)
+    if "src" not in top_names and "WebContent" not in top_names:
+        return None, {}
     web_inf_path = os.path.join(project_path, "src", "main", "webapp", "WEB-INF")
     if not os.path.isdir(web_inf_path):
         web_inf_path = os.path.join(project_path, "WebContent", "WEB-INF") # Common in older Eclipse projects
@@ -21,28 +479,29 @@ def check_java_legacy(project_path, verbose=False):
     if verbose:
         print(f"Found WEB-INF directory at: {web_inf_path}")
 
-    has_web_xml = os.path.exists(os.path.join(web_inf_path, "web.xml"))
+    has_web_xml = "web.xml" in _dir_names(web_inf_path)
     # Look for Spring XML files (e.g., applicationContext.xml, *-servlet.xml)
     spring_xml_present = False
     jsp_files_found = 0
     details = {"web_inf_path": web_inf_path}
     
-    for root, _, files in os.walk(project_path):
-        if "target" in root or "build" in root or ".git" in root or "node_modules" in root:
-            continue
-        for file in files:
-            if file.endswith(".jsp") or file.endswith(".jspf") or file.endswith(".jspx"):
-                jsp_files_found += 1
-                if verbose: print(f"Found JSP file: {os.path.join(root, file)}")
-                if jsp_files_found <= 3:  # Only log first few to avoid spam
-                    details[f"jsp_file_{jsp_files_found}"] = os.path.join(root, file)
-            if (("applicationContext.xml" in file or "spring-servlet.xml" in file or file.endswith("-context.xml")) 
-                and file.endswith(".xml")):
-                if verbose: print(f"Found Spring XML config: {os.path.join(root, file)}")
-                spring_xml_present = True
-                details["spring_xml_config"] = os.path.join(root, file)
-                break
-        if spring_xml_present:
+    for root, file in _scan_project(project_path):
+        # Paths are only joined for matching files, and only when they are logged or stored
+        if file.endswith(JSP_SUFFIXES):
+            jsp_files_found += 1
+            if jsp_files_found <= 3:  # Only log first few to avoid spam
+                file_path = os.path.join(root, file)
+                if verbose: print(f"Found JSP file: {file_path}")
+                details[f"jsp_file_{jsp_files_found}"] = file_path
+            elif verbose:
+                print(f"Found JSP file: {os.path.join(root, file)}")
+        elif not spring_xml_present and file.endswith(SPRING_XML_SUFFIXES):
+            file_path = os.path.join(root, file)
+            if verbose: print(f"Found Spring XML config: {file_path}")
+            spring_xml_present = True
+            details["spring_xml_config"] = file_path
+        # Nothing more to learn once the Spring config and the first JSP samples are known
+        if spring_xml_present and jsp_files_found >= 3:
             break
     
     details["jsp_files_count"] = jsp_files_found
@@ -51,113 +510,44 @@ def check_java_legacy(project_path, verbose=False):
     if (has_web_xml or spring_xml_present):
         # Enhanced pom.xml parsing for Spring Framework version detection
         pom_path = os.path.join(project_path, "pom.xml")
-        if os.path.exists(pom_path):
+        if "pom.xml" in top_names:
             details["is_maven"] = True
             if verbose: print("Maven project (pom.xml found).")
             
             try:
-                tree = ET.parse(pom_path)
-                root = tree.getroot()
-                ns = {"m": "http://maven.apache.org/POM/4.0.0"}
+                pom = _parse_pom_cached(pom_path)
                 
                 # Look for Spring Framework version in properties
-                properties = root.find("m:properties", ns)
-                if properties is not None:
-                    # Common Spring version property names
-                    spring_version_props = [
-                        "spring.version", "spring-framework.version", "springframework.version",
-                        "spring.framework.version", "org.springframework.version"
-                    ]
-                    
-                    for prop_name in spring_version_props:
-                        # Handle both with and without namespace prefixes
-                        spring_version_elem = properties.find(f"m:{prop_name}", ns)
-                        if spring_version_elem is None:
-                            # Try without namespace for older POMs
-                            spring_version_elem = properties.find(prop_name)
-                        
-                        if spring_version_elem is not None:
-                            details["spring_framework_version"] = spring_version_elem.text
-                            if verbose: print(f"Spring Framework version found in properties: {spring_version_elem.text}")
-                            break
+                properties = pom["properties"]
+                spring_version_prop = next((name for name in SPRING_VERSION_PROPERTIES if name in properties), None)
+                if spring_version_prop:
+                    details["spring_framework_version"] = properties[spring_version_prop]
+                    if verbose: print(f"Spring Framework version found in properties: {properties[spring_version_prop]}")
                 
                 # Look for Spring dependencies to determine version if not in properties
-                dependencies = root.find("m:dependencies", ns)
-                if dependencies is not None:
+                if pom["dependencies"] is not None:
                     spring_version_from_deps = None
-                    uses_spring_security = False
-                    uses_spring_webmvc = False
-                    uses_spring_orm = False
-                    uses_hibernate = False
-                    uses_struts = False
+                    # Technology flags are reported (False) whenever the POM declares dependencies
+                    for flag in LEGACY_TECHNOLOGY_FLAGS:
+                        details[flag] = False
                     
-                    for dep in dependencies.findall("m:dependency", ns):
-                        groupId = dep.find("m:groupId", ns)
-                        artifactId = dep.find("m:artifactId", ns)
-                        version = dep.find("m:version", ns)
+                    for group_text, artifact_text, version_text in pom["dependencies"]:
+                        # Spring Framework core dependencies: the first versioned one wins
+                        if group_text == "org.springframework" and not spring_version_from_deps and version_text:
+                            spring_version_from_deps = version_text
+                            details["spring_framework_version"] = version_text
+                            if verbose: print(f"Spring Framework version found in dependency: {version_text}")
                         
-                        if groupId is not None and artifactId is not None:
-                            group_text = groupId.text
-                            artifact_text = artifactId.text
-                            version_text = version.text if version is not None else None
-                            
-                            # Spring Framework core dependencies
-                            if group_text == "org.springframework":
-                                if not spring_version_from_deps and version_text:
-                                    spring_version_from_deps = version_text
-                                    details["spring_framework_version"] = version_text
-                                    if verbose: print(f"Spring Framework version found in dependency: {version_text}")
-                                
-                                # Specific Spring modules detection
-                                if "spring-security" in artifact_text:
-                                    uses_spring_security = True
-                                elif "spring-webmvc" in artifact_text:
-                                    uses_spring_webmvc = True
-                                elif "spring-orm" in artifact_text:
-                                    uses_spring_orm = True
-                            
-                            # Hibernate detection (common in legacy projects)
-                            elif group_text == "org.hibernate" and "hibernate" in artifact_text:
-                                uses_hibernate = True
-                                if version_text:
-                                    details["hibernate_version"] = version_text
-                                    if verbose: print(f"Hibernate version detected: {version_text}")
-                            
-                            # Struts detection (high security risk)
-                            elif group_text == "org.apache.struts" or "struts" in artifact_text:
-                                uses_struts = True
-                                if version_text:
-                                    details["struts_version"] = version_text
-                                    details["struts_security_risk"] = True
-                                    if verbose: print(f"Struts version detected: {version_text} - HIGH SECURITY RISK")
-                            
-                            # Legacy logging frameworks
-                            elif group_text == "log4j" and "log4j" in artifact_text:
-                                details["uses_log4j"] = True
-                                details["log4j_version"] = version_text
-                                if version_text and version_text.startswith("1."):
-                                    details["log4j_security_risk"] = True
-                                    if verbose: print(f"Log4j 1.x detected: {version_text} - SECURITY RISK")
-                            
-                            # Database drivers
-                            elif group_text == "mysql" and "mysql-connector" in artifact_text:
-                                details["database_mysql"] = True
-                            elif group_text == "oracle" and "ojdbc" in artifact_text:
-                                details["database_oracle"] = True
-                            elif group_text == "com.microsoft.sqlserver" and "mssql-jdbc" in artifact_text:
-                                details["database_sqlserver"] = True
-                    
-                    # Set technology flags
-                    details["uses_spring_security"] = uses_spring_security
-                    details["uses_spring_webmvc"] = uses_spring_webmvc
-                    details["uses_spring_orm"] = uses_spring_orm
-                    details["uses_hibernate"] = uses_hibernate
-                    details["uses_struts"] = uses_struts
+                        # Single hash lookup on groupId; Struts is also recognised by artifact name
+                        handler = LEGACY_DEPENDENCY_HANDLERS.get(group_text)
+                        if not (handler and handler(artifact_text, version_text, details, verbose)) \
+                                and "struts" in artifact_text:
+                            _legacy_struts_dependency(artifact_text, version_text, details, verbose)
                 
                 # Analyze Spring Framework version for security assessment
                 spring_version = details.get("spring_framework_version")
                 if spring_version:
-                    version_match = re.search(r'(\d+)\.(\d+)', spring_version)
+                    version_match = _RE_MAJOR_MINOR.search(spring_version)
                     if version_match:
                         major_version = int(version_match.group(1))
                         minor_version = int(version_match.group(2))
@@ -188,18 +578,15 @@ def check_java_legacy(project_path, verbose=False):
         
         # Check for Gradle build files (less common in legacy projects but possible)
         gradle_path = os.path.join(project_path, "build.gradle")
-        if os.path.exists(gradle_path):
+        if "build.gradle" in top_names:
             details["is_gradle"] = True
             if verbose: print("Gradle project (build.gradle found).")
             
             try:
-                with open(gradle_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Simple regex to find Spring version in Gradle files
-                    spring_version_match = re.search(r'springframework[\'"]:\s*[\'"]([0-9.]+)', content)
-                    if spring_version_match:
-                        details["spring_framework_version"] = spring_version_match.group(1)
-                        if verbose: print(f"Spring Framework version found in build.gradle: {spring_version_match.group(1)}")
+                gradle_version = _parse_gradle_cached(gradle_path)["spring_framework_version"]
+                if gradle_version:
+                    details["spring_framework_version"] = gradle_version
+                    if verbose: print(f"Spring Framework version found in build.gradle: {gradle_version}")
             except Exception as e:
                 if verbose: print(f"Error reading build.gradle: {e}")
         
@@ -207,11 +594,8 @@ def check_java_legacy(project_path, verbose=False):
         if has_web_xml:
             try:
                 web_xml_path = os.path.join(web_inf_path, "web.xml")
-                tree = ET.parse(web_xml_path)
-                root = tree.getroot()
-                
-                # Check web-app version attribute
-                version_attr = root.get("version")
+                # Check web-app version attribute (only the root start tag is read)
+                version_attr = _xml_root_attributes(web_xml_path).get("version")
                 if version_attr:
                     details["servlet_version"] = version_attr
                     servlet_version = float(version_attr)
@@ -228,137 +612,114 @@ def check_java_legacy(project_path, verbose=False):
         return "java_legacy_spring", details
     return None, {}
 
-def check_spring_boot(project_path, verbose=False):
+@_cached_detector(("src", "main", "resources"))
+def check_spring_boot(project_path, verbose=False, root_entries=None):
     """Checks for indicators of a Spring Boot project."""
     pom_path = os.path.join(project_path, "pom.xml")
     gradle_path = os.path.join(project_path, "build.gradle")
-    application_props_main = os.path.join(project_path, "src", "main", "resources", "application.properties")
-    application_yml_main = os.path.join(project_path, "src", "main", "resources", "application.yml")
-    application_yaml_main = os.path.join(project_path, "src", "main", "resources", "application.yaml")
+    top_names = _root_names(project_path, root_entries)
     details = {}
 
-    if os.path.exists(pom_path):
+    # Every Spring Boot marker in a POM (starter parent, starters, spring-boot.version)
+    # contains "spring-boot": a byte search rejects other POMs without parsing the XML
+    if "pom.xml" in top_names and _file_contains(pom_path, b"spring-boot"):
         try:
-            tree = ET.parse(pom_path)
-            root = tree.getroot()
-            ns = {"m": "http://maven.apache.org/POM/4.0.0"}
+            pom = _parse_pom_cached(pom_path)
             
-            parent = root.find("m:parent", ns)
-            if parent is not None:
-                artifactId = parent.find("m:artifactId", ns)
-                if artifactId is not None and artifactId.text == "spring-boot-starter-parent":
-                    version_tag = parent.find("m:version", ns)
-                    if version_tag is not None:
-                        details["spring_boot_version"] = version_tag.text
+            parent = pom["parent"]
+            if parent.get("artifactId") == "spring-boot-starter-parent":
+                version_text = parent.get("version")
+                if version_text:
+                    details["spring_boot_version"] = version_text
+                    
+                    # Parse version to detect major version
+                    version_match = _RE_MAJOR.search(version_text)
+                    if version_match:
+                        major_version = int(version_match.group(1))
+                        details["spring_boot_major_version"] = major_version
                         
-                        # Parse version to detect major version
-                        import re
-                        version_match = re.search(r'(\d+)', version_tag.text)
-                        if version_match:
-                            major_version = int(version_match.group(1))
-                            details["spring_boot_major_version"] = major_version
-                            
-                            if major_version == 1:
-                                details["is_legacy"] = True
-                                details["security_priority"] = "high"
-                                if verbose: print(f"Spring Boot {major_version} detected - LEGACY version with security concerns.")
-                            elif major_version == 2:
-                                details["is_modern"] = True
-                                details["security_priority"] = "medium"
-                                if verbose: print(f"Spring Boot {major_version} detected - Modern stable version.")
-                            elif major_version >= 3:
-                                details["is_latest"] = True
-                                details["requires_java17"] = True
-                                details["security_priority"] = "low"
-                                if verbose: print(f"Spring Boot {major_version} detected - Latest version with Java 17+ requirement.")
+                        if major_version == 1:
+                            details["is_legacy"] = True
+                            details["security_priority"] = "high"
+                            if verbose: print(f"Spring Boot {major_version} detected - LEGACY version with security concerns.")
+                        elif major_version == 2:
+                            details["is_modern"] = True
+                            details["security_priority"] = "medium"
+                            if verbose: print(f"Spring Boot {major_version} detected - Modern stable version.")
+                        elif major_version >= 3:
+                            details["is_latest"] = True
+                            details["requires_java17"] = True
+                            details["security_priority"] = "low"
+                            if verbose: print(f"Spring Boot {major_version} detected - Latest version with Java 17+ requirement.")
+                
+                if verbose: print(f"Spring Boot parent found in pom.xml. Version: {details.get('spring_boot_version', 'N/A')}")
+                
+                # Check for specific Spring dependencies
+                for group_text, artifact_text, _ in pom["dependencies"] or ():
+                    # Spring Security detection
+                    if group_text == "org.springframework.boot" and artifact_text == "spring-boot-starter-security":
+                        details["uses_spring_security"] = True
+                        if verbose: print("Spring Security detected.")
                     
-                    if verbose: print(f"Spring Boot parent found in pom.xml. Version: {details.get('spring_boot_version', 'N/A')}")
+                    # Spring Data JPA detection
+                    elif group_text == "org.springframework.boot" and artifact_text == "spring-boot-starter-data-jpa":
+                        details["uses_spring_data_jpa"] = True
+                        if verbose: print("Spring Data JPA detected.")
                     
-                    # Check for specific Spring dependencies
-                    dependencies = root.find("m:dependencies", ns)
-                    if dependencies is not None:
-                        for dep in dependencies.findall("m:dependency", ns):
-                            groupId = dep.find("m:groupId", ns)
-                            artifactId = dep.find("m:artifactId", ns)
-                            
-                            if groupId is not None and artifactId is not None:
-                                group_text = groupId.text
-                                artifact_text = artifactId.text
-                                
-                                # Spring Security detection
-                                if group_text == "org.springframework.boot" and artifact_text == "spring-boot-starter-security":
-                                    details["uses_spring_security"] = True
-                                    if verbose: print("Spring Security detected.")
-                                
-                                # Spring Data JPA detection
-                                elif group_text == "org.springframework.boot" and artifact_text == "spring-boot-starter-data-jpa":
-                                    details["uses_spring_data_jpa"] = True
-                                    if verbose: print("Spring Data JPA detected.")
-                                
-                                # Spring Boot Actuator detection
-                                elif group_text == "org.springframework.boot" and artifact_text == "spring-boot-starter-actuator":
-                                    details["uses_actuator"] = True
-                                    if verbose: print("Spring Boot Actuator detected - SECURITY RISK if not secured.")
-                                
-                                # Spring WebFlux (Reactive) detection
-                                elif group_text == "org.springframework.boot" and artifact_text == "spring-boot-starter-webflux":
-                                    details["uses_webflux"] = True
-                                    if verbose: print("Spring WebFlux (Reactive) detected.")
-                                
-                                # Spring Cloud detection
-                                elif group_text and "org.springframework.cloud" in group_text:
-                                    details["uses_spring_cloud"] = True
-                                    if verbose: print("Spring Cloud dependency detected.")
-                                
-                                # Database drivers detection for security analysis
-                                elif group_text == "mysql" and "mysql-connector" in artifact_text:
-                                    details["database_mysql"] = True
-                                elif group_text == "org.postgresql" and "postgresql" in artifact_text:
-                                    details["database_postgresql"] = True
-                                elif group_text == "com.h2database" and "h2" in artifact_text:
-                                    details["database_h2"] = True
-                                    details["h2_console_risk"] = True
-                                    if verbose: print("H2 Database detected - SECURITY RISK if H2 console enabled in production.")
+                    # Spring Boot Actuator detection
+                    elif group_text == "org.springframework.boot" and artifact_text == "spring-boot-starter-actuator":
+                        details["uses_actuator"] = True
+                        if verbose: print("Spring Boot Actuator detected - SECURITY RISK if not secured.")
                     
-                    return "springboot", details
+                    # Spring WebFlux (Reactive) detection
+                    elif group_text == "org.springframework.boot" and artifact_text == "spring-boot-starter-webflux":
+                        details["uses_webflux"] = True
+                        if verbose: print("Spring WebFlux (Reactive) detected.")
+                    
+                    # Spring Cloud detection
+                    elif group_text and "org.springframework.cloud" in group_text:
+                        details["uses_spring_cloud"] = True
+                        if verbose: print("Spring Cloud dependency detected.")
+                    
+                    # Database drivers detection for security analysis
+                    elif group_text == "mysql" and "mysql-connector" in artifact_text:
+                        details["database_mysql"] = True
+                    elif group_text == "org.postgresql" and "postgresql" in artifact_text:
+                        details["database_postgresql"] = True
+                    elif group_text == "com.h2database" and "h2" in artifact_text:
+                        details["database_h2"] = True
+                        details["h2_console_risk"] = True
+                        if verbose: print("H2 Database detected - SECURITY RISK if H2 console enabled in production.")
+                
+                return "springboot", details
             
             # Check dependencies for spring-boot artifacts
-            dependencies = root.find("m:dependencies", ns)
-            if dependencies is not None:
-                for dep in dependencies.findall("m:dependency", ns):
-                    groupId = dep.find("m:groupId", ns)
-                    artifactId = dep.find("m:artifactId", ns)
-                    if groupId is not None and groupId.text == "org.springframework.boot" and \
-                       artifactId is not None and "spring-boot-starter" in artifactId.text:
-                        if verbose: print(f"Spring Boot starter dependency found in pom.xml: {artifactId.text}")
-                        # Try to get version from properties if not in parent
-                        if "spring_boot_version" not in details:
-                            properties = root.find("m:properties", ns)
-                            if properties is not None:
-                                spring_boot_version_prop = properties.find("m:spring-boot.version", ns) # Common property name
-                                if spring_boot_version_prop is not None:
-                                     details["spring_boot_version"] = spring_boot_version_prop.text
-                        return "springboot", details
+            for group_text, artifact_text, _ in pom["dependencies"] or ():
+                if group_text == "org.springframework.boot" and "spring-boot-starter" in artifact_text:
+                    if verbose: print(f"Spring Boot starter dependency found in pom.xml: {artifact_text}")
+                    # Try to get version from properties if not in parent
+                    if "spring_boot_version" not in details:
+                        properties = pom["properties"]
+                        if "spring-boot.version" in properties: # Common property name
+                            details["spring_boot_version"] = properties["spring-boot.version"]
+                    return "springboot", details
 
         except ET.ParseError:
             if verbose: print(f"Error parsing pom.xml at {pom_path}")
         except Exception as e:
             if verbose: print(f"An unexpected error occurred parsing pom.xml: {e}")
 
-    if os.path.exists(gradle_path):
+    if "build.gradle" in top_names:
         try:
-            with open(gradle_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if "org.springframework.boot" in content or "spring-boot-gradle-plugin" in content:
-                    if verbose: print("Spring Boot Gradle plugin detected.")
-                    # Could try to extract version from gradle if needed
-                    return "springboot", details
+            if _parse_gradle_cached(gradle_path)["spring_boot"]:
+                if verbose: print("Spring Boot Gradle plugin detected.")
+                # Could try to extract version from gradle if needed
+                return "springboot", details
         except Exception as e:
             if verbose: print(f"Error reading or parsing build.gradle: {e}")
 
-    if (os.path.exists(application_props_main) or 
-        os.path.exists(application_yml_main) or 
-        os.path.exists(application_yaml_main)):
+    resources_names = _dir_names(os.path.join(project_path, "src", "main", "resources")) if "src" in top_names else frozenset()
+    if not resources_names.isdisjoint(SPRING_BOOT_CONFIG_FILES):
         if verbose: print("Found Spring Boot application.(properties/yml/yaml)")
         # This is a weaker indicator alone, but can confirm if pom/gradle check wasn't definitive
         # or if those files are missing but it's still a Boot app (e.g. non-standard structure)
@@ -369,15 +730,17 @@ def check_spring_boot(project_path, verbose=False):
 
     return None, {}
 
-def check_angular(project_path, verbose=False):
+@_cached_detector()
+def check_angular(project_path, verbose=False, root_entries=None):
     """Checks for indicators of an Angular project."""
     angular_json_path = os.path.join(project_path, "angular.json")
     package_json_path = os.path.join(project_path, "package.json") 
+    top_names = _root_names(project_path, root_entries)
     details = {}
 
-    if os.path.exists(angular_json_path):
+    if "angular.json" in top_names:
         if verbose: print("Found angular.json.")
-        data = load_json_file(angular_json_path)
+        data = _load_json_cached(angular_json_path)
         if data and isinstance(data.get("projects"), dict):
             # Try to get project name and version if possible
             # Angular CLI stores projects under the "projects" key
@@ -390,8 +753,8 @@ def check_angular(project_path, verbose=False):
             if "15" in schema or "16" in schema or "17" in schema or "18" in schema:
                 details["angular_cli_modern"] = True
 
-    if os.path.exists(package_json_path):
-        data = load_json_file(package_json_path)
+    if "package.json" in top_names:
+        data = _load_json_cached(package_json_path)
         if data:
             dependencies = data.get("dependencies", {})
             dev_dependencies = data.get("devDependencies", {})
@@ -401,8 +764,7 @@ def check_angular(project_path, verbose=False):
                 details["angular_core_version"] = angular_version
                 
                 # Parse version to detect major version
-                import re
-                version_match = re.search(r'(\d+)', angular_version)
+                version_match = _RE_MAJOR.search(angular_version)
                 if version_match:
                     major_version = int(version_match.group(1))
                     details["angular_major_version"] = major_version
@@ -437,16 +799,15 @@ def check_angular(project_path, verbose=False):
     
     return None, {}
 
-def check_vue(project_path, verbose=False):
+@_cached_detector()
+def check_vue(project_path, verbose=False, root_entries=None):
     """Checks for indicators of a Vue.js project."""
     package_json_path = os.path.join(project_path, "package.json")
-    vue_config_js_path = os.path.join(project_path, "vue.config.js")
-    vite_config_js_path = os.path.join(project_path, "vite.config.js") # Vue 3 with Vite
-    nuxt_config_js_path = os.path.join(project_path, "nuxt.config.js") # Nuxt.js (Vue framework)
+    top_names = _root_names(project_path, root_entries)
     details = {}
 
-    if os.path.exists(package_json_path):
-        data = load_json_file(package_json_path)
+    if "package.json" in top_names:
+        data = _load_json_cached(package_json_path)
         if data:
             dependencies = data.get("dependencies", {})
             dev_dependencies = data.get("devDependencies", {})
@@ -458,31 +819,224 @@ def check_vue(project_path, verbose=False):
                     if verbose: print("Nuxt detected.")
                 return "vue", details
     
-    if os.path.exists(vue_config_js_path) or os.path.exists(vite_config_js_path) or os.path.exists(nuxt_config_js_path):
+    if not top_names.isdisjoint(VUE_CONFIG_FILES):
         if verbose: print("Found vue.config.js, vite.config.js, or nuxt.config.js.")
         # This is a good secondary indicator if package.json wasn't conclusive or is missing vue dep for some reason
         return "vue", details
     
-    # Check for .vue files (more intensive)
-    for root, _, files in os.walk(project_path):
-        if "node_modules" in root or ".git" in root:
-            continue
-        for file in files:
-            if file.endswith(".vue"):
-                if verbose: print(f"Found .vue file: {os.path.join(root, file)}")
-                return "vue", details
+    # Check for .vue files (more intensive): stops at the first match
+    vue_file = _find_first_file(project_path, (".vue",), VUE_SCAN_EXCLUDES)
+    if vue_file:
+        if verbose: print(f"Found .vue file: {vue_file}")
+        return "vue", details
     return None, {}
 
-def check_gitlab_ci(project_path, verbose=False):
+def check_gitlab_ci(project_path, verbose=False, root_entries=None):
     """Checks for a GitLab CI file."""
-    gitlab_ci_yml_path = os.path.join(project_path, ".gitlab-ci.yml")
-    if os.path.exists(gitlab_ci_yml_path):
+    if ".gitlab-ci.yml" in _root_names(project_path, root_entries):
         if verbose: print("Found .gitlab-ci.yml.")
         return "gitlab_ci", {}
     return None, {}
 
 
-def detect_python_version(project_path, verbose=False):
+def _read_pyvenv_version(venv_dir):
+    """
+    Lee la versión de Python registrada en el pyvenv.cfg de un entorno virtual.
+    
+    venv escribe 'version = 3.11.5' y virtualenv/uv 'version_info = 3.11.5.final.0'.
+    
+    Returns:
+        Versión como string ("3.11.5") o None si el archivo no existe o no la contiene
+    """
+    try:
+        with open(os.path.join(venv_dir, "pyvenv.cfg"), 'r', encoding='utf-8') as f:
+            version_match = _RE_PYVENV_VERSION.search(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+    return version_match.group(1) if version_match else None
+
+
+# Directorios de entorno virtual buscados, en orden de prioridad
+PYTHON_VENV_DIRS = ('.venv', 'venv', 'env', '.env')
+# Rutas (relativas al proyecto) cuya modificación invalida el resultado cacheado de check_python:
+# fuentes de versión de detect_python_version, indicadores de frameworks y el pyvenv.cfg de cada venv
+PYTHON_FINGERPRINT_PATHS = tuple(
+    (name,) for name in (
+        ".python-version", "pyproject.toml", "Pipfile", "setup.py",
+        "requirements.txt", "manage.py", "app.py", "main.py",
+    )
+) + tuple((venv_name, "pyvenv.cfg") for venv_name in PYTHON_VENV_DIRS)
+
+@functools.lru_cache(maxsize=256)
+def _load_toml(toml_path, mtime_ns, size):
+    """
+    Parsea un archivo TOML una sola vez por versión del archivo.
+    
+    mtime_ns y size forman parte de la clave de caché: si el archivo cambia se vuelve a leer.
+    
+    Returns:
+        Dict con el documento o None si el TOML no es válido
+    """
+    with open(toml_path, 'rb') as f:
+        try:
+            return tomllib.load(f)
+        except tomllib.TOMLDecodeError:
+            return None
+
+
+def _read_toml(toml_path):
+    """
+    Devuelve el documento TOML de toml_path (compartido, no modificar).
+    
+    Returns:
+        Dict o None si no hay parser TOML disponible, el archivo no existe o no es válido
+    """
+    if tomllib is None:
+        return None
+    try:
+        stat = os.stat(toml_path)
+        load = _load_toml.__wrapped__ if _BYPASS_CACHES.get() else _load_toml
+        return load(toml_path, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+def _toml_get(data, *keys):
+    """Recorre tablas TOML anidadas; devuelve None si falta alguna clave."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _pyproject_python_spec(pyproject_path):
+    """
+    Obtiene el especificador de Python de pyproject.toml.
+    
+    Prioridad: [project].requires-python (PEP 621) y después
+    [tool.poetry.dependencies].python.
+    
+    Returns:
+        Especificador como string (">=3.8", "^3.9") o None
+    """
+    data = _read_toml(pyproject_path)
+    if data is not None:
+        for keys in (("project", "requires-python"), ("tool", "poetry", "dependencies", "python")):
+            version_spec = _toml_get(data, *keys)
+            if isinstance(version_spec, str):
+                return version_spec
+        return None
+    
+    # Sin parser TOML: búsqueda por expresiones regulares
+    content = _read_text_cached(pyproject_path)
+    for pattern in _PYPROJECT_PYTHON_PATTERNS:
+        requires_match = pattern.search(content)
+        if requires_match:
+            return requires_match.group(1)
+    return None
+
+
+def _pipfile_python_version(pipfile_path):
+    """
+    Obtiene python_version de la sección [requires] de un Pipfile.
+    
+    Returns:
+        Versión como string ("3.9") o None
+    """
+    data = _read_toml(pipfile_path)
+    if data is not None:
+        full_version = _toml_get(data, "requires", "python_version")
+        return full_version if isinstance(full_version, str) else None
+    
+    # Sin parser TOML: búsqueda por expresiones regulares
+    requires_section = _RE_PIPFILE_PYTHON.search(_read_text_cached(pipfile_path))
+    return requires_section.group(1) if requires_section else None
+
+
+def _poetry_django_version(pyproject_path):
+    """Returns the Django requirement declared in the Poetry dependency tables of pyproject.toml, or None."""
+    data = _read_toml(pyproject_path)
+    if data is None:
+        django_match = _RE_POETRY_DJANGO.search(_read_text_cached(pyproject_path))
+        return django_match.group(1) if django_match else None
+    
+    poetry = _toml_get(data, "tool", "poetry") or {}
+    dependency_tables = [poetry.get("dependencies"), poetry.get("dev-dependencies")]
+    groups = poetry.get("group")
+    if isinstance(groups, dict):
+        dependency_tables.extend(_toml_get(group, "dependencies") for group in groups.values())
+    for table in dependency_tables:
+        if not isinstance(table, dict):
+            continue
+        for name, requirement in table.items():
+            if name.lower() != "django":
+                continue
+            if isinstance(requirement, dict):
+                requirement = requirement.get("version")
+            if isinstance(requirement, str):
+                return requirement
+    return None
+
+
+def _query_interpreter(python_cmd):
+    """
+    Ejecuta el intérprete una sola vez para obtener su versión y la ruta real del ejecutable.
+    
+    Las excepciones de subprocess (timeout, comando no encontrado) se propagan al llamador.
+    
+    Returns:
+        Tupla (versión, ejecutable) o None si el intérprete falla o no informa de una versión.
+        El ejecutable puede ser "" si el intérprete no lo conoce.
+    """
+    result = subprocess.run(
+        [python_cmd, '-c', _INTERPRETER_QUERY],
+        capture_output=True,
+        text=True,
+        timeout=5,
+        shell=False
+    )
+    if result.returncode != 0:
+        return None
+    
+    lines = result.stdout.splitlines()
+    version_match = _RE_SEMVER.match(lines[0]) if lines else None
+    if not version_match:
+        return None
+    executable = lines[1].strip() if len(lines) > 1 else ""
+    return version_match.group(0), executable
+
+
+def _fill_python(details, full_version, source, *, version_match=None, is_venv=False,
+                 version_required=None, python_path=None, venv_path=None):
+    """
+    Registra en details la versión de Python detectada y de dónde procede.
+    
+    python_major_version/python_minor_version salen de los grupos de version_match
+    (un match de _RE_SEMVER ya obtenido por el llamador) o, si no se pasa, de casar
+    _RE_SEMVER sobre full_version. Los campos opcionales (python_version_required,
+    python_path, venv_path) solo se añaden si se indican.
+    """
+    details["python_version"] = full_version
+    if version_required:
+        details["python_version_required"] = version_required
+    if python_path:
+        details["python_path"] = python_path
+    details["python_source"] = source
+    details["is_venv"] = is_venv
+    if venv_path:
+        details["venv_path"] = venv_path
+    
+    version_match = version_match or _RE_SEMVER.match(full_version)
+    if version_match:
+        details["python_major_version"] = int(version_match.group(1))
+        details["python_minor_version"] = int(version_match.group(2))
+    else:
+        # Solo major, p. ej. python_version = "3" en un Pipfile
+        details["python_major_version"] = int(full_version.split('.', 1)[0])
+
+
+def detect_python_version(project_path, verbose=False, root_entries=None):
     """
     Detecta la versión de Python y su ruta de instalación.
     
@@ -505,9 +1059,11 @@ def detect_python_version(project_path, verbose=False):
     python_exe = 'python.exe' if is_windows else 'python'
     bin_dir = 'Scripts' if is_windows else 'bin'
     
-    # 1. Buscar entorno virtual local
-    venv_paths = ['.venv', 'venv', 'env', '.env']
-    for venv_name in venv_paths:
+    # 1. Buscar entorno virtual local (solo los directorios presentes en la raíz)
+    root_names = _root_names(project_path, root_entries)
+    for venv_name in PYTHON_VENV_DIRS:
+        if venv_name not in root_names:
+            continue
         venv_dir = os.path.join(project_path, venv_name)
         venv_python = os.path.join(venv_dir, bin_dir, python_exe)
         
@@ -519,46 +1075,32 @@ def detect_python_version(project_path, verbose=False):
             if verbose:
                 print(f"Entorno virtual encontrado: {venv_dir}")
             
-            try:
-                # Ejecutar python --version para obtener la versión
-                result = subprocess.run(
-                    [venv_python, '--version'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    shell=False
-                )
-                
-                if result.returncode == 0:
-                    version_output = result.stdout.strip() or result.stderr.strip()
-                    # Parsear "Python 3.11.5" -> "3.11.5"
-                    version_match = re.search(r'Python\s+(\d+\.\d+\.?\d*)', version_output)
-                    if version_match:
-                        full_version = version_match.group(1)
-                        details["python_version"] = full_version
-                        details["python_path"] = os.path.abspath(venv_python)
-                        details["python_source"] = "venv"
-                        details["is_venv"] = True
-                        details["venv_path"] = os.path.abspath(venv_dir)
-                        
-                        # Parsear versión major y minor
-                        version_parts = full_version.split('.')
-                        if len(version_parts) >= 1:
-                            details["python_major_version"] = int(version_parts[0])
-                        if len(version_parts) >= 2:
-                            details["python_minor_version"] = int(version_parts[1])
-                        
-                        if verbose:
-                            print(f"Python {full_version} detectado en venv: {venv_python}")
-                        
-                        return details
-                        
-            except subprocess.TimeoutExpired:
+            # pyvenv.cfg ya registra la versión: evita arrancar un intérprete
+            full_version = _read_pyvenv_version(venv_dir)
+            if full_version:
                 if verbose:
-                    print(f"Timeout al ejecutar Python en venv: {venv_python}")
-            except Exception as e:
+                    print(f"Versión leída de {os.path.join(venv_dir, 'pyvenv.cfg')}")
+            else:
+                try:
+                    interpreter = _query_interpreter(venv_python)
+                    if interpreter:
+                        full_version = interpreter[0]
+                            
+                except subprocess.TimeoutExpired:
+                    if verbose:
+                        print(f"Timeout al ejecutar Python en venv: {venv_python}")
+                except Exception as e:
+                    if verbose:
+                        print(f"Error al detectar versión de Python en venv: {e}")
+            
+            if full_version:
+                _fill_python(details, full_version, "venv", is_venv=True,
+                             python_path=os.path.abspath(venv_python), venv_path=os.path.abspath(venv_dir))
+                
                 if verbose:
-                    print(f"Error al detectar versión de Python en venv: {e}")
+                    print(f"Python {full_version} detectado en venv: {venv_python}")
+                
+                return details
     
     # 2. Parsear archivos de configuración del proyecto
     
@@ -566,27 +1108,18 @@ def detect_python_version(project_path, verbose=False):
     python_version_file = os.path.join(project_path, ".python-version")
     if os.path.exists(python_version_file):
         try:
-            with open(python_version_file, 'r', encoding='utf-8') as f:
-                version_content = f.read().strip()
-                # Puede ser "3.11.5" o "3.11" o incluso "pypy3.9-7.3.9"
-                version_match = re.search(r'^(\d+\.\d+\.?\d*)', version_content)
-                if version_match:
-                    full_version = version_match.group(1)
-                    details["python_version"] = full_version
-                    details["python_source"] = "pyenv"
-                    details["is_venv"] = False
-                    
-                    version_parts = full_version.split('.')
-                    if len(version_parts) >= 1:
-                        details["python_major_version"] = int(version_parts[0])
-                    if len(version_parts) >= 2:
-                        details["python_minor_version"] = int(version_parts[1])
-                    
-                    if verbose:
-                        print(f"Python {full_version} detectado en .python-version")
-                    
-                    return details
-                    
+            version_content = _read_text_cached(python_version_file).strip()
+            # Puede ser "3.11.5" o "3.11" o incluso "pypy3.9-7.3.9"
+            version_match = _RE_SEMVER.match(version_content)
+            if version_match:
+                full_version = version_match.group(0)
+                _fill_python(details, full_version, "pyenv", version_match=version_match)
+                
+                if verbose:
+                    print(f"Python {full_version} detectado en .python-version")
+                
+                return details
+                
         except Exception as e:
             if verbose:
                 print(f"Error leyendo .python-version: {e}")
@@ -595,37 +1128,22 @@ def detect_python_version(project_path, verbose=False):
     pyproject_path = os.path.join(project_path, "pyproject.toml")
     if os.path.exists(pyproject_path):
         try:
-            with open(pyproject_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-                # Buscar requires-python = ">=3.8" o python = "^3.9"
-                requires_match = re.search(r'requires-python\s*=\s*["\']([^"\']+)["\']', content)
-                if not requires_match:
-                    # Poetry usa python = "^3.9" en [tool.poetry.dependencies]
-                    requires_match = re.search(r'\[tool\.poetry\.dependencies\][^\[]*python\s*=\s*["\']([^"\']+)["\']', content, re.DOTALL)
-                
-                if requires_match:
-                    version_spec = requires_match.group(1)
-                    # Extraer versión de especificadores como ">=3.8", "^3.9", "~3.10"
-                    version_match = re.search(r'(\d+\.\d+\.?\d*)', version_spec)
-                    if version_match:
-                        full_version = version_match.group(1)
-                        details["python_version_required"] = version_spec
-                        details["python_version"] = full_version
-                        details["python_source"] = "pyproject"
-                        details["is_venv"] = False
-                        
-                        version_parts = full_version.split('.')
-                        if len(version_parts) >= 1:
-                            details["python_major_version"] = int(version_parts[0])
-                        if len(version_parts) >= 2:
-                            details["python_minor_version"] = int(version_parts[1])
-                        
-                        if verbose:
-                            print(f"Python {full_version} requerido en pyproject.toml ({version_spec})")
-                        
-                        return details
-                        
+            # Buscar requires-python = ">=3.8" o python = "^3.9"
+            # (Poetry usa python = "^3.9" en [tool.poetry.dependencies])
+            version_spec = _pyproject_python_spec(pyproject_path)
+            if version_spec:
+                # Extraer versión de especificadores como ">=3.8", "^3.9", "~3.10"
+                version_match = _RE_SEMVER.search(version_spec)
+                if version_match:
+                    full_version = version_match.group(0)
+                    _fill_python(details, full_version, "pyproject", version_match=version_match,
+                                 version_required=version_spec)
+                    
+                    if verbose:
+                        print(f"Python {full_version} requerido en pyproject.toml ({version_spec})")
+                    
+                    return details
+                    
         except Exception as e:
             if verbose:
                 print(f"Error leyendo pyproject.toml: {e}")
@@ -634,28 +1152,16 @@ def detect_python_version(project_path, verbose=False):
     pipfile_path = os.path.join(project_path, "Pipfile")
     if os.path.exists(pipfile_path):
         try:
-            with open(pipfile_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Buscar python_version = "3.9" en sección [requires]
+            full_version = _pipfile_python_version(pipfile_path)
+            if full_version:
+                _fill_python(details, full_version, "pipfile")
+                
+                if verbose:
+                    print(f"Python {full_version} requerido en Pipfile")
+                
+                return details
                 
-                # Buscar python_version = "3.9" en sección [requires]
-                requires_section = re.search(r'\[requires\][^\[]*python_version\s*=\s*["\']([^"\']+)["\']', content, re.DOTALL)
-                if requires_section:
-                    full_version = requires_section.group(1)
-                    details["python_version"] = full_version
-                    details["python_source"] = "pipfile"
-                    details["is_venv"] = False
-                    
-                    version_parts = full_version.split('.')
-                    if len(version_parts) >= 1:
-                        details["python_major_version"] = int(version_parts[0])
-                    if len(version_parts) >= 2:
-                        details["python_minor_version"] = int(version_parts[1])
-                    
-                    if verbose:
-                        print(f"Python {full_version} requerido en Pipfile")
-                    
-                    return details
-                    
         except Exception as e:
             if verbose:
                 print(f"Error leyendo Pipfile: {e}")
@@ -664,88 +1170,59 @@ def detect_python_version(project_path, verbose=False):
     setup_py_path = os.path.join(project_path, "setup.py")
     if os.path.exists(setup_py_path):
         try:
-            with open(setup_py_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-                # Buscar python_requires='>=3.7'
-                requires_match = re.search(r'python_requires\s*=\s*["\']([^"\']+)["\']', content)
-                if requires_match:
-                    version_spec = requires_match.group(1)
-                    version_match = re.search(r'(\d+\.\d+\.?\d*)', version_spec)
-                    if version_match:
-                        full_version = version_match.group(1)
-                        details["python_version_required"] = version_spec
-                        details["python_version"] = full_version
-                        details["python_source"] = "setup.py"
-                        details["is_venv"] = False
-                        
-                        version_parts = full_version.split('.')
-                        if len(version_parts) >= 1:
-                            details["python_major_version"] = int(version_parts[0])
-                        if len(version_parts) >= 2:
-                            details["python_minor_version"] = int(version_parts[1])
-                        
-                        if verbose:
-                            print(f"Python {full_version} requerido en setup.py ({version_spec})")
-                        
-                        return details
-                        
+            content = _read_text_cached(setup_py_path)
+            
+            # Buscar python_requires='>=3.7'
+            requires_match = _RE_SETUP_PY_REQUIRES.search(content)
+            if requires_match:
+                version_spec = requires_match.group(1)
+                version_match = _RE_SEMVER.search(version_spec)
+                if version_match:
+                    full_version = version_match.group(0)
+                    _fill_python(details, full_version, "setup.py", version_match=version_match,
+                                 version_required=version_spec)
+                    
+                    if verbose:
+                        print(f"Python {full_version} requerido en setup.py ({version_spec})")
+                    
+                    return details
+                    
         except Exception as e:
             if verbose:
                 print(f"Error leyendo setup.py: {e}")
     
     # 3. Fallback: Intérprete del sistema
+    return _detect_system_python(details, verbose)
+
+
+# Campos que _detect_system_python rellena a partir del intérprete del PATH: describen la máquina,
+# no el proyecto, así que el caché persistente no guarda sus valores (ver analyze_project)
+SYSTEM_PYTHON_FIELDS = ("python_version", "python_path", "is_venv", "python_major_version", "python_minor_version")
+
+def _detect_system_python(details, verbose=False):
+    """
+    Rellena details con la versión y la ruta del intérprete de Python del sistema (python3/python).
+    
+    Returns:
+        details, sin cambios si no se encuentra ningún intérprete
+    """
+    is_windows = sys.platform == 'win32'
     python_commands = ['python3', 'python'] if not is_windows else ['python', 'python3']
     
     for python_cmd in python_commands:
         try:
-            # Obtener versión
-            result = subprocess.run(
-                [python_cmd, '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                shell=False
-            )
-            
-            if result.returncode == 0:
-                version_output = result.stdout.strip() or result.stderr.strip()
-                version_match = re.search(r'Python\s+(\d+\.\d+\.?\d*)', version_output)
+            # Obtener versión y ruta del ejecutable en una sola invocación
+            interpreter = _query_interpreter(python_cmd)
+            if interpreter:
+                full_version, python_path = interpreter
+                
+                _fill_python(details, full_version, "system", python_path=python_path or python_cmd)
+                
+                if verbose:
+                    print(f"Python {full_version} detectado en sistema: {details['python_path']}")
+                
+                return details
                 
-                if version_match:
-                    full_version = version_match.group(1)
-                    
-                    # Obtener ruta del ejecutable
-                    which_cmd = 'where' if is_windows else 'which'
-                    path_result = subprocess.run(
-                        [which_cmd, python_cmd],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                        shell=False
-                    )
-                    
-                    python_path = None
-                    if path_result.returncode == 0:
-                        # En Windows, 'where' puede devolver múltiples líneas
-                        python_path = path_result.stdout.strip().split('\n')[0].strip()
-                    
-                    details["python_version"] = full_version
-                    details["python_path"] = python_path if python_path else python_cmd
-                    details["python_source"] = "system"
-                    details["is_venv"] = False
-                    
-                    version_parts = full_version.split('.')
-                    if len(version_parts) >= 1:
-                        details["python_major_version"] = int(version_parts[0])
-                    if len(version_parts) >= 2:
-                        details["python_minor_version"] = int(version_parts[1])
-                    
-                    if verbose:
-                        print(f"Python {full_version} detectado en sistema: {details['python_path']}")
-                    
-                    return details
-                    
         except subprocess.TimeoutExpired:
             if verbose:
                 print(f"Timeout al ejecutar {python_cmd}")
@@ -762,7 +1239,42 @@ def detect_python_version(project_path, verbose=False):
     return details
 
 
-def check_python(project_path, verbose=False):
+# Common non-source directories skipped when looking for .py files
+PYTHON_SCAN_EXCLUDES = frozenset({"venv", ".venv", "env", "__pycache__", ".git", "node_modules"})
+
+def _has_python_files(project_path, limit):
+    """Tells whether the project holds at least limit .py files, stopping the walk as soon as it does.
+
+    The root is listed first: its .py files often settle the question, and when it only
+    contains files or skipped directories (venv, .git, ...) nothing below it is read.
+    Every directory listed is recorded as a dependency of check_python (see _scan_project).
+    """
+    python_files_found = 0
+    subdirs = []
+    _record_dependency(project_path)
+    try:
+        with os.scandir(project_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in PYTHON_SCAN_EXCLUDES:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    python_files_found += 1
+    except OSError:
+        return False
+    if python_files_found >= limit:
+        return True
+
+    for subdir in subdirs:
+        for _, name in _scan_project(subdir, PYTHON_SCAN_EXCLUDES):
+            if name.endswith('.py'):
+                python_files_found += 1
+                if python_files_found >= limit:
+                    return True
+    return False
+
+@_cached_detector(*PYTHON_FINGERPRINT_PATHS)
+def check_python(project_path, verbose=False, root_entries=None):
     """Checks for indicators of a Python project."""
     details = {}
     
@@ -772,27 +1284,14 @@ def check_python(project_path, verbose=False):
         "Pipfile", "poetry.lock", "manage.py", "app.py", "main.py"
     ]
     
-    found_indicators = []
-    for indicator in indicators:
-        if os.path.exists(os.path.join(project_path, indicator)):
-            found_indicators.append(indicator)
+    # One directory read answers every "does X exist in the root" question below
+    root_names = _root_names(project_path, root_entries)
+    found_indicators = [indicator for indicator in indicators if indicator in root_names]
     
     if not found_indicators:
         # Check for .py files in root or common directories
-        python_files_found = 0
-        for root, dirs, files in os.walk(project_path):
-            # Skip common non-source directories
-            dirs[:] = [d for d in dirs if d not in ['venv', '.venv', 'env', '__pycache__', '.git', 'node_modules']]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    python_files_found += 1
-                    if python_files_found >= 3:  # If we find 3+ Python files, likely a Python project
-                        break
-            if python_files_found >= 3:
-                break
-        
-        if python_files_found < 3:
+        # If we find 3+ Python files, likely a Python project
+        if not _has_python_files(project_path, 3):
             return None, {}
     
     if verbose and found_indicators:
@@ -809,33 +1308,35 @@ def check_python(project_path, verbose=False):
         details["is_django"] = True
         if verbose: print("Django project detected (manage.py found)")
         
-        # Look for Django settings
+        # Look for Django settings. The cached result depends on every directory listed on the way
+        # (a settings.py added to one of them would be found first) and on the file's content.
         for root, dirs, files in os.walk(project_path):
+            _record_dependency(root)
             if 'settings.py' in files:
+                _record_dependency(os.path.join(root, 'settings.py'))
                 details["django_settings_path"] = os.path.join(root, 'settings.py')
                 if verbose: print(f"Django settings found at: {os.path.join(root, 'settings.py')}")
                 
                 # Try to read settings for version detection
                 try:
-                    with open(os.path.join(root, 'settings.py'), 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        if 'DEBUG = True' in content:
-                            details["debug_enabled"] = True
-                            if verbose: print("WARNING: DEBUG=True found in settings")
-                        
-                        # Check for database configuration
-                        if 'sqlite3' in content:
-                            details["database_sqlite"] = True
-                        elif 'postgresql' in content or 'psycopg' in content:
-                            details["database_postgresql"] = True
-                        elif 'mysql' in content:
-                            details["database_mysql"] = True
+                    markers = _file_markers(os.path.join(root, 'settings.py'), _RE_DJANGO_SETTINGS)
+                    if "debug" in markers:
+                        details["debug_enabled"] = True
+                        if verbose: print("WARNING: DEBUG=True found in settings")
+                    
+                    # Check for database configuration
+                    if "sqlite" in markers:
+                        details["database_sqlite"] = True
+                    elif "postgresql" in markers:
+                        details["database_postgresql"] = True
+                    elif "mysql" in markers:
+                        details["database_mysql"] = True
+                    
+                    # Check for SECRET_KEY
+                    if "secret_key" in markers:
+                        details["hardcoded_secret_key"] = True
+                        if verbose: print("WARNING: Hardcoded SECRET_KEY detected")
                         
-                        # Check for SECRET_KEY
-                        if re.search(r"SECRET_KEY\s*=\s*['\"][\w\-]+['\"]", content):
-                            details["hardcoded_secret_key"] = True
-                            if verbose: print("WARNING: Hardcoded SECRET_KEY detected")
-                            
                 except Exception as e:
                     if verbose: print(f"Error reading settings.py: {e}")
                 break
@@ -844,87 +1345,71 @@ def check_python(project_path, verbose=False):
     if "app.py" in found_indicators:
         # Additional check to confirm it's Flask
         try:
-            with open(os.path.join(project_path, "app.py"), 'r', encoding='utf-8') as f:
-                content = f.read()
-                if 'from flask import' in content or 'import flask' in content:
-                    frameworks_detected.append("Flask")
-                    details["is_flask"] = True
-                    if verbose: print("Flask project detected")
-                    
-                    # Check for debug mode
-                    if 'debug=True' in content or 'app.debug = True' in content:
-                        details["debug_enabled"] = True
-                        if verbose: print("WARNING: Flask debug mode enabled")
+            markers = _file_markers(os.path.join(project_path, "app.py"), _RE_FLASK_APP)
+            if "flask" in markers:
+                frameworks_detected.append("Flask")
+                details["is_flask"] = True
+                if verbose: print("Flask project detected")
+                
+                # Check for debug mode
+                if "debug" in markers:
+                    details["debug_enabled"] = True
+                    if verbose: print("WARNING: Flask debug mode enabled")
         except Exception as e:
             if verbose: print(f"Error reading app.py: {e}")
     
     # Check for FastAPI
     if "main.py" in found_indicators:
         try:
-            with open(os.path.join(project_path, "main.py"), 'r', encoding='utf-8') as f:
-                content = f.read()
-                if 'from fastapi import' in content or 'import fastapi' in content:
-                    frameworks_detected.append("FastAPI")
-                    details["is_fastapi"] = True
-                    if verbose: print("FastAPI project detected")
+            content = _read_text_cached(os.path.join(project_path, "main.py"))
+            if 'from fastapi import' in content or 'import fastapi' in content:
+                frameworks_detected.append("FastAPI")
+                details["is_fastapi"] = True
+                if verbose: print("FastAPI project detected")
         except Exception as e:
             if verbose: print(f"Error reading main.py: {e}")
     
     # Parse requirements.txt for dependencies and versions
     if "requirements.txt" in found_indicators:
         try:
-            with open(os.path.join(project_path, "requirements.txt"), 'r', encoding='utf-8') as f:
-                content = f.read()
-                requirements = []
-                for line in content.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        requirements.append(line)
-                
-                details["requirements"] = requirements
-                if verbose: print(f"Found {len(requirements)} requirements")
-                
-                # Check for specific risky dependencies
-                risky_packages = []
-                for req in requirements:
-                    req_lower = req.lower()
-                    if 'django==' in req_lower:
-                        version_match = re.search(r'django==([0-9.]+)', req_lower)
-                        if version_match:
-                            details["django_version"] = version_match.group(1)
-                    elif 'flask==' in req_lower:
-                        version_match = re.search(r'flask==([0-9.]+)', req_lower)
-                        if version_match:
-                            details["flask_version"] = version_match.group(1)
-                    elif 'fastapi==' in req_lower:
-                        version_match = re.search(r'fastapi==([0-9.]+)', req_lower)
-                        if version_match:
-                            details["fastapi_version"] = version_match.group(1)
-                    elif any(risky in req_lower for risky in ['pycrypto', 'md5', 'pickle']):
-                        risky_packages.append(req)
-                
-                if risky_packages:
-                    details["risky_packages"] = risky_packages
-                    if verbose: print(f"WARNING: Risky packages detected: {risky_packages}")
-                        
+            content = _read_text_cached(os.path.join(project_path, "requirements.txt"))
+            requirements = [line for line in map(str.strip, content.split('\n'))
+                            if line and not line.startswith('#')]
+            
+            details["requirements"] = requirements
+            if verbose: print(f"Found {len(requirements)} requirements")
+            
+            # Check for specific risky dependencies
+            risky_packages = []
+            for req in requirements:
+                req_lower = req.lower()
+                # One scan per line for django/flask/fastapi pins -> "<name>_version"
+                pin_match = _RE_FRAMEWORK_PIN.search(req_lower)
+                if pin_match:
+                    if pin_match.group(2):
+                        details[f"{pin_match.group(1)}_version"] = pin_match.group(2)
+                elif _RE_RISKY_PACKAGE.search(req_lower):
+                    risky_packages.append(req)
+            
+            if risky_packages:
+                details["risky_packages"] = risky_packages
+                if verbose: print(f"WARNING: Risky packages detected: {risky_packages}")
+                    
         except Exception as e:
             if verbose: print(f"Error reading requirements.txt: {e}")
     
     # Parse pyproject.toml for Poetry projects
     if "pyproject.toml" in found_indicators:
         try:
-            with open(os.path.join(project_path, "pyproject.toml"), 'r', encoding='utf-8') as f:
-                content = f.read()
-                details["is_poetry"] = True
-                if verbose: print("Poetry project detected (pyproject.toml found)")
-                
-                # Simple regex to extract dependencies (basic implementation)
-                django_match = re.search(r'django\s*=\s*"([^"]+)"', content, re.IGNORECASE)
-                if django_match:
-                    details["django_version"] = django_match.group(1)
-                    if "Django" not in frameworks_detected:
-                        frameworks_detected.append("Django")
-                        details["is_django"] = True
+            details["is_poetry"] = True
+            if verbose: print("Poetry project detected (pyproject.toml found)")
+            
+            django_version = _poetry_django_version(os.path.join(project_path, "pyproject.toml"))
+            if django_version:
+                details["django_version"] = django_version
+                if "Django" not in frameworks_detected:
+                    frameworks_detected.append("Django")
+                    details["is_django"] = True
                         
         except Exception as e:
             if verbose: print(f"Error reading pyproject.toml: {e}")
@@ -932,36 +1417,35 @@ def check_python(project_path, verbose=False):
     # Parse Pipfile for Pipenv projects  
     if "Pipfile" in found_indicators:
         try:
-            with open(os.path.join(project_path, "Pipfile"), 'r', encoding='utf-8') as f:
-                content = f.read()
-                details["is_pipenv"] = True
-                if verbose: print("Pipenv project detected (Pipfile found)")
-                
-                # Check for Django in Pipfile
-                if 'django' in content.lower():
-                    if "Django" not in frameworks_detected:
-                        frameworks_detected.append("Django")
-                        details["is_django"] = True
-                        
+            content = _read_text_cached(os.path.join(project_path, "Pipfile"))
+            details["is_pipenv"] = True
+            if verbose: print("Pipenv project detected (Pipfile found)")
+            
+            # Check for Django in Pipfile
+            if 'django' in content.lower():
+                if "Django" not in frameworks_detected:
+                    frameworks_detected.append("Django")
+                    details["is_django"] = True
+                    
         except Exception as e:
             if verbose: print(f"Error reading Pipfile: {e}")
     
     # Check for common Python web server configurations
     wsgi_files = ["wsgi.py", "asgi.py"]
     for wsgi_file in wsgi_files:
-        if os.path.exists(os.path.join(project_path, wsgi_file)):
+        if wsgi_file in root_names:
             details[f"has_{wsgi_file.split('.')[0]}"] = True
             if verbose: print(f"WSGI/ASGI configuration found: {wsgi_file}")
     
     # Check for testing frameworks
     test_files = ["pytest.ini", "tox.ini", "conftest.py"]
     for test_file in test_files:
-        if os.path.exists(os.path.join(project_path, test_file)):
+        if test_file in root_names:
             details[f"has_{test_file.split('.')[0]}"] = True
             if verbose: print(f"Testing configuration found: {test_file}")
     
     # Check for Docker
-    if os.path.exists(os.path.join(project_path, "Dockerfile")):
+    if "Dockerfile" in root_names:
         details["has_docker"] = True
         if verbose: print("Docker configuration found")
     
@@ -970,7 +1454,7 @@ def check_python(project_path, verbose=False):
         print(f"Python frameworks detected: {', '.join(frameworks_detected)}")
     
     # Detectar versión de Python y ruta
-    python_version_info = detect_python_version(project_path, verbose)
+    python_version_info = detect_python_version(project_path, verbose, root_entries=root_names)
     if python_version_info:
         details.update(python_version_info)
         if verbose and python_version_info.get("python_version"):
@@ -1001,39 +1485,177 @@ PROJECT_CHECKERS = [
     check_gitlab_ci,        # Just checks for the .gitlab-ci.yml file (could be part of any project)
 ]
 
-def analyze_project(project_path, verbose=False):
-    """Analyzes the project at the given path to determine its type and technologies."""
+def _run_checker(checker_func, project_path, verbose, root_entries=None):
+    """Runs one checker, turning any exception into a (None, {}) result.
+
+    Returns (result, dependencies): the files the checker recorded with _record_dependency.
+    """
+    with _recording_dependencies() as recorded:
+        try:
+            result = checker_func(project_path, verbose, root_entries=root_entries)
+        except Exception as e:
+            if verbose:
+                print(f"Error during project analysis with {checker_func.__name__}: {e}")
+            result = None, {}
+    return result, tuple(recorded)
+
+# Project root entries a checker needs at least one of before it can match. Checkers not
+# listed (check_vue, check_python) may also match on files deeper in the tree, so they always run.
+CHECKER_TRIGGERS = {
+    check_spring_boot: frozenset({"pom.xml", "build.gradle", "src"}),
+    check_java_legacy: frozenset({"src", "WebContent"}),
+    check_angular: frozenset({"angular.json", "package.json"}),
+    check_gitlab_ci: frozenset({".gitlab-ci.yml"}),
+}
+
+def _candidate_checkers(root_names):
+    """Returns the PROJECT_CHECKERS (in priority order) whose trigger entries are among root_names."""
+    return [checker_func for checker_func in PROJECT_CHECKERS
+            if checker_func not in CHECKER_TRIGGERS or not CHECKER_TRIGGERS[checker_func].isdisjoint(root_names)]
+
+# Checkers that may walk the whole tree (or, for check_python, start the interpreter). They
+# only run once every checker ranked above them has ruled its type out, even when parallel.
+DEFERRED_CHECKERS = frozenset({check_java_legacy, check_vue, check_python})
+
+def _checker_results(checkers, project_path, verbose, parallel, root_entries=None):
+    """Yields (checker_func, (result, dependencies)) in checkers order.
+
+    If parallel, the checkers outside DEFERRED_CHECKERS start at once in threads; the
+    deferred ones run in the calling thread when their turn comes.
+    """
+    eager = [checker_func for checker_func in checkers if checker_func not in DEFERRED_CHECKERS]
+    if not parallel or len(eager) <= 1:
+        for checker_func in checkers:
+            yield checker_func, _run_checker(checker_func, project_path, verbose, root_entries)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=len(eager))
+    # Each thread runs in a copy of the caller's context, which carries _BYPASS_CACHES
+    futures = {checker_func: executor.submit(contextvars.copy_context().run,
+                                             _run_checker, checker_func, project_path, verbose, root_entries)
+               for checker_func in eager}
+    try:
+        for checker_func in checkers:
+            future = futures.get(checker_func)
+            if future is None:
+                yield checker_func, _run_checker(checker_func, project_path, verbose, root_entries)
+            else:
+                yield checker_func, future.result()
+    finally:
+        # Once the consumer stops at a match, lower-priority checkers cannot change the
+        # answer: cancel those not yet started. The running ones are not waited for, except
+        # with verbose: their prints must not outlive the caller's stdout redirection.
+        for future in futures.values():
+            future.cancel()
+        executor.shutdown(wait=verbose)
+
+def detect_all(project_path, verbose=False, parallel=True):
+    """Runs every checker in PROJECT_CHECKERS and returns the first match by priority.
+
+    The checkers are independent and I/O-bound (XML/JSON parsing of root files), so by
+    default they run concurrently in threads to overlap their filesystem latency. The
+    DEFERRED_CHECKERS, which walk the tree, are the exception: one only starts after
+    every checker ranked above it found nothing, so a higher-ranked match never pays for it.
+    Results are still consumed in priority order, and the call returns as soon as every
+    checker ranked at or above the first match has finished (with verbose, once every
+    started checker has finished, so none prints after it returns). parallel=False runs them
+    one after another in the calling thread. Checkers whose CHECKER_TRIGGERS are all
+    absent from the project root cannot match and are skipped. The root is listed once
+    and that snapshot is handed to every checker as root_entries. The dependencies of
+    the checkers consulted up to the match go to the caller's recording.
+    """
+    root_entries = _dir_names(project_path)
+    checkers = _candidate_checkers(root_entries)
+    if verbose:
+        skipped = [checker_func.__name__ for checker_func in PROJECT_CHECKERS if checker_func not in checkers]
+        if skipped:
+            print(f"Skipping checkers without trigger files: {', '.join(skipped)}")
+    results = _checker_results(checkers, project_path, verbose, parallel, root_entries)
+    try:
+        for checker_func, ((project_type, tech_details), dependencies) in results:
+            _record_dependencies(dependencies)
+            if project_type:
+                if verbose:
+                    print(f"Checker '{checker_func.__name__}' identified project type: {project_type} with details: {tech_details}")
+                return project_type, dict(tech_details)
+    finally:
+        results.close()
+    return None, {}
+
+def clear_analysis_cache():
+    """Drops every memoized detector result and parsed build file, forcing a fresh analysis."""
+    _DETECTOR_CACHE.clear()
+    _POM_CACHE.clear()
+    _GRADLE_CACHE.clear()
+    _JSON_CACHE.clear()
+    _TEXT_CACHE.clear()
+    _load_toml.cache_clear()
+
+def _analysis_fingerprint(project_path):
+    """Fingerprints every file and directory any checker depends on, for the persistent cache."""
+    extra_paths = []
+    for checker_func in PROJECT_CHECKERS:
+        for parts in getattr(checker_func, "fingerprint_paths", ()):
+            if parts not in extra_paths:
+                extra_paths.append(parts)
+    return _build_fingerprint(project_path, extra_paths)
+
+def _refresh_system_python(details, verbose=False):
+    """Fills the SYSTEM_PYTHON_FIELDS of a persisted result from the interpreter on PATH now."""
+    if details.get("python_source") != "system":
+        return details
+    system = _detect_system_python({}, verbose)
+    for field in SYSTEM_PYTHON_FIELDS + ("python_source",):
+        # Assigned in place (the persisted entry keeps the keys): same key order as a fresh analysis
+        if field in system:
+            details[field] = system[field]
+        else:
+            details.pop(field, None)
+    return details
+
+def analyze_project(project_path, verbose=False, use_cache=True, parallel=True):
+    """Analyzes the project at the given path to determine its type and technologies.
+
+    Checker results are memoized on the mtimes of the files they read, in memory and
+    on disk (see core.cache) so a new process reuses them. use_cache=False analyzes
+    from scratch without reading them; its fresh results still replace them, and
+    analyses running in other threads keep using them (clear_analysis_cache drops
+    them for everyone). The persisted entry leaves out the fields taken from the
+    system interpreter, which are queried again when it is loaded.
+    parallel=False runs the checkers sequentially (see detect_all). The files the
+    analysis depends on go to the caller's recording (see _recording_dependencies).
+    """
     if not os.path.isdir(project_path):
         if verbose: print(f"Error: Project path {project_path} is not a directory.")
         return None, {}
 
+    cache_key = cache.make_key(project_path)
+    fingerprint = _analysis_fingerprint(project_path)
+    if use_cache:
+        cached = cache.load(cache_key, fingerprint)
+        if cached is not None:
+            dependencies, project_type, details = cached
+            if _dependencies_unchanged(dependencies):
+                if verbose: print(f"Project files unchanged, using persisted analysis for: {project_path}")
+                _record_dependencies(dependencies)
+                return project_type, _refresh_system_python(details, verbose)
+
     if verbose:
         print(f"Starting project analysis for: {project_path}")
 
     # For GitLab CI, it can coexist with other project types. 
     # We should run its check independently and potentially merge results or offer multiple rule sets.
     # For now, if gitlab-ci.yml is found, it will be one of the types. 
-    # The main loop will find the *first* matching primary project type.
+    # detect_all returns the *first* matching primary project type in PROJECT_CHECKERS order.
     
-    detected_project_type = None
-    detected_technologies = {}
-
-    for checker_func in PROJECT_CHECKERS:
-        try:
-            project_type, tech_details = checker_func(project_path, verbose)
-            if project_type:
-                if verbose: 
-                    print(f"Checker '{checker_func.__name__}' identified project type: {project_type} with details: {tech_details}")
-                # First primary type found wins for now. 
-                # GitLab CI is special, if we want it to be additive, logic needs adjustment.
-                # Current setup: if check_gitlab_ci is before others and finds it, it might return 'gitlab_ci' as the primary type.
-                # Order in PROJECT_CHECKERS matters.
-                detected_project_type = project_type
-                detected_technologies.update(tech_details) # Merge details, though only first type is returned
-                break # Stop at first match
-        except Exception as e:
-            if verbose:
-                print(f"Error during project analysis with {checker_func.__name__}: {e}")
+    bypass_token = _BYPASS_CACHES.set(not use_cache)
+    try:
+        with _recording_dependencies() as recorded:
+            detected_project_type, detected_technologies = detect_all(project_path, verbose, parallel)
+    finally:
+        _BYPASS_CACHES.reset(bypass_token)
+    dependencies = tuple(dict.fromkeys(recorded))
+    _record_dependencies(dependencies)
     
     # Special handling for gitlab_ci: it can be a standalone type or complementary.
     # If another type was detected, we still check for gitlab_ci and add its rules if requested via --type
@@ -1042,6 +1664,13 @@ def analyze_project(project_path, verbose=False):
     # The current PROJECT_CHECKERS order might make gitlab_ci a primary type if its file is found and it's checked early.
     # Consider making gitlab_ci detection separate if it's always additive.
 
+    persisted_details = detected_technologies
+    if detected_technologies.get("python_source") == "system":
+        persisted_details = dict(detected_technologies, **{
+            field: None for field in SYSTEM_PYTHON_FIELDS if field in detected_technologies
+        })
+    cache.save(cache_key, fingerprint, (dependencies, detected_project_type, persisted_details))
+
     if detected_project_type:
         if verbose: print(f"Analysis complete. Final detected type: {detected_project_type}, Tech: {detected_technologies}")
         return detected_project_type, detected_technologies
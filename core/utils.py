@@ -1,44 +1,58 @@
+import functools
 import json
+import logging
 import os
 import re
 
+# Parser tracing, off unless the application enables DEBUG for this logger
+logger = logging.getLogger(__name__)
+
+# JSON: orjson when installed (parses the raw bytes and serializes in one pass), else the stdlib.
+# orjson's decode and encode errors subclass json.JSONDecodeError and TypeError.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Markdown header lines ("# aiPrompt", "## find") in a multi-line text, compiled once at import
+# time; [^\S\n] keeps a header on its own line
+_RE_MD_HEADERS = re.compile(r'^#+[^\S\n]+(.+)', re.MULTILINE)
+
 def _parse_md_content(content):
     """Parses raw markdown content into a dictionary."""
-    print("[DEBUG] _parse_md_content: Starting to parse content.")
+    logger.debug("_parse_md_content: Starting to parse content.")
     rules = {}
-    current_section = None
-    section_content = ""
-
-    for line in content.splitlines():
-        print(f"[DEBUG]  - Processing line: {repr(line)}")
-        # Check for a section header (e.g., # aiPrompt, ## find)
-        header_match = re.match(r'^#+\s+(.+)', line)
-        if header_match:
-            print(f"[DEBUG]    -> Matched header.")
-            # If we were in a section, save its content before starting a new one
-            if current_section and section_content:
-                print(f"[DEBUG]    -> Saving previous section '{current_section}'.")
-                rules[current_section] = section_content.strip()
-
-            current_section = header_match.group(1).strip()
-            section_content = ""
-            print(f"[DEBUG]    -> Started new section '{current_section}'.")
-        elif current_section:
-            # Append the line to the current section's content
-            section_content += line + "\n"
-
-    # Save the last section's content
-    if current_section and section_content:
-        print(f"[DEBUG]  - Saving final section '{current_section}'.")
-        rules[current_section] = section_content.strip()
-
-    print(f"[DEBUG] _parse_md_content: Raw parsed rules before list processing: {rules}")
+    # One pass of the header pattern over the whole text; sections are the slices between
+    # headers. Lines are rejoined with "\n" first, so every splitlines() boundary counts.
+    text = "\n".join(content.splitlines())
+    headers = list(_RE_MD_HEADERS.finditer(text))
+
+    for index, header_match in enumerate(headers):
+        section = header_match.group(1).strip()
+        logger.debug(" - Found section '%s'.", section)
+        if not section:
+            continue
+        # The section's lines run up to the next header (or the end of the text)
+        body_start = header_match.end() + 1
+        body_end = headers[index + 1].start() if index + 1 < len(headers) else len(text) + 1
+        if body_start < body_end:
+            logger.debug("   -> Saving section '%s'.", section)
+            rules[section] = text[body_start:body_end].strip()
+
+    logger.debug("_parse_md_content: Raw parsed rules before list processing: %s", rules)
 
     # Post-process sections that should be lists
     for key in ['ignorePaths', 'find', 'symbols']:
         if key in rules and isinstance(rules[key], str):
-            # Split by lines, filter out empty ones, and remove markdown list markers
-            list_items = [re.sub(r'^\s*-\s*', '', item).strip() for item in rules[key].splitlines() if item.strip()]
+            # Split by lines, filter out empty ones, and remove markdown list markers ("- ")
+            list_items = []
+            for item in rules[key].splitlines():
+                item = item.strip()
+                if not item:
+                    continue
+                if item.startswith('-'):
+                    item = item[1:].lstrip()
+                list_items.append(item)
             
             # For find/symbols, which are lists of objects, we need more structure.
             # Let's assume a simple format for now: each line is a string.
@@ -47,9 +61,10 @@ def _parse_md_content(content):
                 processed_items = []
                 for item in list_items:
                     # Assuming format "label: description" or "label:: description"
-                    match = re.match(r'([^:]+):{1,2}\s*(.*)', item)
-                    if match:
-                        label, desc = match.groups()
+                    label, sep, desc = item.partition(':')
+                    if sep and label:
+                        if desc.startswith(':'):
+                            desc = desc[1:]
                         processed_items.append({"label": label.strip(), "description": desc.strip()})
                     else:
                         processed_items.append({"description": item})
@@ -57,78 +72,169 @@ def _parse_md_content(content):
             else: # ignorePaths
                  rules[key] = list_items
 
-    print(f"[DEBUG] _parse_md_content: Final parsed rules: {rules}")
+    logger.debug("_parse_md_content: Final parsed rules: %s", rules)
     return rules
 
 
-def _format_md_content(data):
-    """Formats a dictionary into a markdown string."""
-    content = ""
+def _iter_md_content(data):
+    """Yields the markdown of a rules dictionary fragment by fragment (see _format_md_content)."""
     if 'aiPrompt' in data:
-        content += f"# aiPrompt\n{data['aiPrompt']}\n\n"
+        # The prompt can be long: hand it over as is rather than copying it into a new f-string
+        yield "# aiPrompt\n"
+        yield str(data['aiPrompt'])
+        yield "\n\n"
 
     if 'ignorePaths' in data and data['ignorePaths']:
-        content += "# ignorePaths\n"
+        yield "# ignorePaths\n"
         for item in data['ignorePaths']:
-            content += f"- {item}\n"
-        content += "\n"
+            yield f"- {item}\n"
+        yield "\n"
 
     # For find and symbols, we format them back from the dict structure.
     if 'find' in data and data['find']:
-        content += "# find\n"
+        yield "# find\n"
         for item in data['find']:
             if "label" in item:
-                content += f"- {item['label']}: {item.get('description', '')}\n"
+                yield f"- {item['label']}: {item.get('description', '')}\n"
             else:
-                content += f"- {item.get('description', '')}\n"
+                yield f"- {item.get('description', '')}\n"
 
-        content += "\n"
+        yield "\n"
 
     if 'symbols' in data and data['symbols']:
-        content += "# symbols\n"
+        yield "# symbols\n"
         for item in data['symbols']:
             if "label" in item:
-                content += f"- {item['label']}: {item.get('description', '')}\n"
+                yield f"- {item['label']}: {item.get('description', '')}\n"
             else:
-                content += f"- {item.get('description', '')}\n"
-        content += "\n"
-        
-    return content
+                yield f"- {item.get('description', '')}\n"
+        yield "\n"
+
+
+def _format_md_content(data):
+    """Formats a dictionary into a markdown string."""
+    return "".join(_iter_md_content(data))
+
+def _split_frontmatter(content):
+    """Splits "---"-delimited YAML frontmatter off content, with str.find instead of a backtracking regex.
+
+    Returns (frontmatter, content), both stripped, or None when there is no frontmatter. Matches
+    what the former r'^\s*---\s*$\n(.*?)\n^\s*---\s*$\n?(.*)' (DOTALL | MULTILINE) pattern did.
+    """
+    start = len(content) - len(content.lstrip())
+    if not content.startswith('---', start):
+        return None
+    # Newlines that may end the opening "---" line: the one after it and those ending the
+    # whitespace-only lines right below it. Like the regex, prefer skipping the most of them.
+    opening_ends = []
+    pos = start + 3
+    while True:
+        newline = content.find('\n', pos)
+        if newline == -1 or content[pos:newline].strip():
+            break
+        opening_ends.append(newline)
+        pos = newline + 1
+    for opening_end in reversed(opening_ends):
+        # The closing "---" line needs a newline of its own after the opening one
+        first_line_start = content.find('\n', opening_end + 1) + 1
+        if not first_line_start:
+            continue
+        dashes = content.find('---', first_line_start)
+        while dashes != -1:
+            line_start = content.rfind('\n', 0, dashes) + 1
+            line_end = content.find('\n', dashes)
+            line = content[line_start:] if line_end == -1 else content[line_start:line_end]
+            if line.strip() == '---':
+                frontmatter_text = content[opening_end + 1:line_start - 1].strip()
+                content_text = '' if line_end == -1 else content[line_end + 1:].strip()
+                return frontmatter_text, content_text
+            if line_end == -1:
+                break
+            dashes = content.find('---', line_end + 1)
+    return None
+
+def _read_file_bytes(file_path, size):
+    """Reads size bytes (the file's stat size) with raw os.read calls, one for a regular file.
+
+    Skips the buffered file object, which only adds overhead for small template and JSON files.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        data = os.read(fd, size)
+        # os.read may return less than asked for (signals, very large files)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+@functools.lru_cache(maxsize=64)
+def _cached_load_mdc(abs_path, mtime_ns, size):
+    """Reads and splits a template file, once per (modification time, size). Raises IOError."""
+    # One read and one decode of the whole file; then the newline translation text mode did
+    content = _read_file_bytes(abs_path, size).decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    
+    # Extract YAML frontmatter if present
+    parts = _split_frontmatter(content)
+    
+    if parts:
+        frontmatter_text, content_text = parts
+        return {
+            'frontmatter': frontmatter_text,
+            'content': content_text
+        }
+    else:
+        # No frontmatter found, return just content
+        return {
+            'frontmatter': None,
+            'content': content.strip()
+        }
 
 def load_mdc_file(file_path):
-    """Loads a template file and returns a dict with frontmatter and content."""
-    if not os.path.exists(file_path):
+    """Loads a template file and returns a dict with frontmatter and content.
+
+    Parsed files are memoized by path, mtime and size; each caller gets its own copy of the dict.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
         return None
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            # Extract YAML frontmatter if present
-            frontmatter_pattern = re.compile(r'^\s*---\s*$\n(.*?)\n^\s*---\s*$\n?(.*)', re.DOTALL | re.MULTILINE)
-            match = frontmatter_pattern.match(content)
-            
-            if match:
-                frontmatter_text = match.group(1).strip()
-                content_text = match.group(2).strip()
-                return {
-                    'frontmatter': frontmatter_text,
-                    'content': content_text
-                }
-            else:
-                # No frontmatter found, return just content
-                return {
-                    'frontmatter': None,
-                    'content': content.strip()
-                }
+        return dict(_cached_load_mdc(os.path.abspath(file_path), st.st_mtime_ns, st.st_size))
     except IOError as e:
         print(f"Error reading file {file_path}: {e}")
         return None
 
+# Directories already created (or found) by _open_for_write in this process
+_ENSURED_DIRS = set()
+
+def _ensure_dir(directory):
+    """Creates directory (and its parents), once per process. "" stands for the current directory."""
+    if directory and directory not in _ENSURED_DIRS:
+        os.makedirs(directory, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+def _open_for_write(file_path, mode, **kwargs):
+    """Opens file_path for writing, creating its parent directory first if needed."""
+    directory = os.path.dirname(file_path)
+    _ensure_dir(directory)
+    try:
+        return open(file_path, mode, **kwargs)
+    except FileNotFoundError:
+        # The directory was removed after it was ensured: create it again
+        _ENSURED_DIRS.discard(directory)
+        _ensure_dir(directory)
+        return open(file_path, mode, **kwargs)
+
 def save_mdc_file(file_path, data):
-    """Saves content to a file. Can handle strings or dicts with frontmatter."""
+    """Saves content to a file. Can handle strings, dicts with frontmatter or rules dicts."""
     try:
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
+        with _open_for_write(file_path, 'w', encoding='utf-8') as f:
             if isinstance(data, dict) and 'frontmatter' in data:
                 # Write with frontmatter
                 if data['frontmatter']:
@@ -136,6 +242,9 @@ def save_mdc_file(file_path, data):
                     f.write(data['frontmatter'])
                     f.write('\n---\n\n')
                 f.write(data.get('content', ''))
+            elif isinstance(data, dict):
+                # Rules dict: stream its markdown to the file instead of building it in memory
+                f.writelines(_iter_md_content(data))
             else:
                 # Treat as plain string
                 f.write(str(data))
@@ -144,14 +253,33 @@ def save_mdc_file(file_path, data):
         print(f"Error writing to {file_path}: {e}")
         return False
 
+def save_mdc_files(items):
+    """Saves (file_path, data) pairs like save_mdc_file. Returns True if every file was saved.
+
+    Creates each distinct parent directory once, parents first, then writes the files grouped
+    by directory.
+    """
+    items = sorted(items, key=lambda item: (os.path.dirname(item[0]), item[0]))
+    directories = {os.path.dirname(file_path) for file_path, _ in items}
+    for directory in sorted(directories, key=len):
+        _ensure_dir(directory)
+    saved = True
+    for file_path, data in items:
+        saved = save_mdc_file(file_path, data) and saved
+    return saved
+
 def load_json_file(file_path):
     """Loads a JSON file and returns its content."""
-    if not os.path.exists(file_path):
+    try:
+        size = os.stat(file_path).st_size
+    except OSError:
         # print(f"Error: File not found at {file_path}") # Decide if utils should print or raise
         return None
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        raw = _read_file_bytes(file_path, size)
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw.decode('utf-8'))
     except json.JSONDecodeError as e:
         print(f"Error decoding JSON from {file_path}: {e}")
         return None
@@ -162,8 +290,13 @@ def load_json_file(file_path):
 def save_json_file(file_path, data):
     """Saves data to a JSON file."""
     try:
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
+        if orjson is not None:
+            # Serialize before opening, so unserializable data leaves no truncated file behind
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            with _open_for_write(file_path, 'wb') as f:
+                f.write(payload)
+            return True
+        with _open_for_write(file_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
         return True
     except IOError as e:
@@ -176,44 +309,35 @@ def save_json_file(file_path, data):
 def merge_rules(base_rules, custom_rules_data):
     """Merges base rules with custom rules. 
        Custom rules can override base rules at the top level (ignorePaths, aiPrompt)
-       or append to lists (find, symbols).
+       or append to lists (find, symbols), where an item overrides the base item with its label.
     """
     if not custom_rules_data:
         return base_rules
 
     merged = base_rules.copy()
 
-    # Top-level string overrides
-    for key in ["aiPrompt"]:
+    # Top-level overrides: aiPrompt, and ignorePaths (replaced as a whole, otherwise keep base)
+    for key in ("aiPrompt", "ignorePaths"):
         if key in custom_rules_data:
             merged[key] = custom_rules_data[key]
-
-    # List appends/overrides for ignorePaths, find, symbols
-    # For find and symbols, we might want to append new items and potentially update existing ones
-    # if an item in custom_rules has a matching "label" or unique identifier.
-    # For simplicity now, we'll append unique items for `find` and `symbols` 
-    # and replace `ignorePaths`.
-
-    if "ignorePaths" in custom_rules_data:
-        # Overwrite ignorePaths if specified in custom, otherwise keep base
-        merged["ignorePaths"] = custom_rules_data["ignorePaths"]
     
-    # For 'find' and 'symbols', append new items. 
-    # A more sophisticated merge could update items if they have a unique identifier.
-    for key in ["find", "symbols"]:
-        if key in custom_rules_data and isinstance(custom_rules_data[key], list):
-            if key not in merged or not isinstance(merged[key], list):
-                merged[key] = [] # Initialize if not present or not a list in base
-            
-            # Simple append of all custom items. 
-            # For a more robust solution, you might want to avoid duplicates based on a specific field within the dicts.
-            for item in custom_rules_data[key]:
-                merged[key].append(item)
+    # For 'find' and 'symbols', a custom item replaces the base item with the same label, in
+    # its position; other custom items are appended. Keyed in one dict: O(n + m), in order.
+    for key in ("find", "symbols"):
+        custom_items = custom_rules_data.get(key)
+        if isinstance(custom_items, list):
+            base_items = merged.get(key)
+            if not isinstance(base_items, list):
+                base_items = [] # Initialize if not present or not a list in base
+            items_by_key = {}
+            for item in base_items + custom_items:
+                label = item.get("label") if isinstance(item, dict) else None
+                # Unlabeled items are never merged: key them by their position
+                items_by_key[("label", label) if label else ("item", len(items_by_key))] = item
+            merged[key] = list(items_by_key.values())
                 
-    # Handle other potential custom rule structures as needed.
-    # For example, if custom_rules_data has other top-level keys not in base_rules.
+    # Add new top-level keys from custom_rules; keys already handled above are kept
     for key, value in custom_rules_data.items():
-        if key not in merged: # Add new keys from custom_rules
-             merged[key] = value
+        merged.setdefault(key, value)
 
     return merged 
\ No newline at end of file
@@ -6,27 +6,179 @@ Implementación de las herramientas (tools) del servidor MCP.
 Cada tool proporciona funcionalidad específica para análisis y generación de reglas.
 """
 
+import asyncio
+import contextlib
+import functools
+import io
 import os
+import stat
 import sys
 import json
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
-# Configurar encoding UTF-8 para Windows
+# Configurar encoding UTF-8 para Windows. reconfigure cambia los streams existentes en lugar de
+# envolverlos en un TextIOWrapper nuevo: volver a importar el módulo no apila envoltorios
 if sys.platform == 'win32':
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    for _stream in (sys.stdout, sys.stderr):
+        if hasattr(_stream, 'reconfigure'):
+            _stream.reconfigure(encoding='utf-8', errors='replace')
 
-from core.project_analyzer import analyze_project
+from core.project_analyzer import (
+    analyze_project,
+    _analysis_fingerprint,
+    _dependencies_unchanged,
+    _recording_dependencies,
+)
 from core.rule_generator import generate_rules
 from core.utils import load_mdc_file, save_mdc_file
 
 
+# Análisis por proyecto: (ruta absoluta, huella de los ficheros de build) -> (project_type, detected_tech,
+# dependencias), donde las dependencias son los (ruta, mtime) de los demás ficheros que leyó el análisis
+# (p.ej. el settings.py de Django). Como mucho ANALYSIS_CACHE_SIZE entradas; la más antigua se descarta primero
+ANALYSIS_CACHE_SIZE = 64
+_ANALYSIS_CACHE = {}
+
+
+def _cached_analyze(path: str, verbose: bool = False):
+    """
+    analyze_project memoizado en el proceso sobre la huella de los ficheros que leen los detectores.
+
+    Las llamadas repetidas sobre el mismo workspace (p.ej. detect_technology en cada petición de
+    Cursor) solo hacen los stat de la huella y de las dependencias. Con verbose se analiza siempre
+    para mostrar el detalle.
+    
+    Returns:
+        Tupla (project_type, detected_tech, dependencias del análisis)
+    """
+    key = (os.path.abspath(path), _analysis_fingerprint(path))
+    if not verbose:
+        cached = _ANALYSIS_CACHE.get(key)
+        if cached is not None and _dependencies_unchanged(cached[2]):
+            project_type, detected_tech, dependencies = cached
+            return project_type, dict(detected_tech), dependencies
+    
+    with _recording_dependencies() as recorded:
+        project_type, detected_tech = analyze_project(path, verbose)
+    dependencies = tuple(dict.fromkeys(recorded))
+    if len(_ANALYSIS_CACHE) >= ANALYSIS_CACHE_SIZE and key not in _ANALYSIS_CACHE:
+        # Descartar la entrada más antigua (los dict conservan el orden de inserción); pop porque
+        # otro hilo puede haberla descartado ya
+        _ANALYSIS_CACHE.pop(next(iter(_ANALYSIS_CACHE)), None)
+    _ANALYSIS_CACHE[key] = (project_type, dict(detected_tech), dependencies)
+    return project_type, detected_tech, dependencies
+
+
+# Detalles que detect_technology_tool expone por tipo de proyecto: (clave en detected_tech,
+# clave en details, si se publica como True en lugar del valor). Solo se copian valores no vacíos
+_TECH_PROJECTIONS = {
+    "springboot": (
+        ("spring_boot_version", "version", False),
+        ("uses_spring_security", "spring_security", True),
+        ("uses_spring_data_jpa", "spring_data_jpa", True),
+        ("uses_actuator", "actuator", True),
+    ),
+    "angular": (
+        ("angular_major_version", "version", False),
+        ("supports_standalone", "standalone_components", True),
+        ("supports_signals", "signals_api", True),
+    ),
+    "python": (
+        # Información de versión de Python
+        ("python_version", "python_version", False),
+        ("python_path", "python_path", False),
+        ("python_source", "python_source", False),
+        ("is_venv", "is_venv", False),
+        ("venv_path", "venv_path", False),
+        # Frameworks detectados
+        ("frameworks_detected", "frameworks", False),
+        ("is_django", "django", True),
+        ("is_flask", "flask", True),
+        ("is_fastapi", "fastapi", True),
+    ),
+    "java_legacy_spring": (
+        ("spring_framework_version", "spring_version", False),
+        ("security_priority", "security_priority", False),
+        ("jsp_files_count", "jsp_files", False),
+    ),
+}
+
+# Resumen de tecnologías de generate_rules_tool, en orden: (clave en detected_tech, plantilla);
+# sin plantilla el valor es una lista que se añade tal cual
+_TECH_SUMMARY_FIELDS = (
+    ("spring_boot_version", "Spring Boot %s"),
+    ("angular_major_version", "Angular %s"),
+    ("frameworks_detected", None),
+    ("spring_framework_version", "Spring Framework %s"),
+)
+
+
+# Archivos escritos por generate_rules_tool en este proceso: ruta de salida -> (entradas,
+# firma (mtime_ns, tamaño) del archivo tal como se escribió, resultado devuelto, dependencias del análisis)
+GENERATED_OUTPUTS_CACHE_SIZE = 64
+_GENERATED_OUTPUTS = {}
+
+
+def _summarize_tech(project_type: Optional[str], detected_tech: Dict[str, Any]):
+    """
+    Formatea las tecnologías detectadas para los resultados de los tools.
+    
+    Returns:
+        (resumen legible de generate_rules_tool, detalles por tipo de proyecto de detect_technology_tool)
+    """
+    summary = []
+    details = {}
+    if not detected_tech:
+        return summary, details
+    get = detected_tech.get
+    for key, template in _TECH_SUMMARY_FIELDS:
+        value = get(key)
+        if value:
+            if template is None:
+                summary.extend(value)
+            else:
+                summary.append(template % (value,))
+    for source_key, detail_key, as_flag in _TECH_PROJECTIONS.get(project_type, ()):
+        value = get(source_key)
+        if value:
+            details[detail_key] = True if as_flag else value
+    return summary, details
+
+
+def _file_signature(file_path: str):
+    """Firma (mtime_ns, tamaño) de un archivo, o None si no existe."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _run_blocking(func, *args, **kwargs):
+    """
+    Ejecuta func(*args, **kwargs) en el pool de hilos del event loop, sin bloquearlo.
+    
+    Todo el análisis, la generación y la escritura de reglas pasan por aquí, así el servidor
+    sigue atendiendo mensajes mientras tanto. Devuelve un future que ya está en marcha: se
+    pueden lanzar varias tareas y esperarlas después. (asyncio.to_thread requiere Python 3.9.)
+    """
+    return asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+# Workspace por defecto, resuelto una vez al importar: el directorio de trabajo y el entorno
+# del servidor MCP no cambian durante el proceso
+_DEFAULT_WORKSPACE = os.path.abspath(os.environ.get('CURSOR_WORKSPACE') or os.getcwd())
+
+
 def get_project_path_from_context(provided_path: Optional[str] = None) -> str:
     """
     Detecta el project_path desde el contexto o usa el proporcionado.
     
+    Sin ruta se usa la variable de entorno CURSOR_WORKSPACE proporcionada por Cursor o,
+    si no existe, el directorio de trabajo del servidor.
+    
     Args:
         provided_path: Ruta proporcionada por el usuario (opcional)
         
@@ -35,14 +187,74 @@ def get_project_path_from_context(provided_path: Optional[str] = None) -> str:
     """
     if provided_path:
         return os.path.abspath(provided_path)
+    return _DEFAULT_WORKSPACE
+
+
+# redirect_stdout cambia sys.stdout para todo el proceso: las capturas no pueden solaparse
+_STDOUT_CAPTURE_LOCK = threading.Lock()
+
+
+def _make_logger(verbose: bool):
+    """
+    Traza verbose de un tool: devuelve (log, messages).
     
-    # Opción 1: Variable de entorno proporcionada por Cursor
-    cursor_workspace = os.environ.get('CURSOR_WORKSPACE', None)
-    if cursor_workspace:
-        return cursor_workspace
+    log(mensaje) acumula el mensaje en messages solo si verbose. La traza se devuelve en el
+    resultado bajo "log": en un servidor MCP por stdio, stdout es el canal del protocolo.
+    """
+    messages = []
+    if verbose:
+        return messages.append, messages
+    return (lambda message: None), messages
+
+
+def _capture_stdout(log, func, *args, **kwargs):
+    """Ejecuta func(*args, **kwargs) pasando a log, línea a línea, lo que imprima en stdout."""
+    buffer = io.StringIO()
+    try:
+        with _STDOUT_CAPTURE_LOCK, contextlib.redirect_stdout(buffer):
+            return func(*args, **kwargs)
+    finally:
+        for line in buffer.getvalue().splitlines():
+            log(line)
+
+
+def _run_traced(log, trace: bool, func, *args, **kwargs):
+    """_run_blocking que, con trace (verbose), recoge en log la traza que func imprime en stdout."""
+    if trace:
+        return _run_blocking(_capture_stdout, log, func, *args, **kwargs)
+    return _run_blocking(func, *args, **kwargs)
+
+
+def _with_log(result: Dict[str, Any], messages: List[str]) -> Dict[str, Any]:
+    """Copia de result con la traza verbose bajo "log" (result tal cual si no hay traza)."""
+    if messages:
+        return dict(result, log=messages)
+    return result
+
+
+def _err(message: str, path: Optional[str], **extra) -> Dict[str, Any]:
+    """Resultado de error de un tool: success, error, project_path y las claves adicionales."""
+    result = {"success": False, "error": message, "project_path": path}
+    result.update(extra)
+    return result
+
+
+def _resolve_and_validate(provided_path: Optional[str] = None):
+    """
+    Resuelve el project_path (ver get_project_path_from_context) y comprueba con un solo stat
+    que es un directorio.
     
-    # Opción 2: Directorio actual de trabajo
-    return os.getcwd()
+    Returns:
+        (ruta absoluta, None) o (ruta absoluta, dict de error listo para devolver desde el tool)
+    """
+    path = get_project_path_from_context(provided_path)
+    try:
+        is_dir = stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        is_dir = False
+    if not is_dir:
+        return path, _err(f"La ruta '{path}' no existe o no es un directorio", path)
+    return path, None
 
 
 async def analyze_project_tool(
@@ -54,46 +266,36 @@ async def analyze_project_tool(
     
     Args:
         project_path: Ruta al proyecto (opcional, usa CWD si no se proporciona)
-        verbose: Si True, muestra información detallada del análisis
+        verbose: Si True, devuelve la traza detallada del análisis bajo "log"
         
     Returns:
         Dict con project_type, detected_tech y información adicional
     """
     try:
-        path = get_project_path_from_context(project_path)
-        
-        if not os.path.isdir(path):
-            return {
-                "success": False,
-                "error": f"La ruta '{path}' no existe o no es un directorio",
-                "project_path": path
-            }
+        path, error = _resolve_and_validate(project_path)
+        if error:
+            return error
         
         # Analizar proyecto
-        project_type, detected_tech = analyze_project(path, verbose)
+        log, messages = _make_logger(verbose)
+        project_type, detected_tech, _ = await _run_traced(log, verbose, _cached_analyze, path, verbose)
         
         if not project_type:
-            return {
-                "success": False,
-                "error": "No se pudo detectar el tipo de proyecto automáticamente",
-                "project_path": path,
-                "suggestion": "Intenta especificar el tipo manualmente o verifica que el proyecto tenga archivos de configuración reconocibles"
-            }
+            return _with_log(_err(
+                "No se pudo detectar el tipo de proyecto automáticamente", path,
+                suggestion="Intenta especificar el tipo manualmente o verifica que el proyecto tenga archivos de configuración reconocibles"
+            ), messages)
         
-        return {
+        return _with_log({
             "success": True,
             "project_path": path,
             "project_type": project_type,
             "detected_technologies": detected_tech,
             "message": f"✅ Proyecto detectado: {project_type}"
-        }
+        }, messages)
         
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Error durante el análisis: {str(e)}",
-            "project_path": path if 'path' in locals() else None
-        }
+        return _err(f"Error durante el análisis: {str(e)}", path if 'path' in locals() else None)
 
 
 async def generate_rules_tool(
@@ -101,7 +303,8 @@ async def generate_rules_tool(
     output_filename: str = "rules",
     custom_rules_path: Optional[str] = None,
     verbose: bool = False,
-    project_type: Optional[str] = None
+    project_type: Optional[str] = None,
+    force: bool = False
 ) -> Dict[str, Any]:
     """
     Tool 2: Genera reglas Cursor completas (all-in-one).
@@ -112,67 +315,96 @@ async def generate_rules_tool(
     3. Genera las reglas adaptadas
     4. Escribe el archivo .cursor/rules/rules.mdc
     
+    Si ya se generó ese archivo en este proceso con las mismas entradas (mismos parámetros, mismos
+    ficheros de build y de reglas personalizadas) y no se ha tocado desde entonces, se devuelve
+    el resultado anterior sin repetir nada ("cached": True).
+    
     Args:
         project_path: Ruta al proyecto (opcional)
         output_filename: Nombre del archivo de salida sin extensión (default: "rules")
         custom_rules_path: Ruta a archivo .mdc con reglas personalizadas (opcional)
-        verbose: Si True, muestra información detallada
+        verbose: Si True, devuelve la traza detallada del proceso bajo "log"
         project_type: Tipo de proyecto manual (opcional, sobrescribe detección automática)
+        force: Si True, regenera el archivo aunque las entradas no hayan cambiado
         
     Returns:
         Dict con información del resultado
     """
+    log, messages = _make_logger(verbose)
+    result = await _generate_rules_steps(
+        log, project_path, output_filename, custom_rules_path, verbose, project_type, force
+    )
+    return _with_log(result, messages)
+
+
+async def _generate_rules_steps(log, project_path, output_filename, custom_rules_path, verbose, project_type, force):
+    """Pasos de generate_rules_tool; la traza verbose va a log."""
     try:
-        path = get_project_path_from_context(project_path)
+        path, error = _resolve_and_validate(project_path)
+        if error:
+            return error
         
-        if not os.path.isdir(path):
-            return {
-                "success": False,
-                "error": f"La ruta '{path}' no existe o no es un directorio",
-                "project_path": path
-            }
+        # Ruta de salida (save_mdc_file crea el directorio si no existe), con extensión .mdc
+        if not output_filename.endswith(".mdc"):
+            output_filename += ".mdc"
+        output_path = os.path.join(path, ".cursor", "rules", output_filename)
         
-        # Paso 1: Analizar proyecto (si no se especificó tipo manual)
+        # Archivo ya generado con las mismas entradas y sin modificar: nada que hacer. previous[3] son las
+        # dependencias del análisis, que incluyen cada directorio recorrido: un archivo nuevo en cualquier
+        # nivel del árbol (src/components/A.vue, un .py suelto) invalida la entrada
+        generation_inputs = (
+            project_type,
+            custom_rules_path and os.path.abspath(custom_rules_path),
+            custom_rules_path and _file_signature(custom_rules_path),
+            _analysis_fingerprint(path)
+        )
+        if not force and not verbose:
+            previous = _GENERATED_OUTPUTS.get(output_path)
+            if (previous and previous[0] == generation_inputs and previous[1] == _file_signature(output_path)
+                    and _dependencies_unchanged(previous[3])):
+                return dict(previous[2], cached=True)
+        
+        # Pasos 1 y 2 arrancan a la vez en hilos: el análisis del proyecto y la carga de las
+        # reglas personalizadas son E/S independientes
         detected_type = project_type
         detected_tech = {}
+        analysis_dependencies = ()
+        analysis_task = None
         
         if not detected_type:
-            if verbose:
-                print(f"🔍 Analizando proyecto en: {path}")
-            detected_type, detected_tech = analyze_project(path, verbose)
+            log(f"🔍 Analizando proyecto en: {path}")
+            analysis_task = _run_traced(log, verbose, _cached_analyze, path, verbose)
+        else:
+            log(f"📋 Usando tipo de proyecto especificado: {detected_type}")
+        
+        custom_rules_task = _run_traced(log, verbose, load_mdc_file, custom_rules_path) if custom_rules_path else None
+        
+        # Paso 1: Analizar proyecto (si no se especificó tipo manual)
+        if analysis_task is not None:
+            detected_type, detected_tech, analysis_dependencies = await analysis_task
             
             if not detected_type:
-                return {
-                    "success": False,
-                    "error": "No se pudo detectar el tipo de proyecto",
-                    "project_path": path,
-                    "suggestion": "Especifica el tipo de proyecto manualmente con el parámetro 'project_type'"
-                }
-        else:
-            if verbose:
-                print(f"📋 Usando tipo de proyecto especificado: {detected_type}")
+                return _err(
+                    "No se pudo detectar el tipo de proyecto", path,
+                    suggestion="Especifica el tipo de proyecto manualmente con el parámetro 'project_type'"
+                )
         
         # Paso 2: Cargar reglas personalizadas (si existen)
         custom_rules = None
-        if custom_rules_path:
-            if os.path.exists(custom_rules_path):
-                custom_rules_data = load_mdc_file(custom_rules_path)
-                if custom_rules_data:
-                    custom_rules = custom_rules_data.get("content", "")
-                    if verbose:
-                        print(f"📄 Reglas personalizadas cargadas desde: {custom_rules_path}")
-            else:
-                return {
-                    "success": False,
-                    "error": f"Archivo de reglas personalizadas no encontrado: {custom_rules_path}",
-                    "project_path": path
-                }
+        if custom_rules_task is not None:
+            # load_mdc_file ya hace el stat del archivo: None si no existe o no se puede leer
+            custom_rules_data = await custom_rules_task
+            if custom_rules_data is None:
+                return _err(f"Archivo de reglas personalizadas no encontrado: {custom_rules_path}", path)
+            custom_rules = custom_rules_data.get("content", "")
+            log(f"📄 Reglas personalizadas cargadas desde: {custom_rules_path}")
         
         # Paso 3: Generar reglas
-        if verbose:
-            print(f"⚙️  Generando reglas para proyecto tipo: {detected_type}")
+        log(f"⚙️  Generando reglas para proyecto tipo: {detected_type}")
         
-        final_rules = generate_rules(
+        final_rules = await _run_traced(
+            log, verbose,
+            generate_rules,
             project_type=detected_type,
             detected_tech=detected_tech,
             custom_rules_data=custom_rules,
@@ -180,41 +412,17 @@ async def generate_rules_tool(
         )
         
         if not final_rules:
-            return {
-                "success": False,
-                "error": f"No se pudieron generar reglas para el tipo '{detected_type}'",
-                "project_path": path,
-                "project_type": detected_type
-            }
-        
-        # Paso 4: Preparar directorio de salida
-        output_dir = os.path.join(path, ".cursor", "rules")
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Asegurar extensión .mdc
-        if not output_filename.endswith(".mdc"):
-            output_filename += ".mdc"
-        
-        output_path = os.path.join(output_dir, output_filename)
+            return _err(f"No se pudieron generar reglas para el tipo '{detected_type}'", path, project_type=detected_type)
         
-        # Paso 5: Guardar archivo
-        if verbose:
-            print(f"💾 Guardando reglas en: {output_path}")
+        # Paso 4: Guardar archivo
+        log(f"💾 Guardando reglas en: {output_path}")
         
-        if save_mdc_file(output_path, final_rules):
+        if await _run_traced(log, verbose, save_mdc_file, output_path, final_rules):
             # Preparar resumen de tecnologías detectadas
-            tech_summary = []
-            if detected_tech:
-                if detected_tech.get("spring_boot_version"):
-                    tech_summary.append(f"Spring Boot {detected_tech['spring_boot_version']}")
-                if detected_tech.get("angular_major_version"):
-                    tech_summary.append(f"Angular {detected_tech['angular_major_version']}")
-                if detected_tech.get("frameworks_detected"):
-                    tech_summary.extend(detected_tech["frameworks_detected"])
-                if detected_tech.get("spring_framework_version"):
-                    tech_summary.append(f"Spring Framework {detected_tech['spring_framework_version']}")
+            tech_summary, _ = _summarize_tech(detected_type, detected_tech)
             
-            return {
+            output_stat = os.stat(output_path)
+            result = {
                 "success": True,
                 "project_path": path,
                 "project_type": detected_type,
@@ -222,25 +430,21 @@ async def generate_rules_tool(
                 "technologies_detected": tech_summary if tech_summary else ["Análisis básico completado"],
                 "message": f"✅ Reglas generadas exitosamente en: {output_path}",
                 "details": {
-                    "file_size": os.path.getsize(output_path),
+                    "file_size": output_stat.st_size,
                     "relative_path": os.path.relpath(output_path, path)
                 }
             }
+            if len(_GENERATED_OUTPUTS) >= GENERATED_OUTPUTS_CACHE_SIZE and output_path not in _GENERATED_OUTPUTS:
+                _GENERATED_OUTPUTS.pop(next(iter(_GENERATED_OUTPUTS)), None)
+            _GENERATED_OUTPUTS[output_path] = (
+                generation_inputs, (output_stat.st_mtime_ns, output_stat.st_size), result, analysis_dependencies
+            )
+            return result
         else:
-            return {
-                "success": False,
-                "error": f"No se pudo escribir el archivo en: {output_path}",
-                "project_path": path,
-                "project_type": detected_type
-            }
+            return _err(f"No se pudo escribir el archivo en: {output_path}", path, project_type=detected_type)
             
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Error durante la generación de reglas: {str(e)}",
-            "project_path": path if 'path' in locals() else None,
-            "traceback": str(e)
-        }
+        return _err(f"Error durante la generación de reglas: {str(e)}", path if 'path' in locals() else None)
 
 
 async def detect_technology_tool(
@@ -258,80 +462,23 @@ async def detect_technology_tool(
         Dict con información de tecnologías detectadas
     """
     try:
-        path = get_project_path_from_context(project_path)
-        
-        if not os.path.isdir(path):
-            return {
-                "success": False,
-                "error": f"La ruta '{path}' no existe o no es un directorio"
-            }
+        path, error = _resolve_and_validate(project_path)
+        if error:
+            return error
         
         # Analizar sin verbose para salida limpia
-        project_type, detected_tech = analyze_project(path, verbose=False)
+        project_type, detected_tech, _ = await _run_blocking(_cached_analyze, path, verbose=False)
         
         if not project_type:
-            return {
-                "success": False,
-                "error": "No se detectaron tecnologías reconocidas",
-                "project_path": path
-            }
+            return _err("No se detectaron tecnologías reconocidas", path)
         
-        # Formatear información de manera legible
+        # Formatear información de manera legible, con la información relevante según tipo de proyecto
+        _, details = _summarize_tech(project_type, detected_tech)
         tech_info = {
             "project_type": project_type,
-            "details": {}
+            "details": details
         }
         
-        # Mapear información relevante según tipo de proyecto
-        if project_type == "springboot":
-            if detected_tech.get("spring_boot_version"):
-                tech_info["details"]["version"] = detected_tech["spring_boot_version"]
-            if detected_tech.get("uses_spring_security"):
-                tech_info["details"]["spring_security"] = True
-            if detected_tech.get("uses_spring_data_jpa"):
-                tech_info["details"]["spring_data_jpa"] = True
-            if detected_tech.get("uses_actuator"):
-                tech_info["details"]["actuator"] = True
-                
-        elif project_type == "angular":
-            if detected_tech.get("angular_major_version"):
-                tech_info["details"]["version"] = detected_tech["angular_major_version"]
-            if detected_tech.get("supports_standalone"):
-                tech_info["details"]["standalone_components"] = True
-            if detected_tech.get("supports_signals"):
-                tech_info["details"]["signals_api"] = True
-                
-        elif project_type == "python":
-            # Información de versión de Python
-            if detected_tech.get("python_version"):
-                tech_info["details"]["python_version"] = detected_tech["python_version"]
-            if detected_tech.get("python_path"):
-                tech_info["details"]["python_path"] = detected_tech["python_path"]
-            if detected_tech.get("python_source"):
-                tech_info["details"]["python_source"] = detected_tech["python_source"]
-            if detected_tech.get("is_venv"):
-                tech_info["details"]["is_venv"] = detected_tech["is_venv"]
-            if detected_tech.get("venv_path"):
-                tech_info["details"]["venv_path"] = detected_tech["venv_path"]
-            
-            # Frameworks detectados
-            if detected_tech.get("frameworks_detected"):
-                tech_info["details"]["frameworks"] = detected_tech["frameworks_detected"]
-            if detected_tech.get("is_django"):
-                tech_info["details"]["django"] = True
-            if detected_tech.get("is_flask"):
-                tech_info["details"]["flask"] = True
-            if detected_tech.get("is_fastapi"):
-                tech_info["details"]["fastapi"] = True
-                
-        elif project_type == "java_legacy_spring":
-            if detected_tech.get("spring_framework_version"):
-                tech_info["details"]["spring_version"] = detected_tech["spring_framework_version"]
-            if detected_tech.get("security_priority"):
-                tech_info["details"]["security_priority"] = detected_tech["security_priority"]
-            if detected_tech.get("jsp_files_count"):
-                tech_info["details"]["jsp_files"] = detected_tech["jsp_files_count"]
-        
         return {
             "success": True,
             "project_path": path,
@@ -340,11 +487,96 @@ async def detect_technology_tool(
         }
         
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"Error detectando tecnologías: {str(e)}",
-            "project_path": path if 'path' in locals() else None
-        }
+        return _err(f"Error detectando tecnologías: {str(e)}", path if 'path' in locals() else None)
+
+
+# Tecnologías soportadas: el resultado de list_supported_technologies_tool es fijo, así que se
+# construye una sola vez al importar el módulo junto con su JSON ya serializado. Todos los llamadores
+# reciben el mismo dict: es compartido y no debe modificarse
+_SUPPORTED_TECHS = {
+    "springboot": {
+        "name": "Spring Boot",
+        "description": "Proyectos Spring Boot modernos (versiones 1.x, 2.x, 3.x)",
+        "detection_files": ["pom.xml", "build.gradle", "application.properties"],
+        "features": [
+            "Detección de versión completa",
+            "Análisis de Spring Security",
+            "Detección de Spring Data JPA",
+            "Alertas de Spring Actuator",
+            "Reglas de seguridad específicas por versión"
+        ]
+    },
+    "angular": {
+        "name": "Angular",
+        "description": "Aplicaciones Angular (versiones 14+)",
+        "detection_files": ["angular.json", "package.json"],
+        "features": [
+            "Detección de versión major",
+            "Soporte para Standalone Components",
+            "Detección de Signals API (v16+)",
+            "Nueva sintaxis de control flow (v17+)",
+            "Análisis de NgRx y Angular Material"
+        ]
+    },
+    "vue": {
+        "name": "Vue.js",
+        "description": "Aplicaciones Vue.js (2.x y 3.x)",
+        "detection_files": ["package.json", "vue.config.js", "vite.config.js"],
+        "features": [
+            "Detección de versión",
+            "Soporte para Nuxt.js",
+            "Reglas de seguridad XSS",
+            "Composition API patterns"
+        ]
+    },
+    "python": {
+        "name": "Python",
+        "description": "Proyectos Python con frameworks web",
+        "detection_files": ["requirements.txt", "pyproject.toml", "manage.py", ".python-version", "Pipfile"],
+        "features": [
+            "Detección automática de versión de Python",
+            "Detección de ruta del intérprete",
+            "Soporte para entornos virtuales (venv, .venv, env)",
+            "Detección de pyenv (.python-version)",
+            "Detección de Django",
+            "Detección de Flask",
+            "Detección de FastAPI",
+            "Análisis de dependencias",
+            "Reglas PEP 8"
+        ]
+    },
+    "java_legacy_spring": {
+        "name": "Java Legacy Spring",
+        "description": "Proyectos Java Legacy con Spring Framework y JSP",
+        "detection_files": ["web.xml", "applicationContext.xml", "*.jsp"],
+        "features": [
+            "Detección de Spring Framework legacy",
+            "Análisis de vulnerabilidades críticas",
+            "Detección de Log4Shell",
+            "Análisis de Struts",
+            "Priorización de seguridad"
+        ]
+    },
+    "gitlab_ci": {
+        "name": "GitLab CI/CD",
+        "description": "Pipelines GitLab CI/CD",
+        "detection_files": [".gitlab-ci.yml"],
+        "features": [
+            "Análisis de pipelines",
+            "DevSecOps best practices",
+            "Detección de secrets",
+            "Configuración Docker"
+        ]
+    }
+}
+
+_SUPPORTED_TECHS_JSON = json.dumps({
+    "success": True,
+    "supported_technologies": _SUPPORTED_TECHS,
+    "total_technologies": len(_SUPPORTED_TECHS)
+}, indent=2, ensure_ascii=False)
+
+_SUPPORTED_TECHS_RESULT = json.loads(_SUPPORTED_TECHS_JSON)
 
 
 async def list_supported_technologies_tool() -> Dict[str, Any]:
@@ -352,85 +584,12 @@ async def list_supported_technologies_tool() -> Dict[str, Any]:
     Tool 4: Lista todas las tecnologías soportadas por RuleForge MCP.
     
     Returns:
-        Dict con lista de tecnologías y sus características
+        Diccionario con la lista de tecnologías y sus características. Es el mismo objeto en todas
+        las llamadas: no debe modificarse
     """
-    return {
-        "success": True,
-        "supported_technologies": {
-            "springboot": {
-                "name": "Spring Boot",
-                "description": "Proyectos Spring Boot modernos (versiones 1.x, 2.x, 3.x)",
-                "detection_files": ["pom.xml", "build.gradle", "application.properties"],
-                "features": [
-                    "Detección de versión completa",
-                    "Análisis de Spring Security",
-                    "Detección de Spring Data JPA",
-                    "Alertas de Spring Actuator",
-                    "Reglas de seguridad específicas por versión"
-                ]
-            },
-            "angular": {
-                "name": "Angular",
-                "description": "Aplicaciones Angular (versiones 14+)",
-                "detection_files": ["angular.json", "package.json"],
-                "features": [
-                    "Detección de versión major",
-                    "Soporte para Standalone Components",
-                    "Detección de Signals API (v16+)",
-                    "Nueva sintaxis de control flow (v17+)",
-                    "Análisis de NgRx y Angular Material"
-                ]
-            },
-            "vue": {
-                "name": "Vue.js",
-                "description": "Aplicaciones Vue.js (2.x y 3.x)",
-                "detection_files": ["package.json", "vue.config.js", "vite.config.js"],
-                "features": [
-                    "Detección de versión",
-                    "Soporte para Nuxt.js",
-                    "Reglas de seguridad XSS",
-                    "Composition API patterns"
-                ]
-            },
-            "python": {
-                "name": "Python",
-                "description": "Proyectos Python con frameworks web",
-                "detection_files": ["requirements.txt", "pyproject.toml", "manage.py", ".python-version", "Pipfile"],
-                "features": [
-                    "Detección automática de versión de Python",
-                    "Detección de ruta del intérprete",
-                    "Soporte para entornos virtuales (venv, .venv, env)",
-                    "Detección de pyenv (.python-version)",
-                    "Detección de Django",
-                    "Detección de Flask",
-                    "Detección de FastAPI",
-                    "Análisis de dependencias",
-                    "Reglas PEP 8"
-                ]
-            },
-            "java_legacy_spring": {
-                "name": "Java Legacy Spring",
-                "description": "Proyectos Java Legacy con Spring Framework y JSP",
-                "detection_files": ["web.xml", "applicationContext.xml", "*.jsp"],
-                "features": [
-                    "Detección de Spring Framework legacy",
-                    "Análisis de vulnerabilidades críticas",
-                    "Detección de Log4Shell",
-                    "Análisis de Struts",
-                    "Priorización de seguridad"
-                ]
-            },
-            "gitlab_ci": {
-                "name": "GitLab CI/CD",
-                "description": "Pipelines GitLab CI/CD",
-                "detection_files": [".gitlab-ci.yml"],
-                "features": [
-                    "Análisis de pipelines",
-                    "DevSecOps best practices",
-                    "Detección de secrets",
-                    "Configuración Docker"
-                ]
-            }
-        },
-        "total_technologies": 6
-    }
+    return _SUPPORTED_TECHS_RESULT
+
+
+def supported_technologies_json() -> str:
+    """JSON indentado del resultado de list_supported_technologies_tool, serializado una sola vez."""
+    return _SUPPORTED_TECHS_JSON
@@ -26,21 +26,174 @@ from mcp_tools import (
     generate_rules_tool,
     detect_technology_tool,
     list_supported_technologies_tool,
+    supported_technologies_json,
 )
+from core.rule_generator import warm_adaptation_cache
 
 # Configurar logging básico para debug (opcional)
 import logging
+import logging.handlers
 os.makedirs("logs", exist_ok=True)
+_log_file_handler = logging.FileHandler(f"logs/server_{os.getpid()}.log", encoding='utf-8')
+# El formato va en el FileHandler: el MemoryHandler solo le pasa los registros
+_log_file_handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', datefmt='%H:%M:%S'))
+# Los registros se acumulan en memoria y se escriben en bloque (cada 64, o en cuanto llega un
+# ERROR) en lugar de una escritura por registro; logging.shutdown vacía el resto al salir
 logging.basicConfig(
     level=logging.INFO,
-    format='[%(asctime)s] %(message)s',
-    datefmt='%H:%M:%S',
     handlers=[
-        logging.FileHandler(f"logs/server_{os.getpid()}.log", encoding='utf-8'),
+        logging.handlers.MemoryHandler(capacity=64, flushLevel=logging.ERROR, target=_log_file_handler),
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Serialización de las respuestas: orjson si está instalado (varias veces más rápido), si no json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(result: Any) -> str:
+    """Serializa un resultado de tool a JSON indentado, sin escapar los caracteres no ASCII."""
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
+async def _list_supported_technologies_rendered():
+    """list_supported_technologies_tool con su JSON, serializado una sola vez al importar mcp_tools."""
+    return await list_supported_technologies_tool(), supported_technologies_json()
+
+
+# Tools por nombre y argumentos que acepta cada uno (el resto de claves se ignoran). Un tool
+# devuelve su dict de resultado, o una tupla (resultado, JSON ya serializado) si lo tiene precalculado
+_TOOL_FUNCS = {
+    "generate_rules": generate_rules_tool,
+    "analyze_project": analyze_project_tool,
+    "detect_technology": detect_technology_tool,
+    "list_supported_technologies": _list_supported_technologies_rendered,
+}
+_TOOL_ALLOWED_KEYS = {
+    "generate_rules": frozenset({"project_path", "output_filename", "custom_rules_path", "verbose", "project_type", "force"}),
+    "analyze_project": frozenset({"project_path", "verbose"}),
+    "detect_technology": frozenset({"project_path"}),
+    "list_supported_technologies": frozenset(),
+}
+
+# Esquemas de entrada de los tools (constantes: no se vuelven a construir en cada list_tools)
+_GENERATE_RULES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "project_path": {
+            "type": "string",
+            "description": "Ruta al proyecto (opcional, usa el directorio actual si no se especifica)"
+        },
+        "output_filename": {
+            "type": "string",
+            "description": "Nombre del archivo de salida sin extensión (default: 'rules')",
+            "default": "rules"
+        },
+        "custom_rules_path": {
+            "type": "string",
+            "description": "Ruta a archivo .mdc con reglas personalizadas adicionales (opcional)"
+        },
+        "verbose": {
+            "type": "boolean",
+            "description": "Incluir en el resultado (campo 'log') la traza detallada del proceso (default: false)",
+            "default": False
+        },
+        "project_type": {
+            "type": "string",
+            "description": "Tipo de proyecto manual: springboot, angular, vue, python, java_legacy_spring, gitlab_ci (opcional)",
+            "enum": ["springboot", "angular", "vue", "python", "java_legacy_spring", "gitlab_ci"]
+        },
+        "force": {
+            "type": "boolean",
+            "description": "Regenerar el archivo aunque el proyecto no haya cambiado desde la última generación (default: false)",
+            "default": False
+        }
+    },
+    "required": []
+}
+
+_ANALYZE_PROJECT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "project_path": {
+            "type": "string",
+            "description": "Ruta al proyecto (opcional, usa el directorio actual si no se especifica)"
+        },
+        "verbose": {
+            "type": "boolean",
+            "description": "Incluir en el resultado (campo 'log') la traza detallada del análisis (default: false)",
+            "default": False
+        }
+    },
+    "required": []
+}
+
+_DETECT_TECHNOLOGY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "project_path": {
+            "type": "string",
+            "description": "Ruta al proyecto (opcional, usa el directorio actual si no se especifica)"
+        }
+    },
+    "required": []
+}
+
+_LIST_SUPPORTED_TECHNOLOGIES_SCHEMA = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+
+
+# Los Tool (modelos validados del SDK de MCP) se construyen una sola vez al importar y todas
+# las respuestas a list_tools devuelven la misma lista. El SDK serializa la respuesta él mismo,
+# así que no admite pasarle el JSON ya codificado
+_TOOLS = [
+    Tool(
+        name="generate_rules",
+        description=(
+            "Genera reglas Cursor completas automáticamente (ALL-IN-ONE). "
+            "Analiza el proyecto actual, detecta tecnologías y versiones, "
+            "y crea el archivo .cursor/rules/rules.mdc con reglas personalizadas. "
+            "Este es el tool principal recomendado para uso general."
+        ),
+        inputSchema=_GENERATE_RULES_SCHEMA
+    ),
+    Tool(
+        name="analyze_project",
+        description=(
+            "Analiza un proyecto para detectar su tecnología, versión y características. "
+            "Útil para inspeccionar qué detectará RuleForge antes de generar reglas. "
+            "No crea archivos, solo retorna información."
+        ),
+        inputSchema=_ANALYZE_PROJECT_SCHEMA
+    ),
+    Tool(
+        name="detect_technology",
+        description=(
+            "Detecta rápidamente las tecnologías principales del proyecto sin análisis profundo. "
+            "Retorna información básica de versión y frameworks detectados. "
+            "Más rápido que analyze_project pero con menos detalles."
+        ),
+        inputSchema=_DETECT_TECHNOLOGY_SCHEMA
+    ),
+    Tool(
+        name="list_supported_technologies",
+        description=(
+            "Lista todas las tecnologías soportadas por RuleForge MCP. "
+            "Muestra qué tipos de proyectos puede analizar y qué características "
+            "detecta para cada tecnología."
+        ),
+        inputSchema=_LIST_SUPPORTED_TECHNOLOGIES_SCHEMA
+    ),
+]
+
 
 def create_app():
     """Crea y configura el servidor MCP."""
@@ -50,100 +203,7 @@ def create_app():
     @app.list_tools()
     async def handle_list_tools():
         """Lista todos los tools disponibles."""
-        return [
-            Tool(
-                name="generate_rules",
-                description=(
-                    "Genera reglas Cursor completas automáticamente (ALL-IN-ONE). "
-                    "Analiza el proyecto actual, detecta tecnologías y versiones, "
-                    "y crea el archivo .cursor/rules/rules.mdc con reglas personalizadas. "
-                    "Este es el tool principal recomendado para uso general."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_path": {
-                            "type": "string",
-                            "description": "Ruta al proyecto (opcional, usa el directorio actual si no se especifica)"
-                        },
-                        "output_filename": {
-                            "type": "string",
-                            "description": "Nombre del archivo de salida sin extensión (default: 'rules')",
-                            "default": "rules"
-                        },
-                        "custom_rules_path": {
-                            "type": "string",
-                            "description": "Ruta a archivo .mdc con reglas personalizadas adicionales (opcional)"
-                        },
-                        "verbose": {
-                            "type": "boolean",
-                            "description": "Mostrar información detallada del proceso (default: false)",
-                            "default": False
-                        },
-                        "project_type": {
-                            "type": "string",
-                            "description": "Tipo de proyecto manual: springboot, angular, vue, python, java_legacy_spring, gitlab_ci (opcional)",
-                            "enum": ["springboot", "angular", "vue", "python", "java_legacy_spring", "gitlab_ci"]
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="analyze_project",
-                description=(
-                    "Analiza un proyecto para detectar su tecnología, versión y características. "
-                    "Útil para inspeccionar qué detectará RuleForge antes de generar reglas. "
-                    "No crea archivos, solo retorna información."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_path": {
-                            "type": "string",
-                            "description": "Ruta al proyecto (opcional, usa el directorio actual si no se especifica)"
-                        },
-                        "verbose": {
-                            "type": "boolean",
-                            "description": "Mostrar información detallada del análisis (default: false)",
-                            "default": False
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="detect_technology",
-                description=(
-                    "Detecta rápidamente las tecnologías principales del proyecto sin análisis profundo. "
-                    "Retorna información básica de versión y frameworks detectados. "
-                    "Más rápido que analyze_project pero con menos detalles."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "project_path": {
-                            "type": "string",
-                            "description": "Ruta al proyecto (opcional, usa el directorio actual si no se especifica)"
-                        }
-                    },
-                    "required": []
-                }
-            ),
-            Tool(
-                name="list_supported_technologies",
-                description=(
-                    "Lista todas las tecnologías soportadas por RuleForge MCP. "
-                    "Muestra qué tipos de proyectos puede analizar y qué características "
-                    "detecta para cada tecnología."
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            ),
-        ]
+        return _TOOLS
 
     @app.call_tool()
     async def handle_call_tool(name: str, arguments: Any):
@@ -155,41 +215,25 @@ def create_app():
             if not isinstance(arguments, dict):
                 arguments = {}
             
-            # Ejecutar el tool correspondiente
-            if name == "generate_rules":
-                result = await generate_rules_tool(
-                    project_path=arguments.get("project_path"),
-                    output_filename=arguments.get("output_filename", "rules"),
-                    custom_rules_path=arguments.get("custom_rules_path"),
-                    verbose=arguments.get("verbose", False),
-                    project_type=arguments.get("project_type")
-                )
-                
-            elif name == "analyze_project":
-                result = await analyze_project_tool(
-                    project_path=arguments.get("project_path"),
-                    verbose=arguments.get("verbose", False)
-                )
-                
-            elif name == "detect_technology":
-                result = await detect_technology_tool(
-                    project_path=arguments.get("project_path")
-                )
-                
-            elif name == "list_supported_technologies":
-                result = await list_supported_technologies_tool()
-                
+            # Ejecutar el tool correspondiente, solo con los argumentos que acepta
+            tool_func = _TOOL_FUNCS.get(name)
+            if tool_func is not None:
+                allowed_keys = _TOOL_ALLOWED_KEYS[name]
+                result = await tool_func(**{key: value for key, value in arguments.items() if key in allowed_keys})
             else:
                 result = {
                     "success": False,
                     "error": f"Tool desconocido: {name}",
-                    "available_tools": ["generate_rules", "analyze_project", "detect_technology", "list_supported_technologies"]
+                    "available_tools": list(_TOOL_FUNCS)
                 }
             
-            logger.info(f"Tool {name} ejecutado: success={result.get('success')}")
+            # Formatear resultado (salvo que el tool lo entregue ya serializado)
+            if isinstance(result, tuple):
+                result, formatted_result = result
+            else:
+                formatted_result = _dumps(result)
             
-            # Formatear resultado
-            formatted_result = json.dumps(result, indent=2, ensure_ascii=False)
+            logger.info(f"Tool {name} ejecutado: success={result.get('success')}")
             
             # Añadir emoji según el resultado
             if result.get("success"):
@@ -205,7 +249,8 @@ def create_app():
             ]
             
         except Exception as e:
-            logger.error(f"Error en tool {name}: {e}")
+            # La traza completa solo con DEBUG activo; en INFO basta con el tipo y el mensaje
+            logger.error(f"Error en tool {name}: {e!r}", exc_info=logger.isEnabledFor(logging.DEBUG))
             error_result = {
                 "success": False,
                 "error": f"Error inesperado: {str(e)}",
@@ -216,7 +261,7 @@ def create_app():
             return [
                 TextContent(
                     type="text",
-                    text="❌ **Error crítico**\n\n" + json.dumps(error_result, indent=2, ensure_ascii=False)
+                    text="❌ **Error crítico**\n\n" + _dumps(error_result)
                 )
             ]
 
@@ -226,6 +271,8 @@ def create_app():
 async def main():
     """Punto de entrada principal del servidor MCP."""
     app = create_app()
+    # Precalcular las reglas adaptadas de los perfiles más comunes antes de atender peticiones
+    warm_adaptation_cache()
     
     # Ejecutar el servidor usando stdio para comunicación con Cursor
     async with stdio_server() as (read_stream, write_stream):
@@ -243,7 +290,5 @@ if __name__ == "__main__":
         logger.info("Servidor detenido por usuario")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Error fatal en el servidor: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.error(f"Error fatal en el servidor: {e!r}", exc_info=logger.isEnabledFor(logging.DEBUG))
         sys.exit(1)
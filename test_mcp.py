@@ -7,38 +7,64 @@ funcionan correctamente.
 
 Uso:
     python test_mcp.py
+    TEST_VERBOSE=1 python test_mcp.py   # muestra también el JSON completo de cada resultado
 """
 
 import asyncio
+import contextvars
+import importlib
+import io
 import os
+import stat
 import sys
 import json
+import tempfile
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Directorio del MCP y su directorio padre, resueltos una sola vez
+_HERE = Path(__file__).resolve().parent
+_PARENT_DIR = str(_HERE.parent)
+
+# Sin TEST_VERBOSE no se serializan ni muestran los resultados completos de los tools
+VERBOSE = bool(os.environ.get("TEST_VERBOSE"))
+
+# Separadores de las cabeceras: de cada test (60) y del resumen (70)
+_H60 = "=" * 60
+_H70 = "=" * 70
+
+
+def _check(condition, message):
+    """Como assert, pero se mantiene con python -O (que elimina los assert)"""
+    if not condition:
+        raise AssertionError(message)
+
 # Añadir el directorio actual al path para importar módulos
-sys.path.insert(0, str(Path(__file__).parent))
-
-from mcp_tools import (
-    analyze_project_tool,
-    generate_rules_tool,
-    detect_technology_tool,
-    list_supported_technologies_tool,
-    get_project_path_from_context
-)
+sys.path.insert(0, str(_HERE))
+
+# mcp_tools (y con él todo core) se importa dentro de cada test que lo usa: la validación de
+# estructura, que va primero, no necesita cargarlo
 
 
 async def test_get_project_path():
     """Test: Obtener ruta del proyecto"""
-    print("\n" + "="*60)
+    from mcp_tools import get_project_path_from_context
+    
+    print(f"\n{_H60}")
     print("TEST 1: get_project_path_from_context")
-    print("="*60)
+    print(_H60)
     
-    # Test sin parámetros (debe usar CWD)
+    # Test sin parámetros (debe usar CWD; resuelto una sola vez al importar mcp_tools)
     path = get_project_path_from_context()
     print(f"[OK] Ruta detectada: {path}")
-    assert os.path.isdir(path), "La ruta debe ser un directorio valido"
+    _check(stat.S_ISDIR(os.stat(path).st_mode), "La ruta debe ser un directorio valido")
     
-    # Test con parámetro
+    # Test con parámetro (una ruta relativa cuesta un getcwd para hacerla absoluta: quien
+    # llama con una ruta conocida debería pasarla ya absoluta)
     parent_path = get_project_path_from_context("..")
     print(f"[OK] Ruta con parametro: {parent_path}")
     
@@ -47,15 +73,20 @@ async def test_get_project_path():
 
 async def test_list_supported_technologies():
     """Test: Listar tecnologías soportadas"""
-    print("\n" + "="*60)
+    from mcp_tools import list_supported_technologies_tool
+    
+    print(f"\n{_H60}")
     print("TEST 2: list_supported_technologies_tool")
-    print("="*60)
+    print(_H60)
     
     result = await list_supported_technologies_tool()
     
-    assert result["success"] == True, "Debe retornar success=True"
-    assert "supported_technologies" in result, "Debe contener 'supported_technologies'"
-    assert result["total_technologies"] == 6, "Debe soportar 6 tecnologias"
+    _check(result["success"] == True, "Debe retornar success=True")
+    _check("supported_technologies" in result, "Debe contener 'supported_technologies'")
+    _check(result["total_technologies"] == 6, "Debe soportar 6 tecnologias")
+    
+    # El resultado es fijo y se construye una sola vez: las llamadas siguientes devuelven el mismo objeto
+    _check(await list_supported_technologies_tool() is result, "El resultado debe estar precalculado")
     
     print("[OK] Tecnologias soportadas:")
     for tech_id, tech_info in result["supported_technologies"].items():
@@ -64,24 +95,48 @@ async def test_list_supported_technologies():
     print("[PASS] TEST PASADO\n")
 
 
+# Análisis de _PARENT_DIR compartido por test_detect_technology y test_analyze_project, como un
+# fixture de ámbito de módulo: el primero que lo pide lanza analyze_project_tool y el resto espera
+# a ese mismo resultado (los tests se llaman sin argumentos, así que no es un fixture de pytest)
+_SHARED_ANALYSIS = None
+
+
+async def _shared_analysis():
+    """Resultado de analyze_project_tool sobre _PARENT_DIR, calculado una sola vez por proceso"""
+    global _SHARED_ANALYSIS
+    if _SHARED_ANALYSIS is None:
+        from mcp_tools import analyze_project_tool
+        _SHARED_ANALYSIS = asyncio.ensure_future(analyze_project_tool(project_path=_PARENT_DIR, verbose=False))
+    # Un futuro ya resuelto se puede esperar desde otro bucle de eventos (un bucle por test en pytest)
+    return await _SHARED_ANALYSIS
+
+
 async def test_detect_technology():
     """Test: Detectar tecnología del proyecto"""
-    print("\n" + "="*60)
+    from mcp_tools import detect_technology_tool
+    
+    print(f"\n{_H60}")
     print("TEST 3: detect_technology_tool")
-    print("="*60)
+    print(_H60)
     
     # Test en el directorio del proyecto RuleForge
     # Navegamos al directorio padre que contiene el proyecto RuleForge
-    parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    parent_dir = _PARENT_DIR
     
+    # Con el análisis compartido ya hecho, detect_technology_tool lo reutiliza de la caché de mcp_tools
+    analysis = await _shared_analysis()
     result = await detect_technology_tool(project_path=parent_dir)
     
     print(f"[OK] Proyecto analizado: {parent_dir}")
-    print(f"[OK] Resultado: {json.dumps(result, indent=2, ensure_ascii=True)}")
+    if VERBOSE:
+        print(f"[OK] Resultado: {_pretty(result)}")
     
     # La validacion depende del proyecto, puede no detectar nada o detectar Python
     if result["success"]:
-        print(f"[OK] Tecnologia detectada: {result.get('technology', {}).get('project_type', 'N/A')}")
+        technology = result.get('technology') or {}
+        print(f"[OK] Tecnologia detectada: {technology.get('project_type', 'N/A')}")
+        _check(technology.get('project_type') == analysis.get('project_type'),
+               "detect_technology y analyze_project deben coincidir en el tipo de proyecto")
     else:
         print("[INFO] No se detecto tecnologia (esperado si no hay proyecto reconocible)")
     
@@ -90,18 +145,18 @@ async def test_detect_technology():
 
 async def test_analyze_project():
     """Test: Análisis completo de proyecto"""
-    print("\n" + "="*60)
-    print("TEST 4: analyze_project_tool")
-    print("="*60)
     
-    parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    print(f"\n{_H60}")
+    print("TEST 4: analyze_project_tool")
+    print(_H60)
     
-    result = await analyze_project_tool(project_path=parent_dir, verbose=False)
+    result = await _shared_analysis()
     
     print(f"[OK] Analisis completo ejecutado")
-    print(f"[OK] Resultado: {json.dumps(result, indent=2, ensure_ascii=True)}")
+    if VERBOSE:
+        print(f"[OK] Resultado: {_pretty(result)}")
     
-    assert "success" in result, "Debe contener campo 'success'"
+    _check("success" in result, "Debe contener campo 'success'")
     
     if result["success"]:
         print(f"[OK] Tipo detectado: {result.get('project_type', 'N/A')}")
@@ -113,9 +168,11 @@ async def test_analyze_project():
 
 async def test_generate_rules_validation():
     """Test: Validación de parámetros de generación (sin crear archivo)"""
-    print("\n" + "="*60)
+    from mcp_tools import generate_rules_tool
+    
+    print(f"\n{_H60}")
     print("TEST 5: generate_rules_tool (validación)")
-    print("="*60)
+    print(_H60)
     
     # Test con directorio inexistente
     result = await generate_rules_tool(
@@ -127,120 +184,299 @@ async def test_generate_rules_validation():
     print(f"  - Success: {result['success']}")
     print(f"  - Error esperado: {result.get('error', 'N/A')}")
     
-    assert result["success"] == False, "Debe fallar con ruta inexistente"
-    assert "error" in result, "Debe contener mensaje de error"
+    _check(result["success"] == False, "Debe fallar con ruta inexistente")
+    _check("error" in result, "Debe contener mensaje de error")
     
     print("[PASS] TEST PASADO\n")
 
 
+async def test_analysis_cache_invalidation():
+    """Test: Un archivo nuevo en lo profundo del árbol invalida el análisis cacheado"""
+    from mcp_tools import analyze_project_tool
+    
+    print(f"\n{_H60}")
+    print("TEST 8: Invalidación de la caché de análisis")
+    print(_H60)
+    
+    with tempfile.TemporaryDirectory() as project_dir:
+        components_dir = os.path.join(project_dir, "src", "components")
+        os.makedirs(components_dir)
+        
+        result = await analyze_project_tool(project_path=project_dir)
+        _check(not result["success"], "Un proyecto vacío no debe detectarse")
+        print("[OK] Proyecto vacío: sin tecnología detectada")
+        
+        # Solo cambia src/components: ni la raíz ni los archivos de build
+        with open(os.path.join(components_dir, "A.vue"), "w", encoding="utf-8") as f:
+            f.write("<template><div/></template>\n")
+        
+        result = await analyze_project_tool(project_path=project_dir)
+        _check(result.get("project_type") == "vue", f"Debe detectar Vue tras añadir src/components/A.vue: {result}")
+        print("[OK] Tras añadir src/components/A.vue: vue")
+    
+    with tempfile.TemporaryDirectory() as project_dir:
+        package_dir = os.path.join(project_dir, "src", "pkg", "sub")
+        os.makedirs(package_dir)
+        
+        result = await analyze_project_tool(project_path=project_dir)
+        _check(not result["success"], "Un proyecto sin archivos .py no debe detectarse")
+        
+        # Tres .py sueltos (sin requirements.txt ni pyproject.toml) bastan para detectar Python
+        for name in ("a.py", "b.py", "c.py"):
+            with open(os.path.join(package_dir, name), "w", encoding="utf-8") as f:
+                f.write("pass\n")
+        
+        result = await analyze_project_tool(project_path=project_dir)
+        _check(result.get("project_type") == "python", f"Debe detectar Python tras añadir src/pkg/sub/*.py: {result}")
+        print("[OK] Tras añadir src/pkg/sub/*.py: python")
+    
+    print("[PASS] TEST PASADO\n")
+
+
+async def test_generate_rules_cache_invalidation():
+    """Test: generate_rules_tool no reutiliza el archivo generado si cambia un archivo profundo del árbol"""
+    from mcp_tools import generate_rules_tool
+    
+    print(f"\n{_H60}")
+    print("TEST 9: Invalidación del archivo de reglas ya generado")
+    print(_H60)
+    
+    with tempfile.TemporaryDirectory() as project_dir:
+        components_dir = os.path.join(project_dir, "src", "components")
+        os.makedirs(components_dir)
+        with open(os.path.join(project_dir, ".gitlab-ci.yml"), "w", encoding="utf-8") as f:
+            f.write("stages: [test]\n")
+        
+        # Dos generaciones seguidas: la segunda ya puede salir del archivo generado (cached)
+        for _ in range(2):
+            result = await generate_rules_tool(project_path=project_dir)
+            _check(result.get("project_type") == "gitlab_ci", f"Debe detectar GitLab CI: {result}")
+        print(f"[OK] Reglas de gitlab_ci generadas (cached={bool(result.get('cached'))})")
+        
+        # Vue tiene prioridad sobre GitLab CI: las reglas deben regenerarse
+        with open(os.path.join(components_dir, "A.vue"), "w", encoding="utf-8") as f:
+            f.write("<template><div/></template>\n")
+        
+        result = await generate_rules_tool(project_path=project_dir)
+        _check(not result.get("cached"), "No debe devolver el archivo generado antes de añadir A.vue")
+        _check(result.get("project_type") == "vue", f"Debe regenerar las reglas para Vue: {result}")
+        print("[OK] Tras añadir src/components/A.vue: reglas de vue regeneradas")
+    
+    print("[PASS] TEST PASADO\n")
+
+
+def _pretty(obj):
+    """JSON indentado de un resultado, para mostrarlo por consola (orjson si está instalado)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=True)
+
+
+# Archivos que debe contener el paquete, relativos a su directorio; el orden es el de la salida del test
+REQUIRED_FILES = (
+    "__init__.py",
+    "__main__.py",
+    "server.py",
+    "mcp_tools.py",
+    "pyproject.toml",
+    "requirements.txt",
+    "README.md",
+    "core/__init__.py",
+    "core/project_analyzer.py",
+    "core/rule_generator.py",
+    "core/utils.py",
+)
+
+REQUIRED_TEMPLATES = (
+    "templates/angular.mdc",
+    "templates/gitlab_ci.mdc",
+    "templates/java_legacy_spring.mdc",
+    "templates/python.mdc",
+    "templates/spring_boot.mdc",
+    "templates/vue.mdc",
+)
+
+# Los mismos como conjunto, para obtener los que faltan con una diferencia de conjuntos
+REQUIRED_PATHS = frozenset(REQUIRED_FILES + REQUIRED_TEMPLATES)
+
+
+def _collect_tree(base_dir, subdirs=("core", "templates")):
+    """Rutas relativas ("core/utils.py") presentes en base_dir y sus subdirectorios, con un os.scandir por directorio
+    
+    Lanza OSError si base_dir no se puede listar; los subdirectorios que no existen simplemente no aportan rutas.
+    """
+    # Solo el nombre de cada entrada: no hace falta is_file()/is_dir() (ni su stat)
+    with os.scandir(base_dir) as entries:
+        present = {entry.name for entry in entries}
+    for subdir in subdirs:
+        if subdir not in present:
+            continue
+        try:
+            with os.scandir(os.path.join(base_dir, subdir)) as entries:
+                present.update(subdir + "/" + entry.name for entry in entries)
+        except OSError:
+            pass
+    return present
+
+
 async def test_structure_validation():
     """Test: Validar estructura de archivos del MCP"""
-    print("\n" + "="*60)
+    print(f"\n{_H60}")
     print("TEST 6: Validación de estructura de archivos")
-    print("="*60)
-    
-    base_dir = Path(__file__).parent
-    
-    required_files = [
-        "__init__.py",
-        "__main__.py",
-        "server.py",
-        "mcp_tools.py",
-        "pyproject.toml",
-        "requirements.txt",
-        "README.md",
-        "core/__init__.py",
-        "core/project_analyzer.py",
-        "core/rule_generator.py",
-        "core/utils.py",
-    ]
-    
-    required_templates = [
-        "templates/angular.mdc",
-        "templates/gitlab_ci.mdc",
-        "templates/java_legacy_spring.mdc",
-        "templates/python.mdc",
-        "templates/spring_boot.mdc",
-        "templates/vue.mdc",
-    ]
-    
-    all_required = required_files + required_templates
+    print(_H60)
     
-    for file_path in all_required:
-        full_path = base_dir / file_path
-        assert full_path.exists(), f"Archivo requerido no encontrado: {file_path}"
-        print(f"  [OK] {file_path}")
+    base_dir = _HERE
     
-    print(f"\n[OK] Todos los archivos requeridos ({len(all_required)}) estan presentes")
+    try:
+        present = _collect_tree(base_dir)
+    except OSError as e:
+        # Un solo fallo si falta el directorio base, en lugar de uno por archivo requerido
+        raise AssertionError(f"No se puede leer el directorio base {base_dir}: {e}")
+    
+    missing = REQUIRED_PATHS - present
+    for file_path in REQUIRED_FILES + REQUIRED_TEMPLATES:
+        if file_path not in missing:
+            print(f"  [OK] {file_path}")
+    # Todos los que faltan en un solo fallo, en el orden de las listas
+    _check(not missing, "Archivo requerido no encontrado: " + ", ".join(
+        file_path for file_path in REQUIRED_FILES + REQUIRED_TEMPLATES if file_path in missing
+    ))
+    
+    print(f"\n[OK] Todos los archivos requeridos ({len(REQUIRED_PATHS)}) estan presentes")
     print("[PASS] TEST PASADO\n")
 
 
+# Módulos que deben poder importarse y las funciones críticas que deben exponer
+REQUIRED_MODULES = [
+    ("core.project_analyzer", ("analyze_project",)),
+    ("core.rule_generator", ("generate_rules",)),
+    ("core.utils", ("save_mdc_file",)),
+    ("mcp_tools", ()),
+]
+
+
 async def test_imports():
     """Test: Validar que todos los imports funcionen"""
-    print("\n" + "="*60)
+    print(f"\n{_H60}")
     print("TEST 7: Validación de imports")
-    print("="*60)
+    print(_H60)
+    
+    # Los imports se hacen a la vez en hilos (la carga de los .pyc puede solaparse)
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(None, importlib.import_module, name) for name, _ in REQUIRED_MODULES),
+        return_exceptions=True
+    )
+    
+    for (name, _), module in zip(REQUIRED_MODULES, results):
+        if isinstance(module, BaseException):
+            print(f"\n[ERROR] Error de import: {module}")
+            raise module
+        print(f"  [OK] {name}")
     
+    # Verificar que las funciones criticas existan
+    for (name, attributes), module in zip(REQUIRED_MODULES, results):
+        for attribute in attributes:
+            _check(hasattr(module, attribute), f"{attribute} debe existir")
+    
+    print("\n[OK] Todos los imports son validos")
+    print("[PASS] TEST PASADO\n")
+
+
+# Salida del test en curso cuando los tests se ejecutan en paralelo (cada tarea de asyncio tiene
+# su propia copia del contexto, así que cada una ve su propio buffer)
+_TEST_OUTPUT = contextvars.ContextVar("test_output", default=None)
+
+
+class _TaskStdout:
+    """sys.stdout que escribe en el buffer del test de la tarea actual, o en el stdout real"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        buffer = _TEST_OUTPUT.get()
+        return (self._stream if buffer is None else buffer).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+async def _run_buffered(test_func):
+    """Ejecuta un test guardando lo que imprime; devuelve (salida, excepción o None)
+    
+    Fija el buffer en el contexto actual: hay que ejecutarla como tarea propia (gather, create_task).
+    """
+    buffer = io.StringIO()
+    _TEST_OUTPUT.set(buffer)
     try:
-        from core import project_analyzer
-        print("  [OK] core.project_analyzer")
-        
-        from core import rule_generator
-        print("  [OK] core.rule_generator")
-        
-        from core import utils
-        print("  [OK] core.utils")
-        
-        import mcp_tools
-        print("  [OK] mcp_tools")
-        
-        # Verificar que las funciones criticas existan
-        assert hasattr(project_analyzer, 'analyze_project'), "analyze_project debe existir"
-        assert hasattr(rule_generator, 'generate_rules'), "generate_rules debe existir"
-        assert hasattr(utils, 'save_mdc_file'), "save_mdc_file debe existir"
-        
-        print("\n[OK] Todos los imports son validos")
-        print("[PASS] TEST PASADO\n")
-        
-    except ImportError as e:
-        print(f"\n[ERROR] Error de import: {e}")
-        raise
+        await test_func()
+        return buffer.getvalue(), None
+    except Exception as e:
+        return buffer.getvalue(), e
 
 
 async def run_all_tests():
     """Ejecutar todos los tests"""
-    print("\n" + "="*70)
+    print(f"\n{_H70}")
     print("[TEST] INICIANDO SUITE DE TESTS DE RULEFORGE MCP")
-    print("="*70)
+    print(_H70)
     
-    tests = [
+    # Fase 1, en serie: estructura e imports (si el entorno está roto se ve antes que nada)
+    serial_tests = [
         ("Validacion de estructura", test_structure_validation),
         ("Validacion de imports", test_imports),
+    ]
+    # Fase 2, en paralelo: tests independientes entre sí; su salida se muestra al final, en orden
+    parallel_tests = [
         ("Get project path", test_get_project_path),
         ("List supported technologies", test_list_supported_technologies),
         ("Detect technology", test_detect_technology),
         ("Analyze project", test_analyze_project),
         ("Generate rules validation", test_generate_rules_validation),
+        ("Analysis cache invalidation", test_analysis_cache_invalidation),
+        ("Generate rules cache invalidation", test_generate_rules_cache_invalidation),
     ]
+    total = len(serial_tests) + len(parallel_tests)
     
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
-        try:
-            await test_func()
+    def report(test_name, error):
+        nonlocal passed, failed
+        if error is None:
             passed += 1
-        except Exception as e:
+        else:
             print(f"\n[FAIL] TEST FALLIDO: {test_name}")
-            print(f"   Error: {str(e)}")
+            print(f"   Error: {str(error)}")
             failed += 1
     
+    # Cada test imprime en su propio buffer, que se vuelca con un solo write al terminar
+    stdout = sys.stdout
+    sys.stdout = _TaskStdout(stdout)
+    try:
+        for test_name, test_func in serial_tests:
+            # En su propia tarea, que recibe una copia del contexto: el buffer no queda fijado aquí
+            output, error = await asyncio.create_task(_run_buffered(test_func))
+            stdout.write(output)
+            report(test_name, error)
+        
+        results = await asyncio.gather(*(_run_buffered(test_func) for _, test_func in parallel_tests))
+    finally:
+        sys.stdout = stdout
+    for (test_name, _), (output, error) in zip(parallel_tests, results):
+        sys.stdout.write(output)
+        report(test_name, error)
+    
     # Resumen
-    print("\n" + "="*70)
+    print(f"\n{_H70}")
     print("[RESUMEN] RESUMEN DE TESTS")
-    print("="*70)
-    print(f"[OK] Tests pasados: {passed}/{len(tests)}")
-    print(f"[FAIL] Tests fallidos: {failed}/{len(tests)}")
+    print(_H70)
+    print(f"[OK] Tests pasados: {passed}/{total}")
+    print(f"[FAIL] Tests fallidos: {failed}/{total}")
     
     if failed == 0:
         print("\n[SUCCESS] TODOS LOS TESTS PASARON CORRECTAMENTE!")
@@ -248,7 +484,7 @@ async def run_all_tests():
     else:
         print("\n[WARNING] Algunos tests fallaron. Revisa los errores arriba.")
     
-    print("="*70 + "\n")
+    print(f"{_H70}\n")
     
     return failed == 0
 
@@ -256,8 +492,14 @@ async def run_all_tests():
 if __name__ == "__main__":
     print("\n[TEST] RuleForge MCP - Suite de Tests de Validacion\n")
     
-    # Ejecutar tests
-    success = asyncio.run(run_all_tests())
+    # Ejecutar tests, con el bucle de eventos de uvloop (libuv) si está instalado; no existe en
+    # Windows. Solo al ejecutar el script: importar el módulo (pytest) no cambia el bucle
+    try:
+        import uvloop
+    except ImportError:
+        success = asyncio.run(run_all_tests())
+    else:
+        success = uvloop.run(run_all_tests())
     
     # Exit code
     sys.exit(0 if success else 1)